@@ -4,10 +4,112 @@ Deployment script for ElectroSim Web Version
 This script sets up everything needed to run ElectroSim in the browser.
 """
 
+import errno
+import os
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+COPY_WORKERS = 8
+
+
+# None until the first copy tells us whether the kernel copy path works here
+_copy_file_range_ok = None if hasattr(os, "copy_file_range") else False
+_COPY_FILE_RANGE_FALLBACK_ERRNOS = {errno.EXDEV, errno.EINVAL, errno.ENOSYS, errno.EOPNOTSUPP, errno.EBADF}
+
+
+def _copy_file_range(src, dst):
+    """Copy contents with os.copy_file_range (in-kernel, reflink on CoW filesystems)."""
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        remaining = os.fstat(fsrc.fileno()).st_size
+        while remaining > 0:
+            n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+            if n == 0:
+                break
+            remaining -= n
+
+
+def _copy_file(src, dst):
+    """Copy file contents and metadata (mtime is what the up-to-date check compares)."""
+    global _copy_file_range_ok
+    if _copy_file_range_ok is not False:
+        try:
+            _copy_file_range(src, dst)
+            _copy_file_range_ok = True
+        except OSError as exc:
+            if exc.errno not in _COPY_FILE_RANGE_FALLBACK_ERRNOS:
+                raise
+            # Unsupported across these filesystems; use the regular path from now on
+            _copy_file_range_ok = False
+            shutil.copyfile(src, dst, follow_symlinks=False)
+    else:
+        shutil.copyfile(src, dst, follow_symlinks=False)
+    shutil.copystat(src, dst, follow_symlinks=False)
+
+
+def _is_up_to_date(entry, dst):
+    """Return True when `dst` has the same size and mtime as the source `DirEntry`."""
+    try:
+        dst_stat = os.stat(dst, follow_symlinks=False)
+    except FileNotFoundError:
+        return False
+    src_stat = entry.stat(follow_symlinks=False)
+    return (src_stat.st_size == dst_stat.st_size
+            and src_stat.st_mtime_ns == dst_stat.st_mtime_ns)
+
+
+def _remove_path(path):
+    if path.is_dir() and not path.is_symlink():
+        shutil.rmtree(path)
+    else:
+        path.unlink()
+
+
+def sync_tree(src, dst):
+    """Mirror directory `src` into `dst`, copying only files that changed.
+
+    Directories are created on the calling thread in walk order, while file
+    copies run on a thread pool since they are I/O bound. Files whose size and
+    mtime already match are skipped, and entries missing from `src` are removed
+    from `dst`. Returns the number of files copied.
+    """
+    copied = 0
+    with ThreadPoolExecutor(max_workers=COPY_WORKERS) as pool:
+        futures = []
+        stack = [(Path(src), Path(dst))]
+        while stack:
+            src_dir, dst_dir = stack.pop()
+            dst_dir.mkdir(parents=True, exist_ok=True)
+            seen = set()
+            with os.scandir(src_dir) as entries:
+                for entry in entries:
+                    seen.add(entry.name)
+                    target = dst_dir / entry.name
+                    if entry.is_symlink():
+                        if target.is_symlink() and os.readlink(target) == os.readlink(entry.path):
+                            continue
+                        if target.exists() or target.is_symlink():
+                            _remove_path(target)
+                        os.symlink(os.readlink(entry.path), target)
+                    elif entry.is_dir():
+                        if target.exists() and not target.is_dir():
+                            _remove_path(target)
+                        stack.append((Path(entry.path), target))
+                    elif not _is_up_to_date(entry, target):
+                        if target.is_dir() and not target.is_symlink():
+                            shutil.rmtree(target)
+                        futures.append(pool.submit(_copy_file, entry.path, target))
+            # Drop anything that no longer exists in the source
+            for stale in dst_dir.iterdir():
+                if stale.name not in seen:
+                    _remove_path(stale)
+        for future in futures:
+            future.result()
+            copied += 1
+    return copied
+
+
 def main():
     """Deploy ElectroSim to web."""
     
@@ -22,12 +124,9 @@ def main():
     if not electrosim_src.exists():
         return False
     
-    # Copy electrosim package to web directory
+    # Mirror electrosim package into web directory (unchanged files are skipped)
     electrosim_web = web_dir / "electrosim"
-    if electrosim_web.exists():
-        shutil.rmtree(electrosim_web)
-    
-    shutil.copytree(electrosim_src, electrosim_web)
+    sync_tree(electrosim_src, electrosim_web)
     
     # Check if web files exist
     required_files = [
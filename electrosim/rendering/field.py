@@ -1,18 +1,23 @@
 from __future__ import annotations
 
-from typing import Iterable
+from typing import Iterable, Optional
 
 import numpy as np
 import pygame
 
 from electrosim import config
-from electrosim.simulation.engine import Particle
+from electrosim.simulation.engine import Particle, ParticleSoA
 from electrosim.simulation.physics import electric_field_at_point
 from electrosim.rendering.field_sampler import ElectricFieldSampler
+from electrosim.rendering import field_kernels as _kernels
 from electrosim.rendering.primitives import _draw_arrow
  
 
 _SAMPLER_CACHE: dict[tuple[int, int, int, int, int], ElectricFieldSampler] = {}
+# Grid-cell centers in pixels, keyed by (width_px, height_px, grid_step_px)
+_CENTERS_CACHE: dict[tuple[int, int, int], np.ndarray] = {}
+# Pre-rendered arrow sprites for the uniform-field override, keyed by color and geometry
+_UNIFORM_ARROW_CACHE: dict[tuple, tuple[pygame.Surface, int, int]] = {}
 
 
 def _get_sampler(world_size_m: np.ndarray, ppm: float, grid_step_px: int, softening_fraction: float) -> ElectricFieldSampler:
@@ -48,13 +53,101 @@ def _get_sampler(world_size_m: np.ndarray, ppm: float, grid_step_px: int, soften
 	return sampler
 
 
-def draw_field_grid(screen: pygame.Surface, particles: Iterable[Particle], world_size_m: np.ndarray, pixels_per_meter: float, grid_step_px: int, softening_fraction: float) -> None:
-	"""Draw electric field arrows on a pixel grid using selected visualization mode."""
+def _get_centers_px(width_px: int, height_px: int, grid_step_px: int) -> np.ndarray:
+	"""Return cached `(M, 2)` int32 `(x, y)` grid-cell centers, row by row."""
+	key = (int(width_px), int(height_px), int(grid_step_px))
+	centers = _CENTERS_CACHE.get(key)
+	if centers is None:
+		half = grid_step_px // 2
+		ys, xs = np.mgrid[half:height_px:grid_step_px, half:width_px:grid_step_px]
+		centers = np.column_stack((xs.ravel(), ys.ravel())).astype(np.int32)
+		centers.setflags(write=False)
+		_CENTERS_CACHE[key] = centers
+	return centers
+
+
+def _uniform_arrow_sprite(color: tuple[int, int, int], vec_px: tuple[float, float], max_length_px: float) -> tuple[pygame.Surface, int, int]:
+	"""Return a cached `(sprite, ox, oy)`: the arrow rendered once, starting at sprite pixel `(ox, oy)`."""
+	key = (tuple(color), round(float(vec_px[0]), 3), round(float(vec_px[1]), 3), float(max_length_px))
+	cached = _UNIFORM_ARROW_CACHE.get(key)
+	if cached is None:
+		# Room for the clamped shaft plus the arrow head and line width on every side
+		length = min(float(np.hypot(vec_px[0], vec_px[1])), float(max_length_px))
+		half = int(np.ceil(length)) + 12
+		canvas = pygame.Surface((2 * half + 1, 2 * half + 1))
+		# Opaque arrow over a color key: plain RLE copies, no per-pixel alpha blending
+		key_rgb = (0, 0, 0) if tuple(color) != (0, 0, 0) else (255, 0, 255)
+		canvas.fill(key_rgb)
+		_draw_arrow(canvas, color, (half, half), vec_px, max_length_px)
+		canvas.set_colorkey(key_rgb, pygame.RLEACCEL)
+		# Crop to the drawn pixels so each blit touches as little as possible
+		bounds = canvas.get_bounding_rect()
+		sprite = canvas.subsurface(bounds).copy()
+		sprite.set_colorkey(key_rgb, pygame.RLEACCEL)
+		cached = (sprite, half - bounds.x, half - bounds.y)
+		_UNIFORM_ARROW_CACHE[key] = cached
+	return cached
+
+
+def _blit_uniform_arrows(
+	screen: pygame.Surface,
+	color: tuple[int, int, int],
+	vec_px: tuple[float, float],
+	max_length_px: float,
+	width_px: int,
+	height_px: int,
+	grid_step_px: int,
+) -> None:
+	"""Stamp the same arrow at every grid center with a single batched blit."""
+	sprite, ox, oy = _uniform_arrow_sprite(color, vec_px, max_length_px)
+	dests = _get_centers_px(width_px, height_px, grid_step_px) - np.array([ox, oy], dtype=np.int32)
+	screen.blits([(sprite, dest) for dest in dests.tolist()], doreturn=False)
+
+
+def _brightness_rgba(t: np.ndarray, pix_strength: np.ndarray, alpha: np.ndarray) -> np.ndarray:
+	"""Return `(M, 4)` int RGBA colors for brightness-mode arrows.
+
+	The base field color is dimmed by `t`, then mixed toward white as the
+	strength approaches `4.5 * FIELD_VECTOR_MAX_LENGTH_PX`.
+	"""
+	dimmed = np.rint(np.asarray(config.COLOR_FIELD_VECTOR, dtype=np.float64)[None, :] * t[:, None])
+	wm = np.clip(pix_strength / float(config.FIELD_VECTOR_MAX_LENGTH_PX * 4.5), 0.0, 1.0)[:, None]
+	rgb = np.clip(np.rint(dimmed * (1.0 - wm) + 255.0 * wm), 0, 255).astype(np.int64)
+	return np.column_stack((rgb, alpha))
+
+
+def _recompute_sampler(sampler: ElectricFieldSampler, particles: Iterable[Particle], soa: Optional[ParticleSoA]) -> None:
+	"""Refresh `sampler` from float32 views of the SoA arrays (cast only under f64), or by packing `particles` when no `soa` is given."""
+	if soa is None:
+		sampler.recompute(particles)
+		return
+	sampler.recompute(
+		positions=soa.pos.astype(np.float32, copy=False),
+		charges=soa.charge.astype(np.float32, copy=False),
+		radii=soa.radius.astype(np.float32, copy=False),
+	)
+
+
+def draw_field_grid(
+	screen: pygame.Surface,
+	particles: Iterable[Particle],
+	world_size_m: np.ndarray,
+	pixels_per_meter: float,
+	grid_step_px: int,
+	softening_fraction: float,
+	soa: Optional[ParticleSoA] = None,
+) -> None:
+	"""Draw electric field arrows on a pixel grid using selected visualization mode.
+
+	With `soa` given, the sampler reads its arrays as float32 (cast under f64,
+	used as-is under f32) instead of packing the `particles` views one
+	attribute at a time.
+	"""
 	width_px = int(round(world_size_m[0] * pixels_per_meter))
 	height_px = int(round(world_size_m[1] * pixels_per_meter))
 
 	# Validation override: draw only the uniform field (constant vector), ignore particles
-	if getattr(config, "UNIFORM_FIELD_VISUAL_OVERRIDE", False):
+	if config.UNIFORM_FIELD_VISUAL_OVERRIDE:
 		Ex = float(config.UNIFORM_FIELD_VECTOR_NC[0])
 		Ey = float(config.UNIFORM_FIELD_VECTOR_NC[1])
 		mag = float(np.hypot(Ex, Ey))
@@ -87,9 +180,7 @@ def draw_field_grid(screen: pygame.Surface, particles: Iterable[Particle], world
 			r = max(0, min(255, r))
 			g = max(0, min(255, g))
 			b = max(0, min(255, b))
-			for y in range(grid_step_px // 2, height_px, grid_step_px):
-				for x in range(grid_step_px // 2, width_px, grid_step_px):
-					_draw_arrow(screen, (r, g, b), (x, y), vec_px, 1e9)
+			_blit_uniform_arrows(screen, (r, g, b), vec_px, 1e9, width_px, height_px, grid_step_px)
 			return
 		else:
 			# Length mode: arrow length proportional to |E|
@@ -101,80 +192,78 @@ def draw_field_grid(screen: pygame.Surface, particles: Iterable[Particle], world
 				uy = Ey / mag
 				vec_px_base = (ux * 8.0, uy * 8.0)
 			max_length_px = config.FIELD_VECTOR_MAX_LENGTH_PX * 0.6
-			for y in range(grid_step_px // 2, height_px, grid_step_px):
-				for x in range(grid_step_px // 2, width_px, grid_step_px):
-					_draw_arrow(screen, config.COLOR_FIELD_VECTOR, (x, y), vec_px_base, max_length_px)
+			_blit_uniform_arrows(screen, config.COLOR_FIELD_VECTOR, vec_px_base, max_length_px, width_px, height_px, grid_step_px)
 			return
 
 	if config.FIELD_VIS_MODE == "brightness":
 		# Use cached sampler results and draw tinted fixed length arrows with alpha
 		sam = _get_sampler(world_size_m, pixels_per_meter, grid_step_px, softening_fraction)
-		sam.recompute(particles)
-		pairs = sam.iter_centers_and_vectors_px()
+		_recompute_sampler(sam, particles, soa)
+		centers, vectors = sam.arrays_px()
 		field_surface = pygame.Surface((width_px, height_px), pygame.SRCALPHA)
-		base_r, base_g, base_b = config.COLOR_FIELD_VECTOR
-		for (x, y), (Ex, Ey) in pairs:
-			mag = float(np.hypot(Ex, Ey))
-			if mag <= 1e-9:
-				continue
-			pix_strength = config.FIELD_VECTOR_SCALE * mag
-			t = min(1.0, max(0.0, float(config.FIELD_BRIGHTNESS_SCALE * (pix_strength / float(config.FIELD_VECTOR_MAX_LENGTH_PX)))))
-			alpha = int(round(255.0 * t))
-			if alpha < int(config.FIELD_ALPHA_MIN_DRAW):
-				continue
-			dir_x = Ex / mag
-			dir_y = Ey / mag
-			vec_px = (
-				dir_x * float(config.FIELD_FIXED_ARROW_LENGTH_PX),
-				dir_y * float(config.FIELD_FIXED_ARROW_LENGTH_PX),
+		# Colors, directions and the draw mask for every cell at once; only the arrows are drawn per cell
+		if _kernels.KERNELS_AVAILABLE:
+			keep, rgba, vec_px = _kernels.brightness_arrows(
+				vectors,
+				np.asarray(config.COLOR_FIELD_VECTOR, dtype=np.float64),
+				float(config.FIELD_VECTOR_SCALE),
+				float(config.FIELD_BRIGHTNESS_SCALE),
+				float(config.FIELD_VECTOR_MAX_LENGTH_PX),
+				float(config.FIELD_FIXED_ARROW_LENGTH_PX),
+				int(config.FIELD_ALPHA_MIN_DRAW),
 			)
-			green_r = int(round(base_r * t))
-			green_g = int(round(base_g * t))
-			green_b = int(round(base_b * t))
-			strength_raw = min(1.0, max(0.0, float(pix_strength / float(config.FIELD_VECTOR_MAX_LENGTH_PX*4.5))))
-			wm = strength_raw
-			white_r = 255
-			white_g = 255
-			white_b = 255
-			r = int(round(green_r * (1.0 - wm) + white_r * wm))
-			g = int(round(green_g * (1.0 - wm) + white_g * wm))
-			b = int(round(green_b * (1.0 - wm) + white_b * wm))
-			r = max(0, min(255, r))
-			g = max(0, min(255, g))
-			b = max(0, min(255, b))
-			rgba = (r, g, b, alpha)
-			_draw_arrow(field_surface, rgba, (x, y), vec_px, 1e9)
+		else:
+			E = vectors.astype(np.float64)
+			mag = np.hypot(E[:, 0], E[:, 1])
+			pix_strength = config.FIELD_VECTOR_SCALE * mag
+			t = np.clip(config.FIELD_BRIGHTNESS_SCALE * pix_strength / float(config.FIELD_VECTOR_MAX_LENGTH_PX), 0.0, 1.0)
+			alpha = np.rint(255.0 * t).astype(np.int64)
+			keep = (mag > 1e-9) & (alpha >= int(config.FIELD_ALPHA_MIN_DRAW))
+			rgba = _brightness_rgba(t[keep], pix_strength[keep], alpha[keep])
+			vec_px = E[keep] * (float(config.FIELD_FIXED_ARROW_LENGTH_PX) / mag[keep])[:, None]
+		for start, color, vec in zip(centers[keep].tolist(), rgba.tolist(), vec_px.tolist()):
+			_draw_arrow(field_surface, color, start, vec, 1e9)
 		screen.blit(field_surface, (0, 0))
 		return
 
 	if config.FIELD_SAMPLER_ENABLED:
 		sampler = _get_sampler(world_size_m, pixels_per_meter, grid_step_px, softening_fraction)
-		sampler.recompute(particles)
-		pairs = sampler.iter_centers_and_vectors_px()
-		for (x, y), (Ex, Ey) in pairs:
-			mag = float(np.hypot(Ex, Ey))
-			if mag <= 1e-9:
-				continue
-			vec_px = (Ex * config.FIELD_VECTOR_SCALE, Ey * config.FIELD_VECTOR_SCALE)
-			if config.FIELD_VIS_MODE == "brightness":
-				max_length_px = config.FIELD_VECTOR_MAX_LENGTH_PX
-			else:
-				max_length_px = config.FIELD_VECTOR_MAX_LENGTH_PX * 0.6
-			_draw_arrow(screen, config.COLOR_FIELD_VECTOR, (x, y), vec_px, max_length_px)
+		_recompute_sampler(sampler, particles, soa)
+		centers, vectors = sampler.arrays_px()
+		# Drop empty cells and scale to pixels in one pass; only arrow drawing stays per cell
+		mag = np.hypot(vectors[:, 0], vectors[:, 1])
+		keep = mag > 1e-9
+		vecs_px = vectors[keep] * config.FIELD_VECTOR_SCALE
+		if config.FIELD_VIS_MODE == "brightness":
+			max_length_px = config.FIELD_VECTOR_MAX_LENGTH_PX
+		else:
+			max_length_px = config.FIELD_VECTOR_MAX_LENGTH_PX * 0.6
+		for start, vec_px in zip(centers[keep].tolist(), vecs_px.tolist()):
+			_draw_arrow(screen, config.COLOR_FIELD_VECTOR, start, vec_px, max_length_px)
 		return
 
-	for y in range(grid_step_px // 2, height_px, grid_step_px):
-		for x in range(grid_step_px // 2, width_px, grid_step_px):
-			point_m = np.array([x / pixels_per_meter, y / pixels_per_meter], dtype=float)
-			E = electric_field_at_point(point_m, list(particles), world_size_m, softening_fraction)
-			mag = float(np.hypot(E[0], E[1]))
-			if mag <= 1e-9:
-				continue
-			vec_px = (E[0] * config.FIELD_VECTOR_SCALE, E[1] * config.FIELD_VECTOR_SCALE)
-			if config.FIELD_VIS_MODE == "brightness":
-				max_length_px = config.FIELD_VECTOR_MAX_LENGTH_PX
-			else:
-				max_length_px = config.FIELD_VECTOR_MAX_LENGTH_PX * 0.6
-			_draw_arrow(screen, config.COLOR_FIELD_VECTOR, (x, y), vec_px, max_length_px)
+	if soa is not None:
+		pos, charge, radius = soa.pos, soa.charge, soa.radius
+	else:
+		# Pack the particle views once instead of per grid point
+		packed = np.array(
+			[(p.pos_m[0], p.pos_m[1], p.charge_c, p.radius_m) for p in particles],
+			dtype=float,
+		).reshape(-1, 4)
+		pos = np.ascontiguousarray(packed[:, 0:2])
+		charge = np.ascontiguousarray(packed[:, 2])
+		radius = np.ascontiguousarray(packed[:, 3])
+	for x, y in _get_centers_px(width_px, height_px, grid_step_px).tolist():
+		point_m = np.array([x / pixels_per_meter, y / pixels_per_meter], dtype=float)
+		E = electric_field_at_point(point_m, pos, charge, radius, world_size_m, softening_fraction)
+		mag = float(np.hypot(E[0], E[1]))
+		if mag <= 1e-9:
+			continue
+		vec_px = (E[0] * config.FIELD_VECTOR_SCALE, E[1] * config.FIELD_VECTOR_SCALE)
+		if config.FIELD_VIS_MODE == "brightness":
+			max_length_px = config.FIELD_VECTOR_MAX_LENGTH_PX
+		else:
+			max_length_px = config.FIELD_VECTOR_MAX_LENGTH_PX * 0.6
+		_draw_arrow(screen, config.COLOR_FIELD_VECTOR, (x, y), vec_px, max_length_px)
 
 
@@ -1,18 +1,56 @@
 from __future__ import annotations
 
-from typing import Iterable, Optional
+from typing import Iterable, List, Optional, Tuple
 
 import numpy as np
 import pygame
 
 from electrosim import config
-from electrosim.simulation.engine import Particle
-from electrosim.rendering.primitives import world_vector_to_screen, _draw_arrow, draw_glow_at_screen_pos
+from electrosim.simulation.engine import Particle, ParticleSoA
+from electrosim.rendering.primitives import world_vector_to_screen, project_positions, glow_sprite
+
+# Pre-drawn particle bodies keyed by (radius px, fill color, border color or None)
+_CIRCLE_CACHE: dict[tuple, pygame.Surface] = {}
  
 
-def draw_particles(screen: pygame.Surface, particles: Iterable[Particle], pixels_per_meter: float, selected_index: Optional[int]) -> None:
+def _particle_sprite(r_px: int, color_rgb: Tuple[int, int, int], border_color: Optional[Tuple[int, int, int]]) -> pygame.Surface:
+	"""Return a colorkeyed sprite of a filled circle (plus 2 px border) centered at `(r_px + 1, r_px + 1)`."""
+	key = (r_px, color_rgb, border_color)
+	sprite = _CIRCLE_CACHE.get(key)
+	if sprite is None:
+		size = 2 * r_px + 2
+		sprite = pygame.Surface((size, size))
+		colorkey = next(c for c in ((255, 0, 255), (0, 255, 0), (0, 0, 255)) if c != color_rgb and c != border_color)
+		sprite.fill(colorkey)
+		pygame.draw.circle(sprite, color_rgb, (r_px + 1, r_px + 1), r_px)
+		if border_color is not None:
+			pygame.draw.circle(sprite, border_color, (r_px + 1, r_px + 1), r_px, 2)
+		sprite.set_colorkey(colorkey, pygame.RLEACCEL)
+		_CIRCLE_CACHE[key] = sprite
+	return sprite
+
+
+def _screen_centers(particles: Iterable[Particle], pixels_per_meter: float, screen_xy: Optional[np.ndarray]) -> List[Tuple[int, int]]:
+	"""Per-particle screen centers, taken from a precomputed projection when one is given."""
+	if screen_xy is not None:
+		return list(map(tuple, screen_xy.tolist()))
+	return [world_vector_to_screen(p.pos_m, pixels_per_meter) for p in particles]
+
+
+def draw_particles(
+	screen: pygame.Surface,
+	particles: Iterable[Particle],
+	pixels_per_meter: float,
+	selected_index: Optional[int],
+	screen_xy: Optional[np.ndarray] = None,
+	soa: Optional[ParticleSoA] = None,
+) -> None:
 	"""Draw particles as filled circles with optional borders for fixed/selected.
 
+	Particle data can come either from `Particle` views or, when `soa` is given,
+	straight from the `ParticleSoA` arrays (then `particles` is ignored and the
+	pixel radii are computed for all particles in one NumPy pass).
+
 	Parameters
 	----------
 	screen : pygame.Surface
@@ -23,21 +61,34 @@ def draw_particles(screen: pygame.Surface, particles: Iterable[Particle], pixels
 		Scaling from meters to pixels.
 	selected_index : int | None
 		Index of selected particle in list order, if any.
+	screen_xy : numpy.ndarray shape (N, 2), optional
+		Positions already projected with `project_positions`.
+	soa : ParticleSoA, optional
+		Particle storage to read instead of `particles`.
 	"""
-	for idx, p in enumerate(particles):
-		center = world_vector_to_screen(p.pos_m, pixels_per_meter)
-		r_px = max(2, int(round(p.radius_m * pixels_per_meter)))
-		pygame.draw.circle(screen, p.color_rgb, center, r_px)
-		border_color = None
-		if p.fixed:
-			border_color = config.COLOR_FIXED_BORDER
+	if soa is not None:
+		centers = screen_xy if screen_xy is not None else project_positions(soa.pos, pixels_per_meter)
+		radii = np.maximum(2, np.rint(soa.radius.astype(np.float64) * pixels_per_meter).astype(np.int64))
+		rows = zip(centers.tolist(), radii.tolist(), soa.colors, soa.fixed.tolist())
+	else:
+		particles = list(particles)
+		rows = (
+			(center, max(2, int(round(p.radius_m * pixels_per_meter))), p.color_rgb, p.fixed)
+			for p, center in zip(particles, _screen_centers(particles, pixels_per_meter, screen_xy))
+		)
+	blit_seq = []
+	for idx, ((cx, cy), r_px, color, fixed) in enumerate(rows):
 		if selected_index is not None and idx == selected_index:
 			border_color = config.COLOR_SELECTED_BORDER
-		if border_color is not None:
-			pygame.draw.circle(screen, border_color, center, r_px, 2)
+		elif fixed:
+			border_color = config.COLOR_FIXED_BORDER
+		else:
+			border_color = None
+		blit_seq.append((_particle_sprite(r_px, color, border_color), (cx - r_px - 1, cy - r_px - 1)))
+	screen.blits(blit_seq, doreturn=False)
 
 
-def draw_velocity_vectors(screen: pygame.Surface, particles: Iterable[Particle], pixels_per_meter: float) -> None:
+def draw_velocity_vectors(screen: pygame.Surface, particles: Iterable[Particle], pixels_per_meter: float, screen_xy: Optional[np.ndarray] = None) -> None:
 	"""Draw velocity arrows scaled by a constant factor.
 
 	Parameters
@@ -48,14 +99,16 @@ def draw_velocity_vectors(screen: pygame.Surface, particles: Iterable[Particle],
 		Particles to draw velocity for.
 	pixels_per_meter : float
 		Scaling from meters to pixels.
+	screen_xy : numpy.ndarray shape (N, 2), optional
+		Positions already projected with `project_positions`.
 	"""
-	for p in particles:
-		start = world_vector_to_screen(p.pos_m, pixels_per_meter)
-		vec = (p.vel_mps[0] * config.VELOCITY_VECTOR_SCALE, p.vel_mps[1] * config.VELOCITY_VECTOR_SCALE)
-		_draw_arrow(screen, config.COLOR_VELOCITY_VECTOR, start, vec, config.VECTOR_MAX_LENGTH_PX)
+	particles = list(particles)
+	starts = np.array(_screen_centers(particles, pixels_per_meter, screen_xy), dtype=np.int64).reshape(-1, 2)
+	vel = np.array([p.vel_mps for p in particles], dtype=float).reshape(-1, 2)
+	_draw_arrows(screen, config.COLOR_VELOCITY_VECTOR, starts, vel * config.VELOCITY_VECTOR_SCALE)
 
 
-def draw_force_vectors(screen: pygame.Surface, particles: Iterable[Particle], forces_array: Optional[np.ndarray], pixels_per_meter: float) -> None:
+def draw_force_vectors(screen: pygame.Surface, particles: Iterable[Particle], forces_array: Optional[np.ndarray], pixels_per_meter: float, screen_xy: Optional[np.ndarray] = None) -> None:
 	"""Draw force arrows per particle using precomputed forces if available.
 
 	Parameters
@@ -68,19 +121,29 @@ def draw_force_vectors(screen: pygame.Surface, particles: Iterable[Particle], fo
 		Per-particle forces (N) shaped (N,2). If None, nothing is drawn.
 	pixels_per_meter : float
 		Scaling from meters to pixels.
+	screen_xy : numpy.ndarray shape (N, 2), optional
+		Positions already projected with `project_positions`.
 	"""
 	if forces_array is None:
 		return
-	for i, p in enumerate(particles):
-		start = world_vector_to_screen(p.pos_m, pixels_per_meter)
-		f = forces_array[i] if i < len(forces_array) else np.zeros(2)
-		vec = (f[0] * config.FORCE_VECTOR_SCALE, f[1] * config.FORCE_VECTOR_SCALE)
-		_draw_arrow(screen, config.COLOR_FORCE_VECTOR, start, vec, config.VECTOR_MAX_LENGTH_PX)
+	particles = list(particles)
+	starts = np.array(_screen_centers(particles, pixels_per_meter, screen_xy), dtype=np.int64).reshape(-1, 2)
+	_draw_arrows(screen, config.COLOR_FORCE_VECTOR, starts, _padded_forces(forces_array, len(particles)) * config.FORCE_VECTOR_SCALE)
 
 
-def draw_particle_glows(screen: pygame.Surface, particles: Iterable[Particle], pixels_per_meter: float) -> None:
+def draw_particle_glows(
+	screen: pygame.Surface,
+	particles: Iterable[Particle],
+	pixels_per_meter: float,
+	screen_xy: Optional[np.ndarray] = None,
+	soa: Optional[ParticleSoA] = None,
+) -> None:
 	"""Draw glows for all non-neutral particles.
 
+	With `soa` given, `particles` is ignored: the neutral filter, intensities and
+	pixel radii are computed for all particles with NumPy, and only the charged
+	ones are visited to look up their glow sprites.
+
 	Parameters
 	----------
 	screen : pygame.Surface
@@ -89,14 +152,130 @@ def draw_particle_glows(screen: pygame.Surface, particles: Iterable[Particle], p
 		Particles to draw glow for.
 	pixels_per_meter : float
 		Scaling from meters to pixels.
+	screen_xy : numpy.ndarray shape (N, 2), optional
+		Positions already projected with `project_positions`.
+	soa : ParticleSoA, optional
+		Particle storage to read instead of `particles`.
 	"""
-	for p in particles:
-		if abs(p.charge_c) <= config.NEUTRAL_CHARGE_EPS:
-			continue
-		center = world_vector_to_screen(p.pos_m, pixels_per_meter)
-		base_radius_px = max(2, int(round(p.radius_m * pixels_per_meter)))
-		t = min(1.0, max(0.0, float(abs(p.charge_c) / config.MAX_CHARGE_C)))
-		color_rgb = p.color_rgb
-		draw_glow_at_screen_pos(screen, center, base_radius_px, color_rgb, t)
+	if not config.GLOW_ENABLED:
+		return
+	if soa is not None:
+		q_abs = np.abs(soa.charge.astype(np.float64))
+		t_all = np.clip(q_abs / config.MAX_CHARGE_C, 0.0, 1.0)
+		idx = np.flatnonzero((q_abs > config.NEUTRAL_CHARGE_EPS) & (t_all > 0.0))
+		if idx.size == 0:
+			return
+		centers = screen_xy if screen_xy is not None else project_positions(soa.pos, pixels_per_meter)
+		radii = np.maximum(2, np.rint(soa.radius[idx].astype(np.float64) * pixels_per_meter).astype(np.int64))
+		colors = soa.colors
+		rows = zip(centers[idx].tolist(), radii.tolist(), [colors[i] for i in idx.tolist()], t_all[idx].tolist())
+	else:
+		particles = list(particles)
+		rows = []
+		for p, center in zip(particles, _screen_centers(particles, pixels_per_meter, screen_xy)):
+			if abs(p.charge_c) <= config.NEUTRAL_CHARGE_EPS:
+				continue
+			t = min(1.0, max(0.0, float(abs(p.charge_c) / config.MAX_CHARGE_C)))
+			if t <= 0.0:
+				continue
+			rows.append((center, max(2, int(round(p.radius_m * pixels_per_meter))), p.color_rgb, t))
+	# Every glow is additive, so the whole layer goes to the screen in one `blits` call
+	blit_seq = []
+	for (cx, cy), base_radius_px, color_rgb, t in rows:
+		glow_surface, offset = glow_sprite(base_radius_px, color_rgb, t)
+		blit_seq.append((glow_surface, (cx - offset, cy - offset), None, pygame.BLEND_ADD))
+	if blit_seq:
+		screen.blits(blit_seq, doreturn=False)
+
+
+def _arrow_segments(start_px: np.ndarray, vec_px: np.ndarray, max_len_px: float) -> List[Tuple[tuple, tuple, tuple, tuple]]:
+	"""Vectorized `_draw_arrow` geometry: `(start, end, head1, head2)` per non-degenerate arrow."""
+	vx = vec_px[:, 0]
+	vy = vec_px[:, 1]
+	length = np.hypot(vx, vy)
+	keep = length > 1e-6
+	if not keep.any():
+		return []
+	factor = np.minimum(1.0, max_len_px / length[keep])
+	vx = vx[keep] * factor
+	vy = vy[keep] * factor
+	x0 = start_px[keep, 0]
+	y0 = start_px[keep, 1]
+	ex = (x0 + vx).astype(np.int64)
+	ey = (y0 + vy).astype(np.int64)
+	angle = np.arctan2(vy, vx)
+	head_len = 8
+	head_ang = np.radians(25)
+	h1x = (ex - head_len * np.cos(angle - head_ang)).astype(np.int64)
+	h1y = (ey - head_len * np.sin(angle - head_ang)).astype(np.int64)
+	h2x = (ex - head_len * np.cos(angle + head_ang)).astype(np.int64)
+	h2y = (ey - head_len * np.sin(angle + head_ang)).astype(np.int64)
+	return [
+		((a, b), (c, d), (e, f), (g, h))
+		for a, b, c, d, e, f, g, h in zip(
+			x0.tolist(), y0.tolist(), ex.tolist(), ey.tolist(), h1x.tolist(), h1y.tolist(), h2x.tolist(), h2y.tolist()
+		)
+	]
+
 
+def _draw_arrows(screen: pygame.Surface, color: Tuple[int, int, int], starts_px: np.ndarray, vec_px: np.ndarray) -> None:
+	"""Draw one clamped arrow per row; geometry is batched, only the draw calls run per arrow."""
+	line = pygame.draw.line
+	polygon = pygame.draw.polygon
+	for start, end, p1, p2 in _arrow_segments(starts_px, vec_px, config.VECTOR_MAX_LENGTH_PX):
+		line(screen, color, start, end, 2)
+		polygon(screen, color, [end, p1, p2])
 
+
+def _padded_forces(forces_array: np.ndarray, n: int) -> np.ndarray:
+	"""Return `forces_array` as an (n, 2) float array, zero-filled past its length."""
+	f = np.zeros((n, 2))
+	m = min(n, len(forces_array))
+	f[:m] = forces_array[:m]
+	return f
+
+
+def draw_particle_layers(
+	screen: pygame.Surface,
+	soa: ParticleSoA,
+	forces_array: Optional[np.ndarray],
+	pixels_per_meter: float,
+	selected_index: Optional[int],
+	show_velocities: bool,
+	show_forces: bool,
+	screen_xy: Optional[np.ndarray] = None,
+) -> None:
+	"""Draw particle bodies and their velocity/force arrows from the SoA arrays.
+
+	Equivalent to `draw_particles` followed by `draw_velocity_vectors` and
+	`draw_force_vectors`, but screen centers, radii and arrow geometry are
+	computed once for all particles with NumPy instead of per `Particle` view, and
+	the bodies are cached sprites submitted in one `blits` call. Layers are still
+	drawn in the same order (bodies, then velocities, then forces).
+
+	Parameters
+	----------
+	screen : pygame.Surface
+		Target surface.
+	soa : ParticleSoA
+		Particle storage, usually `Simulation.soa`.
+	forces_array : numpy.ndarray | None
+		Per-particle forces (N) shaped (N,2), or None to skip force arrows.
+	pixels_per_meter : float
+		Scaling from meters to pixels.
+	selected_index : int | None
+		Index of the selected particle, if any.
+	show_velocities, show_forces : bool
+		Whether to draw the velocity and force arrow layers.
+	screen_xy : numpy.ndarray shape (N, 2), optional
+		Positions already projected with `project_positions`.
+	"""
+	n = soa.n
+	if n == 0:
+		return
+	centers = screen_xy if screen_xy is not None else project_positions(soa.pos, pixels_per_meter)
+	draw_particles(screen, (), pixels_per_meter, selected_index, centers, soa=soa)
+	if show_velocities:
+		_draw_arrows(screen, config.COLOR_VELOCITY_VECTOR, centers, soa.vel * config.VELOCITY_VECTOR_SCALE)
+	if show_forces and forces_array is not None:
+		_draw_arrows(screen, config.COLOR_FORCE_VECTOR, centers, _padded_forces(forces_array, n) * config.FORCE_VECTOR_SCALE)
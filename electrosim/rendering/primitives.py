@@ -1,12 +1,17 @@
 from __future__ import annotations
 
-from typing import Tuple
+from collections import OrderedDict
+from typing import Iterable, Tuple
 
 import numpy as np
 import pygame
 
 from electrosim import config
-_GLOW_CACHE = {}
+from electrosim.rendering import glow_kernels as _glow_kernels
+# Glow surfaces in least-recently-used order, bounded by GLOW_CACHE_MAX_SURFACES
+_GLOW_CACHE: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+# Rasterized meter grid for the current size/scale/style (one entry)
+_GRID_CACHE: dict[tuple, pygame.Surface] = {}
 
  
 def world_vector_to_screen(pos_meters: np.ndarray, pixels_per_meter: float) -> Tuple[int, int]:
@@ -24,13 +29,30 @@ def world_vector_to_screen(pos_meters: np.ndarray, pixels_per_meter: float) -> T
 	tuple[int, int]
 		Pixel coordinates.
 	"""
-	x = int(round(pos_meters[0] * pixels_per_meter))
-	y = int(round(pos_meters[1] * pixels_per_meter))
-	return x, y
+	# One tolist() instead of two NumPy scalar reads and products; round() on a float already returns an int
+	x, y = pos_meters.tolist() if isinstance(pos_meters, np.ndarray) else pos_meters
+	return round(x * pixels_per_meter), round(y * pixels_per_meter)
 
 
-def screen_vector_to_world(pos_pixels: Tuple[int, int], pixels_per_meter: float) -> np.ndarray:
-	"""Convert integer screen pixels to world meters as a float array.
+def project_positions(pos_meters: np.ndarray, pixels_per_meter: float) -> np.ndarray:
+	"""Convert an (N, 2) array of world positions (m) to integer screen pixels.
+
+	Vectorized `world_vector_to_screen` (same round-half-to-even rounding), so a
+	frame can project every particle once and share the result between layers.
+
+	Returns
+	-------
+	numpy.ndarray shape (N, 2), int32
+		Pixel coordinates.
+	"""
+	return np.rint(pos_meters * pixels_per_meter).astype(np.int32)
+
+
+def screen_vector_to_world(pos_pixels: Tuple[int, int], pixels_per_meter: float) -> Tuple[float, float]:
+	"""Convert integer screen pixels to world meters.
+
+	Returns a plain tuple: it runs on every mouse event and its callers only
+	assign or index it, so a NumPy array would be a needless allocation.
 
 	Parameters
 	----------
@@ -41,10 +63,10 @@ def screen_vector_to_world(pos_pixels: Tuple[int, int], pixels_per_meter: float)
 
 	Returns
 	-------
-	numpy.ndarray shape (2,)
+	tuple[float, float]
 		World position in meters.
 	"""
-	return np.array([pos_pixels[0] / pixels_per_meter, pos_pixels[1] / pixels_per_meter], dtype=float)
+	return pos_pixels[0] / pixels_per_meter, pos_pixels[1] / pixels_per_meter
 
 
 def _draw_arrow(surface: pygame.Surface, color: Tuple[int, int, int] | Tuple[int, int, int, int], start_pixel: Tuple[int, int], vec_pixel: Tuple[float, float], max_len_pixel: float) -> None:
@@ -76,8 +98,32 @@ def _draw_arrow(surface: pygame.Surface, color: Tuple[int, int, int] | Tuple[int
 def draw_meter_grid(screen: pygame.Surface, world_size_m: np.ndarray, pixels_per_meter: float) -> None:
 	"""Draw a metric grid in meters over the entire world size.
 
-	Major lines and colors are controlled via `config` constants.
+	Major lines and colors are controlled via `config` constants. The grid is
+	rasterized once per size/scale/style onto a colorkeyed surface and blitted
+	from then on.
 	"""
+	width_px = int(round(world_size_m[0] * pixels_per_meter))
+	height_px = int(round(world_size_m[1] * pixels_per_meter))
+	key = (
+		float(world_size_m[0]), float(world_size_m[1]), float(pixels_per_meter),
+		config.GRID_METER_STEP, config.GRID_MAJOR_EVERY, config.COLOR_GRID, config.COLOR_GRID_MAJOR,
+		config.GRID_LINE_WIDTH, config.GRID_MAJOR_LINE_WIDTH,
+	)
+	grid_surface = _GRID_CACHE.get(key)
+	if grid_surface is None:
+		# Lines can reach one pixel past the world edge; any color other than the two line colors works as the key
+		grid_surface = pygame.Surface((width_px + 2, height_px + 2))
+		colorkey = next(c for c in ((255, 0, 255), (0, 255, 0), (0, 0, 255)) if c not in (config.COLOR_GRID, config.COLOR_GRID_MAJOR))
+		grid_surface.fill(colorkey)
+		_draw_meter_grid_lines(grid_surface, world_size_m, pixels_per_meter)
+		grid_surface.set_colorkey(colorkey, pygame.RLEACCEL)
+		_GRID_CACHE.clear()
+		_GRID_CACHE[key] = grid_surface
+	screen.blit(grid_surface, (0, 0))
+
+
+def _draw_meter_grid_lines(screen: pygame.Surface, world_size_m: np.ndarray, pixels_per_meter: float) -> None:
+	"""Draw the grid lines of `draw_meter_grid` directly onto `screen`."""
 	step_m = config.GRID_METER_STEP
 	major_every = config.GRID_MAJOR_EVERY
 	width_px = int(round(world_size_m[0] * pixels_per_meter))
@@ -106,6 +152,81 @@ def draw_meter_grid(screen: pygame.Surface, world_size_m: np.ndarray, pixels_per
 		idx += 1
 
 
+def glow_sprite(base_radius_px: int, color_rgb: Tuple[int, int, int], intensity: float) -> Tuple[pygame.Surface, int]:
+	"""Return the cached glow surface and its center offset in pixels.
+
+	The surface is built on first use and kept in a bounded cache keyed by size,
+	color, quantized intensity and base radius. Blit it at
+	`(cx - offset, cy - offset)` with `BLEND_ADD` to center it on `(cx, cy)`.
+	"""
+	outer_radius_px = max(base_radius_px, int(round(base_radius_px * (1.0 + intensity * config.GLOW_RADIUS_SCALE))))
+	size = (outer_radius_px * 2 + 2, outer_radius_px * 2 + 2)
+	q_steps = max(1, int(config.GLOW_CACHE_INTENSITY_STEPS))
+	q_int = int(round(min(max(intensity, 0.0), 1.0) * q_steps))
+	key = (size[0], size[1], color_rgb[0], color_rgb[1], color_rgb[2], q_int, base_radius_px)
+	glow_surface = _GLOW_CACHE.get(key)
+	if glow_surface is None:
+		alpha_center = max(0, min(255, int(round((q_int / float(q_steps)) * config.GLOW_ALPHA_AT_MAX))))
+		# Pixels are written straight into the new surface's memory (SRCALPHA is ARGB8888, i.e. BGRA bytes
+		# on little-endian), so a miss makes no intermediate arrays, byte strings or surfaces
+		glow_surface = pygame.Surface(size, pygame.SRCALPHA)
+		w = size[0]
+		h = size[1]
+		pixels = glow_surface.get_buffer()
+		bgra = np.frombuffer(pixels, dtype=np.uint8).reshape(h, glow_surface.get_pitch())[:, :w * 4].reshape(h, w, 4)
+		if _glow_kernels.KERNELS_AVAILABLE:
+			_glow_kernels.glow_bgra(np.asarray(color_rgb, dtype=np.float64), outer_radius_px, alpha_center, bgra)
+		else:
+			cx = outer_radius_px + 1
+			cy = outer_radius_px + 1
+			x = np.arange(w, dtype=np.int64) - cx
+			y = np.arange(h, dtype=np.int64) - cy
+			# Pixel offsets are integers, so the falloff depends only on the integer r^2; evaluate it once per
+			# distinct r^2 inside the outer radius and gather, instead of hypot/pow over the whole grid
+			r2 = (y * y)[:, None] + (x * x)[None, :]
+			r2_max = outer_radius_px * outer_radius_px
+			lut = np.clip(1.0 - np.sqrt(np.arange(r2_max + 1, dtype=float)) / float(outer_radius_px), 0.0, 1.0) ** 3
+			falloff = lut[np.minimum(r2, r2_max)]
+			for c in range(3):
+				bgra[:, :, 2 - c] = (color_rgb[c] * falloff).astype(np.uint8)
+			bgra[:, :, 3] = (alpha_center * falloff).astype(np.uint8)
+		# Dropping the buffer views unlocks the surface for blitting
+		del bgra, pixels
+		_GLOW_CACHE[key] = glow_surface
+		if len(_GLOW_CACHE) > int(config.GLOW_CACHE_MAX_SURFACES):
+			_GLOW_CACHE.popitem(last=False)
+	else:
+		_GLOW_CACHE.move_to_end(key)
+	return glow_surface, outer_radius_px + 1
+
+
+def precompute_glow_atlas(
+	colors: Iterable[Tuple[int, int, int]],
+	base_radii_px: Iterable[int],
+	intensities: Iterable[float],
+) -> int:
+	"""Build the glow surfaces for every `(color, base radius, intensity)` combination up front.
+
+	The glow size grows with the unquantized intensity (up to `GLOW_RADIUS_SCALE`
+	times the base radius), so the full key space is far too large to pre-render;
+	callers pass the combinations they know will be drawn first, e.g. the default
+	particle and the placement preview, so the first frames never take a cache miss.
+
+	Returns
+	-------
+	int
+		Number of cached glow surfaces after warming.
+	"""
+	radii = list(base_radii_px)
+	levels = list(intensities)
+	for color_rgb in colors:
+		for base_radius_px in radii:
+			for intensity in levels:
+				if intensity > 0.0:
+					glow_sprite(int(base_radius_px), color_rgb, float(intensity))
+	return len(_GLOW_CACHE)
+
+
 def draw_glow_at_screen_pos(
 	screen: pygame.Surface,
 	center_px: Tuple[int, int],
@@ -132,44 +253,7 @@ def draw_glow_at_screen_pos(
 		return
 	if intensity <= 0.0:
 		return
-
-	outer_radius_px = max(base_radius_px, int(round(base_radius_px * (1.0 + intensity * config.GLOW_RADIUS_SCALE))))
-	size = (outer_radius_px * 2 + 2, outer_radius_px * 2 + 2)
-	q_steps = max(1, int(getattr(config, "GLOW_CACHE_INTENSITY_STEPS", 32)))
-	q_int = int(round(min(max(intensity, 0.0), 1.0) * q_steps))
-	key = (size[0], size[1], color_rgb[0], color_rgb[1], color_rgb[2], q_int, base_radius_px)
-	glow_surface = _GLOW_CACHE.get(key)
-	if glow_surface is None:
-		glow_surface = pygame.Surface(size, pygame.SRCALPHA)
-
-		alpha_center = max(0, min(255, int(round((q_int / float(q_steps)) * config.GLOW_ALPHA_AT_MAX))))
-		glow_surface.fill((0, 0, 0, 0))
-		w = size[0]
-		h = size[1]
-		cx = outer_radius_px + 1
-		cy = outer_radius_px + 1
-		x = np.arange(w, dtype=float) - float(cx)
-		y = np.arange(h, dtype=float) - float(cy)
-		xx, yy = np.meshgrid(x, y, indexing="xy")
-		r = np.hypot(xx, yy)
-		rnorm = r / float(outer_radius_px)
-		falloff = np.clip(1.0 - rnorm, 0.0, 1.0) ** 3
-		rgb_view = pygame.surfarray.pixels3d(glow_surface)
-		falloff_T = falloff.T
-		rgb_view[:, :, 0] = (color_rgb[0] * falloff_T).astype(np.uint8)
-		rgb_view[:, :, 1] = (color_rgb[1] * falloff_T).astype(np.uint8)
-		rgb_view[:, :, 2] = (color_rgb[2] * falloff_T).astype(np.uint8)
-		del rgb_view
-		alpha = (alpha_center * falloff).astype(np.uint8)
-		alpha_view = pygame.surfarray.pixels_alpha(glow_surface)
-		alpha_view[:, :] = alpha.T
-		del alpha_view
-		# bound cache
-		max_cache = int(getattr(config, "GLOW_CACHE_MAX_SURFACES", 128))
-		if len(_GLOW_CACHE) >= max_cache:
-			_GLOW_CACHE.pop(next(iter(_GLOW_CACHE)))
-		_GLOW_CACHE[key] = glow_surface
-
-	screen.blit(glow_surface, (center_px[0] - outer_radius_px - 1, center_px[1] - outer_radius_px - 1), special_flags=pygame.BLEND_ADD)
+	glow_surface, offset = glow_sprite(base_radius_px, color_rgb, intensity)
+	screen.blit(glow_surface, (center_px[0] - offset, center_px[1] - offset), special_flags=pygame.BLEND_ADD)
 
 
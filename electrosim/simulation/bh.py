@@ -0,0 +1,362 @@
+"""Barnes–Hut quadtree approximation of the pairwise Coulomb accelerations.
+
+The tree is rebuilt from scratch on every call: particles are sorted by Morton
+key, nodes are emitted in depth-first order with "skip" pointers to the next
+sibling subtree, and each particle walks the flattened tree without a stack.
+A node is replaced by pseudo-particles (its net positive and net negative
+charge) when its width `w` and distance `d` satisfy ``w < theta * d``; ``theta = 0`` opens every node, which reproduces the
+direct O(N^2) sum. Requires Numba; `BH_AVAILABLE` is False without it.
+"""
+from __future__ import annotations
+
+import numpy as np
+try:
+	from numba import njit, prange
+	BH_AVAILABLE = True
+except Exception:
+	BH_AVAILABLE = False
+
+from electrosim import config as _cfg
+
+# Tree depth (bits per axis of the Morton key); deeper cells are treated as leaves
+_MAX_LEVEL = 16
+
+
+def _morton_keys(pos: np.ndarray, box_m: float) -> np.ndarray:
+	"""Interleave quantized x/y coordinates into Morton keys (x in the even bits), as int64.
+
+	Coordinates outside ``[0, box_m)`` are clipped into the edge cells.
+	"""
+	scale = float(1 << _MAX_LEVEL) / box_m
+	q = np.clip((pos * scale).astype(np.int64), 0, (1 << _MAX_LEVEL) - 1).astype(np.uint64)
+	# Spread the 16 low bits of each coordinate so they occupy every other bit
+	for shift, mask in ((8, 0x00FF00FF), (4, 0x0F0F0F0F), (2, 0x33333333), (1, 0x55555555)):
+		q = (q | (q << np.uint64(shift))) & np.uint64(mask)
+	return (q[:, 0] | (q[:, 1] << np.uint64(1))).astype(np.int64)
+
+
+if BH_AVAILABLE:
+
+	@njit(cache=True)
+	def _build_tree(keys: np.ndarray, pos: np.ndarray, charge: np.ndarray, radius: np.ndarray, box_m: float):
+		"""Emit tree nodes in depth-first order from Morton-sorted particle data.
+
+		Returns per-node `(start, end, level, c, qs, rbar, skip)`, where
+		`[start, end)` is the node's particle range in sorted order, `c[k, 0]` is
+		its |q|-weighted center, `c[k, 1]`/`c[k, 2]` the centers of its positive
+		and negative charge with totals `qs[k, 0]`/`qs[k, 1]`, `rbar` its mean
+		radius and `skip` the index of the next node outside its subtree.
+		"""
+		N = keys.shape[0]
+		cap = N * (_MAX_LEVEL + 1) + 1
+		start = np.empty(cap, dtype=np.int64)
+		end = np.empty(cap, dtype=np.int64)
+		level = np.empty(cap, dtype=np.int64)
+		c = np.zeros((cap, 3, 2))
+		qs = np.zeros((cap, 2))
+		rbar = np.empty(cap)
+
+		stack_s = np.empty(cap, dtype=np.int64)
+		stack_e = np.empty(cap, dtype=np.int64)
+		stack_l = np.empty(cap, dtype=np.int64)
+		stack_s[0] = 0
+		stack_e[0] = N
+		stack_l[0] = 0
+		top = 1
+		n_nodes = 0
+		bounds = np.empty(5, dtype=np.int64)
+		while top > 0:
+			top -= 1
+			s = stack_s[top]
+			e = stack_e[top]
+			lv = stack_l[top]
+			k = n_nodes
+			n_nodes += 1
+			start[k] = s
+			end[k] = e
+			level[k] = lv
+
+			# Positive and negative charge get separate monopoles so near-neutral cells keep their dipole
+			q_pos = 0.0
+			q_neg = 0.0
+			px = 0.0
+			py = 0.0
+			nx = 0.0
+			ny = 0.0
+			r_sum = 0.0
+			x_sum = 0.0
+			y_sum = 0.0
+			for m in range(s, e):
+				qm = charge[m]
+				if qm > 0.0:
+					q_pos += qm
+					px += qm * pos[m, 0]
+					py += qm * pos[m, 1]
+				elif qm < 0.0:
+					q_neg += qm
+					nx += qm * pos[m, 0]
+					ny += qm * pos[m, 1]
+				x_sum += pos[m, 0]
+				y_sum += pos[m, 1]
+				r_sum += radius[m]
+			cnt = e - s
+			q_abs = q_pos - q_neg
+			if q_abs > 0.0:
+				c[k, 0, 0] = (px - nx) / q_abs
+				c[k, 0, 1] = (py - ny) / q_abs
+			else:
+				c[k, 0, 0] = x_sum / cnt
+				c[k, 0, 1] = y_sum / cnt
+			if q_pos > 0.0:
+				c[k, 1, 0] = px / q_pos
+				c[k, 1, 1] = py / q_pos
+			if q_neg < 0.0:
+				c[k, 2, 0] = nx / q_neg
+				c[k, 2, 1] = ny / q_neg
+			qs[k, 0] = q_pos
+			qs[k, 1] = q_neg
+			rbar[k] = r_sum / cnt
+
+			if cnt == 1 or lv == _MAX_LEVEL:
+				continue
+			# Children are the runs of equal 2-bit digit at this level; push in reverse for preorder
+			shift = 2 * (_MAX_LEVEL - lv - 1)
+			bounds[0] = s
+			nb = 1
+			prev = (keys[s] >> shift) & 3
+			for m in range(s + 1, e):
+				digit = (keys[m] >> shift) & 3
+				if digit != prev:
+					bounds[nb] = m
+					nb += 1
+					prev = digit
+			bounds[nb] = e
+			for child in range(nb - 1, -1, -1):
+				stack_s[top] = bounds[child]
+				stack_e[top] = bounds[child + 1]
+				stack_l[top] = lv + 1
+				top += 1
+
+		start = start[:n_nodes]
+		end = end[:n_nodes]
+		# Preorder starts are non-decreasing, so the first node starting at `end` closes the subtree
+		skip = np.searchsorted(start, end)
+		return start, end, level[:n_nodes], c[:n_nodes], qs[:n_nodes], rbar[:n_nodes], skip
+
+	@njit(cache=True, parallel=True, fastmath=bool(_cfg.NUMBA_FASTMATH), error_model="numpy", boundscheck=False)
+	def _bh_forces(
+		pos: np.ndarray,
+		charge: np.ndarray,
+		radius: np.ndarray,
+		active: np.ndarray,
+		start: np.ndarray,
+		end: np.ndarray,
+		level: np.ndarray,
+		c: np.ndarray,
+		qs: np.ndarray,
+		rbar: np.ndarray,
+		skip: np.ndarray,
+		Lx: float,
+		Ly: float,
+		box_m: float,
+		theta: float,
+		soft_frac: float,
+		k_coulomb: float,
+	) -> np.ndarray:
+		N = pos.shape[0]
+		n_nodes = start.shape[0]
+		f = np.zeros((N, 2))
+		half_Lx = 0.5 * Lx
+		half_Ly = 0.5 * Ly
+		# Minimum-image distances are only meaningful for cells narrower than half the box
+		w_max = 0.5 * min(Lx, Ly)
+		theta2 = theta * theta
+		for i in prange(N):
+			if not active[i]:
+				continue
+			xi = pos[i, 0]
+			yi = pos[i, 1]
+			qi = charge[i]
+			ri = radius[i]
+			fx = 0.0
+			fy = 0.0
+			k = 0
+			while k < n_nodes:
+				s = start[k]
+				e = end[k]
+				leaf = (e - s == 1) or level[k] == _MAX_LEVEL
+				if not leaf and (i < s or i >= e):
+					w = box_m / (1 << level[k])
+					dx = xi - c[k, 0, 0]
+					if dx > half_Lx:
+						dx -= Lx
+					elif dx < -half_Lx:
+						dx += Lx
+					dy = yi - c[k, 0, 1]
+					if dy > half_Ly:
+						dy -= Ly
+					elif dy < -half_Ly:
+						dy += Ly
+					if w <= w_max and w * w < theta2 * (dx * dx + dy * dy):
+						eps = soft_frac * (ri + rbar[k])
+						for sign in range(2):
+							qn = qs[k, sign]
+							if qn == 0.0:
+								continue
+							dx = xi - c[k, sign + 1, 0]
+							if dx > half_Lx:
+								dx -= Lx
+							elif dx < -half_Lx:
+								dx += Lx
+							dy = yi - c[k, sign + 1, 1]
+							if dy > half_Ly:
+								dy -= Ly
+							elif dy < -half_Ly:
+								dy += Ly
+							s2 = dx * dx + dy * dy + eps * eps
+							if s2 == 0.0:
+								continue
+							inv_s = 1.0 / np.sqrt(s2)
+							coef = k_coulomb * qi * qn * (inv_s * inv_s * inv_s)
+							fx += coef * dx
+							fy += coef * dy
+						k = skip[k]
+						continue
+				if leaf:
+					# Direct sum over the (usually single) particle in this cell
+					for j in range(s, e):
+						if j == i or charge[j] == 0.0:
+							continue
+						dx = xi - pos[j, 0]
+						if dx > half_Lx:
+							dx -= Lx
+						elif dx < -half_Lx:
+							dx += Lx
+						dy = yi - pos[j, 1]
+						if dy > half_Ly:
+							dy -= Ly
+						elif dy < -half_Ly:
+							dy += Ly
+						eps = soft_frac * (ri + radius[j])
+						s2 = dx * dx + dy * dy + eps * eps
+						if s2 == 0.0:
+							continue
+						inv_s = 1.0 / np.sqrt(s2)
+						coef = k_coulomb * qi * charge[j] * (inv_s * inv_s * inv_s)
+						fx += coef * dx
+						fy += coef * dy
+					k = skip[k]
+				else:
+					k += 1
+			f[i, 0] = fx
+			f[i, 1] = fy
+		return f
+
+
+def compute_accelerations_bh(
+	pos: np.ndarray,
+	charge: np.ndarray,
+	radius: np.ndarray,
+	mass: np.ndarray,
+	fixed: np.ndarray,
+	world_size_m: np.ndarray,
+	softening_fraction: float,
+	theta: float,
+) -> np.ndarray:
+	"""Approximate Coulomb accelerations with a Barnes–Hut quadtree.
+
+	Same inputs, outputs and uniform-field handling as
+	`physics.compute_accelerations`, which dispatches here when
+	`config.BARNES_HUT_THETA > 0`. A far cell acts as two point charges, its
+	total positive and total negative charge at their respective centers,
+	softened with the cell's mean radius.
+
+	Parameters
+	----------
+	pos : numpy.ndarray shape (N, 2)
+		Positions (m). They need not be wrapped (RK4 stage positions are not):
+		positions outside the box are clipped into the edge cells for the tree,
+		while pair distances still use the minimum image.
+	charge, radius, mass : numpy.ndarray shape (N,)
+		Charges (C), contact radii (m) and masses (kg).
+	fixed : numpy.ndarray shape (N,), bool
+		Fixed-particle mask.
+	world_size_m : numpy.ndarray shape (2,)
+		World size (m) as (Lx, Ly).
+	softening_fraction : float
+		Softening fraction applied to contact radius in pairwise force.
+	theta : float
+		Opening angle; larger is faster and less accurate, 0 is exact.
+
+	Returns
+	-------
+	numpy.ndarray shape (N, 2)
+		Accelerations (m/s^2) for each particle.
+
+	Raises
+	------
+	RuntimeError
+		If Numba is not available.
+	"""
+	if not BH_AVAILABLE:
+		raise RuntimeError("Barnes-Hut requires numba")
+	N = pos.shape[0]
+	acc = np.zeros((N, 2), dtype=float)
+	if N == 0:
+		return acc
+	Lx = float(world_size_m[0])
+	Ly = float(world_size_m[1])
+	box_m = max(Lx, Ly)
+
+	keys = _morton_keys(pos, box_m)
+	order = np.argsort(keys, kind="stable")
+	keys = keys[order]
+	pos_s = np.ascontiguousarray(pos[order], dtype=np.float64)
+	charge_s = np.ascontiguousarray(charge[order], dtype=np.float64)
+	radius_s = np.ascontiguousarray(radius[order], dtype=np.float64)
+	active = (~fixed) & (mass > 0.0) & (charge != 0.0)
+
+	tree = _build_tree(keys, pos_s, charge_s, radius_s, box_m)
+	f_s = _bh_forces(
+		pos_s, charge_s, radius_s, active[order], *tree,
+		Lx, Ly, box_m, float(theta), float(softening_fraction), float(_cfg.K_COULOMB),
+	)
+	f = np.empty_like(f_s)
+	f[order] = f_s
+	if _cfg.UNIFORM_FIELD_ACTIVE:
+		f[:, 0] += charge * float(_cfg.UNIFORM_FIELD_VECTOR_NC[0])
+		f[:, 1] += charge * float(_cfg.UNIFORM_FIELD_VECTOR_NC[1])
+	acc[active] = f[active] / mass[active, None]
+	return acc
+
+
+def warm_up_bh(
+	pos: np.ndarray,
+	charge: np.ndarray,
+	radius: np.ndarray,
+	world_size_m: np.ndarray,
+	softening_fraction: float,
+	theta: float,
+) -> None:
+	"""Compile the tree kernels for the dtypes `compute_accelerations_bh` passes them.
+
+	Builds the tree for the given particles, which runs the serial builder, and
+	compiles the threaded force walk without running it, so this is safe to call
+	from a background thread. Does nothing without Numba.
+	"""
+	if not BH_AVAILABLE:
+		return
+	from numba import typeof
+
+	box_m = max(float(world_size_m[0]), float(world_size_m[1]))
+	keys = np.sort(_morton_keys(pos, box_m))
+	pos_s = np.ascontiguousarray(pos, dtype=np.float64)
+	charge_s = np.ascontiguousarray(charge, dtype=np.float64)
+	radius_s = np.ascontiguousarray(radius, dtype=np.float64)
+	active = np.ones(pos.shape[0], dtype=bool)
+	tree = _build_tree(keys, pos_s, charge_s, radius_s, box_m)
+	args = (
+		pos_s, charge_s, radius_s, active, *tree,
+		float(world_size_m[0]), float(world_size_m[1]), box_m, float(theta), float(softening_fraction), float(_cfg.K_COULOMB),
+	)
+	_bh_forces.compile(tuple(typeof(a) for a in args))
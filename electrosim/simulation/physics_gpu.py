@@ -0,0 +1,410 @@
+"""Optional CuPy/CUDA backend for the electric field grid and force arrows.
+
+CuPy is imported lazily on first use so the package keeps working (and
+importing quickly) on machines without a GPU, and in Pyodide builds.
+"""
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy as np
+
+_TILE = 128
+
+_FIELD_GRID_SRC = r"""
+extern "C" __global__
+void field_grid(
+	const float* __restrict__ centers,
+	const float* __restrict__ pos,
+	const float* __restrict__ charge,
+	const float* __restrict__ radius,
+	const int M,
+	const int N,
+	const float Lx,
+	const float Ly,
+	const float soft_frac,
+	const float k_coulomb,
+	float* __restrict__ out)
+{
+	__shared__ float s_x[TILE];
+	__shared__ float s_y[TILE];
+	__shared__ float s_q[TILE];
+	__shared__ float s_e2[TILE];
+
+	const int m = blockIdx.x * blockDim.x + threadIdx.x;
+	const float half_Lx = 0.5f * Lx;
+	const float half_Ly = 0.5f * Ly;
+	float px = 0.0f;
+	float py = 0.0f;
+	if (m < M) {
+		px = centers[2 * m];
+		py = centers[2 * m + 1];
+	}
+	float Ex = 0.0f;
+	float Ey = 0.0f;
+
+	for (int base = 0; base < N; base += TILE) {
+		// Stage one tile of particles in shared memory, shared by the whole block
+		const int j = base + threadIdx.x;
+		if (j < N) {
+			const float eps = soft_frac * radius[j];
+			s_x[threadIdx.x] = pos[2 * j];
+			s_y[threadIdx.x] = pos[2 * j + 1];
+			s_q[threadIdx.x] = charge[j];
+			s_e2[threadIdx.x] = eps * eps;
+		}
+		__syncthreads();
+
+		const int count = min(TILE, N - base);
+		if (m < M) {
+			for (int i = 0; i < count; ++i) {
+				float dx = px - s_x[i];
+				if (dx > half_Lx) dx -= Lx; else if (dx < -half_Lx) dx += Lx;
+				float dy = py - s_y[i];
+				if (dy > half_Ly) dy -= Ly; else if (dy < -half_Ly) dy += Ly;
+				const float s2 = dx * dx + dy * dy + s_e2[i];
+				if (s2 > 0.0f) {
+					const float inv_s = rsqrtf(s2);
+					const float coef = k_coulomb * s_q[i] * inv_s * inv_s * inv_s;
+					Ex += coef * dx;
+					Ey += coef * dy;
+				}
+			}
+		}
+		__syncthreads();
+	}
+
+	if (m < M) {
+		out[2 * m] = Ex;
+		out[2 * m + 1] = Ey;
+	}
+}
+"""
+
+# Compiled twice: REAL=float for the force arrows, REAL=double for the integrator
+_FORCES_SRC = r"""
+extern "C" __global__
+void forces(
+	const REAL* __restrict__ pos,
+	const REAL* __restrict__ charge,
+	const REAL* __restrict__ radius,
+	const unsigned char* __restrict__ skip,
+	const int N,
+	const REAL Lx,
+	const REAL Ly,
+	const REAL soft_frac,
+	const REAL k_coulomb,
+	const REAL uniform_Ex,
+	const REAL uniform_Ey,
+	REAL* __restrict__ out)
+{
+	__shared__ REAL s_x[TILE];
+	__shared__ REAL s_y[TILE];
+	__shared__ REAL s_q[TILE];
+	__shared__ REAL s_r[TILE];
+
+	const int i = blockIdx.x * blockDim.x + threadIdx.x;
+	const REAL half_Lx = (REAL)0.5 * Lx;
+	const REAL half_Ly = (REAL)0.5 * Ly;
+	REAL xi = 0;
+	REAL yi = 0;
+	REAL qi = 0;
+	REAL ri = 0;
+	if (i < N) {
+		xi = pos[2 * i];
+		yi = pos[2 * i + 1];
+		qi = charge[i];
+		ri = radius[i];
+	}
+	REAL Fx = 0;
+	REAL Fy = 0;
+
+	for (int base = 0; base < N; base += TILE) {
+		// Standard N-body tiling: each block stages TILE source particles in shared memory
+		const int j = base + threadIdx.x;
+		if (j < N) {
+			s_x[threadIdx.x] = pos[2 * j];
+			s_y[threadIdx.x] = pos[2 * j + 1];
+			s_q[threadIdx.x] = charge[j];
+			s_r[threadIdx.x] = radius[j];
+		}
+		__syncthreads();
+
+		const int count = min(TILE, N - base);
+		if (i < N) {
+			for (int t = 0; t < count; ++t) {
+				if (base + t == i) continue;
+				REAL dx = xi - s_x[t];
+				if (dx > half_Lx) dx -= Lx; else if (dx < -half_Lx) dx += Lx;
+				REAL dy = yi - s_y[t];
+				if (dy > half_Ly) dy -= Ly; else if (dy < -half_Ly) dy += Ly;
+				const REAL eps = soft_frac * (ri + s_r[t]);
+				const REAL s2 = dx * dx + dy * dy + eps * eps;
+				if (s2 > 0) {
+					const REAL inv_s = rsqrt(s2);
+					const REAL coef = k_coulomb * qi * s_q[t] * inv_s * inv_s * inv_s;
+					Fx += coef * dx;
+					Fy += coef * dy;
+				}
+			}
+		}
+		__syncthreads();
+	}
+
+	if (i < N) {
+		const bool zero = skip[i] != 0;
+		out[2 * i] = zero ? (REAL)0 : Fx + qi * uniform_Ex;
+		out[2 * i + 1] = zero ? (REAL)0 : Fy + qi * uniform_Ey;
+	}
+}
+"""
+
+_cp = None
+_kernel = None
+_forces_kernel = None
+_forces_kernel_f64 = None
+_available: Optional[bool] = None
+# Grid sample points are cached by the sampler across frames, so keep their device copy too
+_centers_host: Optional[np.ndarray] = None
+_centers_dev = None
+# Device buffers for the force kernels, reused across calls and grown on demand
+_force_bufs: dict = {}
+
+
+def gpu_available() -> bool:
+	"""Return True if CuPy imports and sees at least one CUDA device (checked once)."""
+	global _cp, _kernel, _forces_kernel, _forces_kernel_f64, _available
+	if _available is None:
+		try:
+			import cupy as cp
+			if cp.cuda.runtime.getDeviceCount() <= 0:
+				raise RuntimeError("no CUDA device")
+			_kernel = cp.RawKernel(_FIELD_GRID_SRC, "field_grid", options=(f"-DTILE={_TILE}",))
+			_forces_kernel = cp.RawKernel(_FORCES_SRC, "forces", options=(f"-DTILE={_TILE}", "-DREAL=float"))
+			_forces_kernel_f64 = cp.RawKernel(_FORCES_SRC, "forces", options=(f"-DTILE={_TILE}", "-DREAL=double"))
+			_cp = cp
+			_available = True
+		except Exception:
+			_available = False
+	return bool(_available)
+
+
+def compute_field_grid_gpu(
+	centers_m: np.ndarray,
+	pos: np.ndarray,
+	charge: np.ndarray,
+	radius: np.ndarray,
+	world_size: np.ndarray,
+	soft_frac: float,
+	k_coulomb: float,
+) -> np.ndarray:
+	"""Evaluate the softened Coulomb field at every grid point on the GPU.
+
+	Same math as `_compute_field_grid_numba`, with one CUDA thread per grid point
+	and particles staged through shared memory in tiles. All buffers are float32.
+
+	Parameters
+	----------
+	centers_m : numpy.ndarray shape (M, 2)
+		Grid sample points in meters.
+	pos : numpy.ndarray shape (N, 2)
+		Particle positions in meters.
+	charge, radius : numpy.ndarray shape (N,)
+		Particle charges (C) and radii (m).
+	world_size : numpy.ndarray shape (2,)
+		World size (m) for the minimum-image convention.
+	soft_frac : float
+		Softening length as a fraction of particle radius.
+	k_coulomb : float
+		Coulomb constant.
+
+	Returns
+	-------
+	numpy.ndarray shape (M, 2), float32
+		Field vectors (V/m) at each grid point.
+
+	Raises
+	------
+	RuntimeError
+		If no GPU backend is available.
+	"""
+	global _centers_host, _centers_dev
+	if not gpu_available():
+		raise RuntimeError("CuPy/CUDA backend is not available")
+	cp = _cp
+	M = int(centers_m.shape[0])
+	N = int(pos.shape[0])
+	if centers_m is not _centers_host or _centers_dev is None:
+		_centers_dev = cp.asarray(centers_m, dtype=cp.float32)
+		_centers_host = centers_m
+	pos_dev = cp.asarray(pos, dtype=cp.float32)
+	charge_dev = cp.asarray(charge, dtype=cp.float32)
+	radius_dev = cp.asarray(radius, dtype=cp.float32)
+	out_dev = cp.empty((M, 2), dtype=cp.float32)
+	blocks = (M + _TILE - 1) // _TILE
+	_kernel(
+		(blocks,),
+		(_TILE,),
+		(
+			_centers_dev,
+			pos_dev,
+			charge_dev,
+			radius_dev,
+			np.int32(M),
+			np.int32(N),
+			np.float32(world_size[0]),
+			np.float32(world_size[1]),
+			np.float32(soft_frac),
+			np.float32(k_coulomb),
+			out_dev,
+		),
+	)
+	return cp.asnumpy(out_dev)
+
+
+def _device_buffer(name: str, shape: tuple, dtype):
+	"""Return a persistent device array of at least `shape[0]` rows, sliced to `shape`."""
+	key = (name, np.dtype(dtype).str)
+	buf = _force_bufs.get(key)
+	if buf is None or buf.shape[0] < shape[0]:
+		buf = _cp.empty((max(shape[0], 2 * (buf.shape[0] if buf is not None else 0)),) + shape[1:], dtype=dtype)
+		_force_bufs[key] = buf
+	return buf[:shape[0]]
+
+
+def _launch_forces(kernel, dtype, pos, charge, radius, skip, world_size, soft_frac, k_coulomb, uniform_E) -> np.ndarray:
+	"""Upload the particle arrays into the persistent buffers, run `kernel`, return host forces."""
+	N = int(pos.shape[0])
+	pos_dev = _device_buffer("pos", (N, 2), dtype)
+	charge_dev = _device_buffer("charge", (N,), dtype)
+	radius_dev = _device_buffer("radius", (N,), dtype)
+	skip_dev = _device_buffer("skip", (N,), np.uint8)
+	out_dev = _device_buffer("out", (N, 2), dtype)
+	pos_dev.set(np.ascontiguousarray(pos, dtype=dtype))
+	charge_dev.set(np.ascontiguousarray(charge, dtype=dtype))
+	radius_dev.set(np.ascontiguousarray(radius, dtype=dtype))
+	skip_dev.set(np.ascontiguousarray(skip, dtype=np.uint8))
+	real = np.dtype(dtype).type
+	blocks = (N + _TILE - 1) // _TILE
+	kernel(
+		(blocks,),
+		(_TILE,),
+		(
+			pos_dev,
+			charge_dev,
+			radius_dev,
+			skip_dev,
+			np.int32(N),
+			real(world_size[0]),
+			real(world_size[1]),
+			real(soft_frac),
+			real(k_coulomb),
+			real(uniform_E[0]),
+			real(uniform_E[1]),
+			out_dev,
+		),
+	)
+	return _cp.asnumpy(out_dev)
+
+
+def compute_forces_gpu(
+	pos: np.ndarray,
+	charge: np.ndarray,
+	radius: np.ndarray,
+	fixed: np.ndarray,
+	world_size: np.ndarray,
+	soft_frac: float,
+	k_coulomb: float,
+	uniform_E: tuple = (0.0, 0.0),
+) -> np.ndarray:
+	"""Compute per-particle Coulomb forces on the GPU for force-arrow drawing.
+
+	Same force law as the CPU acceleration kernels times mass: softened pairwise
+	Coulomb with `epsilon = soft_frac * (r_i + r_j)` plus `q E` for the uniform
+	field; fixed particles get zero. Uses one CUDA thread per particle with the
+	standard shared-memory tiling, in float32. Device buffers persist across
+	calls, so each frame only uploads the particle arrays.
+
+	Parameters
+	----------
+	pos : numpy.ndarray shape (N, 2)
+		Particle positions in meters.
+	charge, radius : numpy.ndarray shape (N,)
+		Particle charges (C) and radii (m).
+	fixed : numpy.ndarray shape (N,), bool
+		Fixed-particle mask.
+	world_size : numpy.ndarray shape (2,)
+		World size (m) for the minimum-image convention.
+	soft_frac : float
+		Softening length as a fraction of the contact radius.
+	k_coulomb : float
+		Coulomb constant.
+	uniform_E : tuple[float, float]
+		Uniform field (N/C) added as `q E`; zero when inactive.
+
+	Returns
+	-------
+	numpy.ndarray shape (N, 2), float32
+		Forces (N) on each particle.
+
+	Raises
+	------
+	RuntimeError
+		If no GPU backend is available.
+	"""
+	if not gpu_available():
+		raise RuntimeError("CuPy/CUDA backend is not available")
+	return _launch_forces(_forces_kernel, np.float32, pos, charge, radius, fixed, world_size, soft_frac, k_coulomb, uniform_E)
+
+
+def compute_accelerations_gpu(
+	pos: np.ndarray,
+	charge: np.ndarray,
+	radius: np.ndarray,
+	mass: np.ndarray,
+	fixed: np.ndarray,
+	world_size: np.ndarray,
+	soft_frac: float,
+	k_coulomb: float,
+	uniform_E: tuple = (0.0, 0.0),
+) -> np.ndarray:
+	"""Compute Coulomb accelerations on the GPU in double precision.
+
+	Drop-in for `physics.compute_accelerations`: the same tiled kernel as
+	`compute_forces_gpu`, compiled for float64 so the integrator keeps its
+	accuracy. Fixed, massless or neutral particles get zero acceleration.
+
+	Parameters
+	----------
+	pos : numpy.ndarray shape (N, 2)
+		Particle positions in meters.
+	charge, radius, mass : numpy.ndarray shape (N,)
+		Charges (C), contact radii (m) and masses (kg).
+	fixed : numpy.ndarray shape (N,), bool
+		Fixed-particle mask.
+	world_size : numpy.ndarray shape (2,)
+		World size (m) for the minimum-image convention.
+	soft_frac : float
+		Softening length as a fraction of the contact radius.
+	k_coulomb : float
+		Coulomb constant.
+	uniform_E : tuple[float, float]
+		Uniform field (N/C) added as `q E`; zero when inactive.
+
+	Returns
+	-------
+	numpy.ndarray shape (N, 2), float64
+		Accelerations (m/s^2) for each particle.
+
+	Raises
+	------
+	RuntimeError
+		If no GPU backend is available.
+	"""
+	if not gpu_available():
+		raise RuntimeError("CuPy/CUDA backend is not available")
+	active = (~fixed) & (mass > 0.0) & (charge != 0.0)
+	f = _launch_forces(_forces_kernel_f64, np.float64, pos, charge, radius, ~active, world_size, soft_frac, k_coulomb, uniform_E)
+	acc = np.zeros((pos.shape[0], 2), dtype=float)
+	acc[active] = f[active] / mass[active, None]
+	return acc
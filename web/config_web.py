@@ -15,6 +15,7 @@ WINDOW_HEIGHT_PX: int = 480
 PROFILE_OVERLAY_ENABLED = True  # Show performance stats in web
 FIELD_SAMPLER_ENABLED = True # Disable for better performance in browser
 FPS_TARGET = 60
+MAX_CATCHUP_FRAMES = 4  # physics frames run at most per rendered frame before the backlog is dropped
 
 # Web-specific settings
 WEB_MODE = True
@@ -75,6 +75,18 @@ FIELD_VECTOR_SCALE: float = 2e-3
 FIELD_SAMPLER_ENABLED: bool = True  # cache field grid per frame
 NUMBA_PARALLEL_ACCEL: bool = True   # use prange parallel loop if available
 NUMBA_FASTMATH: bool = False        # allow fastmath in numba kernels (accuracy tradeoff)
+NUMBA_NUM_THREADS: int = 0          # worker threads for parallel kernels (0 = all cores)
+NUMBA_PARALLEL_MIN_PARTICLES: int = 256  # below this count the serial kernels beat the threading overhead
+NUMBA_BACKGROUND_WARMUP: bool = True  # compile the Numba kernels on a background thread at import
+PRECISION: str = "f64"             # particle state dtype: "f32" halves memory traffic, "f64" for validation-grade accuracy
+FIELD_GPU_ENABLED: bool = False     # evaluate large field grids with CuPy/CUDA if installed
+FIELD_GPU_MIN_WORK: int = 1_000_000  # grid points x particles before the GPU path is used
+GPU_FORCE_THRESHOLD: int = 2048     # particle count at which force arrows are computed with CuPy/CUDA if installed
+USE_GPU: bool = False               # integrate with the CuPy/CUDA acceleration kernel if installed
+GPU_ACCEL_MIN_PARTICLES: int = 1024  # below this count the transfers cost more than the GPU saves
+BARNES_HUT_THETA: float = 0.0      # Barnes-Hut opening angle for accelerations (0 = exact direct sum)
+BARNES_HUT_MIN_PARTICLES: int = 256  # below this count the direct sum is faster than building the tree
+FORCE_CUTOFF_M: float = 0.0        # drop pair forces beyond this distance, summed over a cell list (0 = full sum)
 PROFILE_OVERLAY_ENABLED: bool = True  # show per-frame timings in overlay
 
 # Glow cache (rendering)
@@ -99,8 +111,7 @@ TRAIL_WIDTH_PX: int = 3
 TRAIL_ALPHA_MAX: int = 235
 TRAIL_MIN_ALPHA: int = 5
 TRAIL_FADE_SECONDS: float = TRAJECTORY_HISTORY_SECONDS
-TRAIL_AA_EDGE_EXTEND_PX: int = 1
-TRAIL_AA_EDGE_OPACITY_FACTOR: float = 0.35
+TRAIL_ALPHA_BUCKETS: int = 8  # opacity levels used to batch faded trail segments into polylines
 
 # Interaction
 VELOCITY_PER_PIXEL: float = 0.2  # 1 px drag = 0.2 m/s
@@ -125,6 +136,9 @@ UNIFORM_FIELD_VISUAL_OVERRIDE: bool = False
 
 # Validation scenario parameters
 VALIDATION_DURATION_S: float = 10.0
+# Step the lone validation particle in closed form instead of through the N-body integrator.
+# Much cheaper (useful for long dt sweeps), but then the run no longer exercises the integrator under test
+VALIDATION_CLOSED_FORM_STEP: bool = False
 
 # Visualization color for theoretical trajectory overlay
 COLOR_THEORY_TRAJECTORY: tuple[int, int, int] = (230, 230, 80)
@@ -3,29 +3,37 @@ from __future__ import annotations
 from electrosim.rendering.primitives import (
 	world_vector_to_screen,
 	screen_vector_to_world,
+	project_positions,
 	draw_meter_grid,
 	draw_glow_at_screen_pos,
+	precompute_glow_atlas,
 )
 from electrosim.rendering.particles import (
 	draw_particles,
 	draw_velocity_vectors, 
 	draw_force_vectors, 
 	draw_particle_glows, 
+	draw_particle_layers,
 )
 from electrosim.rendering.field import draw_field_grid
-from electrosim.rendering.trails import draw_trails
-from electrosim.rendering.overlay import draw_overlay
+from electrosim.rendering.trails import draw_trails, invalidate_trail_cache
+from electrosim.rendering.overlay import draw_overlay, warm_overlay_text
 
 __all__ = [
 	"world_vector_to_screen",
 	"screen_vector_to_world",
+	"project_positions",
 	"draw_meter_grid",
 	"draw_glow_at_screen_pos",
+	"precompute_glow_atlas",
 	"draw_particles",
 	"draw_velocity_vectors",
 	"draw_force_vectors",
 	"draw_particle_glows",
+	"draw_particle_layers",
 	"draw_field_grid",
 	"draw_trails",
+	"invalidate_trail_cache",
 	"draw_overlay",
+	"warm_overlay_text",
 ]
\ No newline at end of file
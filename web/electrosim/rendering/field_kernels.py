@@ -0,0 +1,63 @@
+"""Numba kernels for the per-cell math of the field-arrow renderer.
+
+Without Numba (e.g. the Pyodide build) `KERNELS_AVAILABLE` is False and the
+caller keeps its vectorized NumPy path.
+"""
+from __future__ import annotations
+
+import numpy as np
+try:
+	from numba import njit
+	KERNELS_AVAILABLE = True
+except Exception:
+	KERNELS_AVAILABLE = False
+
+
+if KERNELS_AVAILABLE:
+
+	@njit(cache=True, error_model="numpy", boundscheck=False)
+	def brightness_arrows(
+		E: np.ndarray,
+		base_rgb: np.ndarray,
+		vector_scale: float,
+		brightness_scale: float,
+		max_length_px: float,
+		fixed_length_px: float,
+		alpha_min: int,
+	):
+		"""Return `(idx, rgba, vec_px)` for the brightness-mode arrows worth drawing.
+
+		`idx` (K,) indexes the cells of `E` (M, 2) that pass `|E| > 1e-9` and
+		`alpha >= alpha_min`, `rgba` (K, 4) holds their colors (the base color
+		dimmed by brightness t, then mixed toward white with strength) and
+		`vec_px` (K, 2) the fixed-length arrow vectors. Same rounding as the
+		NumPy path in `draw_field_grid`.
+		"""
+		M = E.shape[0]
+		idx = np.empty(M, dtype=np.int64)
+		rgba = np.empty((M, 4), dtype=np.int64)
+		vec_px = np.empty((M, 2))
+		white_at = max_length_px * 4.5
+		k = 0
+		for m in range(M):
+			ex = np.float64(E[m, 0])
+			ey = np.float64(E[m, 1])
+			mag = np.hypot(ex, ey)
+			if not mag > 1e-9:
+				continue
+			pix_strength = vector_scale * mag
+			t = min(1.0, max(0.0, brightness_scale * pix_strength / max_length_px))
+			alpha = np.rint(255.0 * t)
+			if alpha < alpha_min:
+				continue
+			wm = min(1.0, max(0.0, pix_strength / white_at))
+			for c in range(3):
+				dimmed = np.rint(base_rgb[c] * t)
+				rgba[k, c] = int(min(255.0, max(0.0, np.rint(dimmed * (1.0 - wm) + 255.0 * wm))))
+			rgba[k, 3] = int(alpha)
+			scale = fixed_length_px / mag
+			vec_px[k, 0] = ex * scale
+			vec_px[k, 1] = ey * scale
+			idx[k] = m
+			k += 1
+		return idx[:k], rgba[:k], vec_px[:k]
@@ -0,0 +1,38 @@
+"""Numba kernel that rasterizes the radial glow sprites.
+
+Without Numba (e.g. the Pyodide build) `KERNELS_AVAILABLE` is False and
+`primitives.glow_sprite` keeps its NumPy lookup-table path.
+"""
+from __future__ import annotations
+
+import numpy as np
+try:
+	from numba import njit, prange
+	KERNELS_AVAILABLE = True
+except Exception:
+	KERNELS_AVAILABLE = False
+
+
+if KERNELS_AVAILABLE:
+
+	@njit(cache=True, parallel=True, error_model="numpy", boundscheck=False)
+	def glow_bgra(color_rgb: np.ndarray, outer_radius_px: int, alpha_center: int, out: np.ndarray) -> None:
+		"""Write the `(h, w, 4)` uint8 BGRA pixels of a glow of `outer_radius_px` into `out`.
+
+		One fused pass per pixel: falloff `clip(1 - r/R, 0, 1)^3` from the integer
+		offset to the sprite center, then the color channels and alpha scaled by
+		it and truncated to uint8, matching the NumPy path bit for bit.
+		"""
+		size = 2 * outer_radius_px + 2
+		c = outer_radius_px + 1
+		r_out = float(outer_radius_px)
+		for row in prange(size):
+			dy = row - c
+			for col in range(size):
+				dx = col - c
+				t = min(1.0, max(0.0, 1.0 - np.sqrt(float(dx * dx + dy * dy)) / r_out))
+				falloff = t ** 3
+				out[row, col, 0] = np.uint8(int(color_rgb[2] * falloff))
+				out[row, col, 1] = np.uint8(int(color_rgb[1] * falloff))
+				out[row, col, 2] = np.uint8(int(color_rgb[0] * falloff))
+				out[row, col, 3] = np.uint8(int(alpha_center * falloff))
@@ -1,11 +1,52 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+from typing import Tuple
+
 import pygame
 
 from electrosim import config
 
+# Rendered text lines keyed by (font, text, color), least recently used first. Keying on the
+# font object keeps it alive, so a new font can never reuse a cached font's id
+_TEXT_CACHE: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+_TEXT_CACHE_MAX = 256
+
+# Help lines that never change, built once at import instead of on every frame
+_HELP_LINES = (
+	"Controls: LMB=place, Shift=negative, Alt/Ctrl=fixed, P=pause, R=reset, C=clear, Esc=exit",
+	"Editing: click=select, drag selected=move; Q/W charge, A/S mass, Z/X radius, Space=fixed, Delete=remove",
+	"Show/Hide: G grid (meters), F forces, V velocities, E electric field, T trajectories, O overlay, I info tooltip, 1..4 speed",
+)
+_VALIDATION_HINT = "Validation: U = uniform electric field (10 s)"
+_CREDITS_TEXT = "Created by Danny Luna | dannyq@uninorte.edu.co"
+
+
+def render_text_cached(font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+	"""Return `font.render(text, True, color)`, rasterizing each distinct line only once.
+
+	Shared by the overlay and the hover tooltip.
+	"""
+	key = (font, text, tuple(color))
+	surf = _TEXT_CACHE.get(key)
+	if surf is None:
+		surf = font.render(text, True, color)
+		_TEXT_CACHE[key] = surf
+		if len(_TEXT_CACHE) > _TEXT_CACHE_MAX:
+			_TEXT_CACHE.popitem(last=False)
+	else:
+		_TEXT_CACHE.move_to_end(key)
+	return surf
+
+
+def warm_overlay_text(font: pygame.font.Font) -> None:
+	"""Render the credits and static help lines into the text cache ahead of the first frame."""
+	for text in (_CREDITS_TEXT, *_HELP_LINES, _VALIDATION_HINT):
+		render_text_cached(font, text, config.OVERLAY_TEXT_COLOR)
+		render_text_cached(font, text, config.OVERLAY_SHADOW_COLOR)
 
-def draw_overlay(screen: pygame.Surface, font: pygame.font.Font, sim_state: dict, overlay_enabled: bool = True) -> None:
+
+def draw_overlay(screen: pygame.Surface, font: pygame.font.Font, sim_state: dict, overlay_enabled: bool = True) -> pygame.Rect:
 	"""Render a multi-line overlay with FPS, counts, energies, and controls.
  
 	Parameters
@@ -19,38 +60,48 @@ def draw_overlay(screen: pygame.Surface, font: pygame.font.Font, sim_state: dict
 		and optional profiling timings under key `profile`.
 	overlay_enabled : bool
 		Whether to render the overlay. If False, nothing is drawn.
+
+	Returns
+	-------
+	pygame.Rect
+		Bounding box of everything blitted, for partial `pygame.display.update` calls.
 	"""
-	credits_text = "Created by Danny Luna | dannyq@uninorte.edu.co"
-	credits_render = font.render(credits_text, True, config.OVERLAY_TEXT_COLOR)
-	credits_shadow = font.render(credits_text, True, config.OVERLAY_SHADOW_COLOR)
+	credits_render = render_text_cached(font, _CREDITS_TEXT, config.OVERLAY_TEXT_COLOR)
+	credits_shadow = render_text_cached(font, _CREDITS_TEXT, config.OVERLAY_SHADOW_COLOR)
 	screen_width = screen.get_width()
 	credits_x = screen_width - credits_render.get_width() - 10
 	credits_y = 45
-	screen.blit(credits_shadow, (credits_x + config.OVERLAY_SHADOW_OFFSET[0], credits_y + config.OVERLAY_SHADOW_OFFSET[1]))
-	screen.blit(credits_render, (credits_x, credits_y))
+	shadow_dx, shadow_dy = config.OVERLAY_SHADOW_OFFSET
+	# Shadow/text pairs are collected and submitted in one `blits` call
+	blit_seq = [
+		(credits_shadow, (credits_x + shadow_dx, credits_y + shadow_dy)),
+		(credits_render, (credits_x, credits_y)),
+	]
 
 	if not overlay_enabled:
-		return
+		rects = screen.blits(blit_seq)
+		return rects[0].unionall(rects[1:])
 	
-	lines = []
-	lines.append(f"FPS: {sim_state['fps']:.1f}")
-	lines.append(f"Particles: {sim_state['n']}")
-	lines.append(f"Speed: {sim_state['speed_label']}")
-	lines.append(f"dt: {sim_state['dt_s']:.4f} s  substeps/frame: {sim_state['substeps']}")
-	lines.append(f"E_kin: {sim_state['E_kin']:.3e} J  E_pot_elec: {sim_state['E_pot']:.3e} J  E_tot: {sim_state['E_tot']:.3e} J")
-	if getattr(config, "PROFILE_OVERLAY_ENABLED", False):
+	lines = [
+		f"FPS: {sim_state['fps']:.1f}",
+		f"Particles: {sim_state['n']}",
+		f"Speed: {sim_state['speed_label']}",
+		f"dt: {sim_state['dt_s']:.4f} s  substeps/frame: {sim_state['substeps']}",
+		f"E_kin: {sim_state['E_kin']:.3e} J  E_pot_elec: {sim_state['E_pot']:.3e} J  E_tot: {sim_state['E_tot']:.3e} J",
+	]
+	if config.PROFILE_OVERLAY_ENABLED:
 		prof = sim_state.get("profile")
 		if prof:
 			lines.append(
 				f"performance (ms): physics={prof.get('physics_ms',0):.1f} field={prof.get('field_ms',0):.1f} draw={prof.get('draw_ms',0):.1f} total={prof.get('total_ms',0):.1f}"
 			)
-	lines.append("Controls: LMB=place, Shift=negative, Alt/Ctrl=fixed, P=pause, R=reset, C=clear, Esc=exit")
-	lines.append("Editing: click=select, drag selected=move; Q/W charge, A/S mass, Z/X radius, Space=fixed, Delete=remove")
-	lines.append("Show/Hide: G grid (meters), F forces, V velocities, E electric field, T trajectories, O overlay, I info tooltip, 1..4 speed")
 	mode_label = "Fixed brightness" if config.FIELD_VIS_MODE == "brightness" else "Variable length"
-	lines.append(f"Electric field (M): mode = {mode_label}")
-	lines.append(f"Particle glow: B Show/Hide (state: {'ON' if config.GLOW_ENABLED else 'OFF'})")
-	lines.append("Validation: U = uniform electric field (10 s)")
+	lines.extend((
+		*_HELP_LINES,
+		f"Electric field (M): mode = {mode_label}",
+		f"Particle glow: B Show/Hide (state: {'ON' if config.GLOW_ENABLED else 'OFF'})",
+		_VALIDATION_HINT,
+	))
 
 	# Validation summary
 	val = sim_state.get("validation")
@@ -61,8 +112,10 @@ def draw_overlay(screen: pygame.Surface, font: pygame.font.Font, sim_state: dict
 		dt = float(val.get("dt_s", 0.0))
 		pos_err = float(val.get("pos_err", 0.0))
 		vel_err = float(val.get("vel_err", 0.0))
-		lines.append(f"Validation: E=({E[0]:.2f},{E[1]:.2f}) N/C  a=({a[0]:.2f},{a[1]:.2f}) m/s^2")
-		lines.append(f"t={t:.2f} s  dt={dt:.4f} s  |pos_err|={pos_err:.3e}  |vel_err|={vel_err:.3e}")
+		lines.extend((
+			f"Validation: E=({E[0]:.2f},{E[1]:.2f}) N/C  a=({a[0]:.2f},{a[1]:.2f}) m/s^2",
+			f"t={t:.2f} s  dt={dt:.4f} s  |pos_err|={pos_err:.3e}  |vel_err|={vel_err:.3e}",
+		))
 		# Final comparison if available
 		if val.get("reached_end"):
 			pth = val.get("pos_th")
@@ -76,10 +129,12 @@ def draw_overlay(screen: pygame.Surface, font: pygame.font.Font, sim_state: dict
 
 	y = 45
 	for text in lines:
-		render = font.render(text, True, config.OVERLAY_TEXT_COLOR)
-		shadow = font.render(text, True, config.OVERLAY_SHADOW_COLOR)
-		screen.blit(shadow, (10 + config.OVERLAY_SHADOW_OFFSET[0], y + config.OVERLAY_SHADOW_OFFSET[1]))
-		screen.blit(render, (10, y))
+		render = render_text_cached(font, text, config.OVERLAY_TEXT_COLOR)
+		shadow = render_text_cached(font, text, config.OVERLAY_SHADOW_COLOR)
+		blit_seq.append((shadow, (10 + shadow_dx, y + shadow_dy)))
+		blit_seq.append((render, (10, y)))
 		y += render.get_height() + 2
+	rects = screen.blits(blit_seq)
+	return rects[0].unionall(rects[1:])
 
 
@@ -1,13 +1,12 @@
 from __future__ import annotations
 
-from typing import Iterable, Optional, Tuple
+from typing import Iterable, Tuple
 
 import numpy as np
 import pygame
 
 from electrosim import config
 from electrosim.simulation.engine import Particle
-from electrosim.rendering.primitives import world_vector_to_screen
 
 _TRAILS_SURF_CACHE: dict[tuple[int, int], pygame.Surface] = {}
 
@@ -15,80 +14,113 @@ _TRAILS_SURF_CACHE: dict[tuple[int, int], pygame.Surface] = {}
 def _get_trails_surface(width_px: int, height_px: int) -> pygame.Surface:
 	key = (width_px, height_px)
 	surf = _TRAILS_SURF_CACHE.get(key)
-	if surf is None or surf.get_width() != width_px or surf.get_height() != height_px:
-		surf = pygame.Surface((width_px, height_px), pygame.SRCALPHA)
+	if surf is None:
+		surf = pygame.Surface(key, pygame.SRCALPHA)
 		_TRAILS_SURF_CACHE[key] = surf
 	else:
 		surf.fill((0, 0, 0, 0))
 	return surf
 
 
+def invalidate_trail_cache() -> None:
+	"""Drop cached trail surfaces, e.g. after the window is resized."""
+	_TRAILS_SURF_CACHE.clear()
+
+
+def _trail_runs(keys: np.ndarray) -> Iterable[Tuple[int, int, int]]:
+	"""Split per-segment bucket keys into `(start, stop, key)` runs of equal key.
+
+	Segments with a negative key (wrap jumps, fully faded) are dropped.
+	"""
+	if keys.size == 0:
+		return []
+	breaks = np.nonzero(keys[1:] != keys[:-1])[0] + 1
+	starts = np.concatenate(([0], breaks))
+	stops = np.concatenate((breaks, [keys.size]))
+	return [(a, b, k) for a, b, k in zip(starts.tolist(), stops.tolist(), keys[starts].tolist()) if k >= 0]
+
+
+def _edge_polylines(run: np.ndarray, half_width: float) -> Tuple[list, list]:
+	"""Offset a screen polyline by `half_width` along its vertex normals on both sides."""
+	pts = run.astype(np.float64)
+	tangent = np.gradient(pts, axis=0)
+	norm = np.hypot(tangent[:, 0], tangent[:, 1])
+	norm[norm == 0.0] = 1.0
+	offset = np.stack([-tangent[:, 1], tangent[:, 0]], axis=1) * (half_width / norm)[:, None]
+	return (pts + offset).tolist(), (pts - offset).tolist()
+
+
 def draw_trails(screen: pygame.Surface, particles: Iterable[Particle], pixels_per_meter: float) -> None:
-	"""Render faded line segments approximating recent particle trajectories."""
+	"""Render faded line segments approximating recent particle trajectories.
+
+	Each history is transformed to screen space in one vectorized pass, split at
+	wrap-around jumps, and drawn as polylines grouped into `TRAIL_ALPHA_BUCKETS`
+	opacity levels instead of one draw call per segment. Thick trails get
+	anti-aliased borders from `pygame.draw.aalines` along both sides of the core.
+	"""
 	width_px = config.WINDOW_WIDTH_PX
 	height_px = config.WINDOW_HEIGHT_PX
 	max_dx = width_px // 2
 	max_dy = height_px // 2
+	buckets = max(1, int(config.TRAIL_ALPHA_BUCKETS))
+	fade_s = float(config.TRAIL_FADE_SECONDS)
+	core_width = max(1, int(config.TRAIL_WIDTH_PX))
+	half_width = 0.5 * core_width
+	# Oldest age still rounding to TRAIL_MIN_ALPHA (slightly generous; the exact test runs per segment)
+	min_w = (config.TRAIL_MIN_ALPHA - 0.5) / max(1, config.TRAIL_ALPHA_MAX)
+	max_visible_age_s = (1.0 - min_w) * fade_s
+	# Per-bucket opacity lookup, built once per frame and shared by every particle
+	alpha_lut = np.rint(config.TRAIL_ALPHA_MAX * np.arange(1, buckets + 1) / buckets).astype(np.int64).tolist()
 
 	trails_surface = _get_trails_surface(width_px, height_px)
 
 	for p in particles:
-		if not p.history:
+		if len(p.history) < 2:
 			continue
 		if abs(p.charge_c) <= config.NEUTRAL_CHARGE_EPS:
 			base_rgb = config.COLOR_NEUTRAL
 		else:
 			base_rgb = config.COLOR_TRAIL_POS if p.charge_c > 0 else config.COLOR_TRAIL_NEG
 
-		t_now = p.history[-1][0]
-
-		prev_pt: Optional[Tuple[int, int]] = None
-		prev_t: Optional[float] = None
-		for (t, xy) in p.history:
-			pt = world_vector_to_screen(np.array([xy[0], xy[1]]), pixels_per_meter)
-			if prev_pt is not None and prev_t is not None:
-				dx = abs(pt[0] - prev_pt[0])
-				dy = abs(pt[1] - prev_pt[1])
-				if dx > max_dx or dy > max_dy:
-					prev_pt = pt
-					prev_t = t
-					continue
-
-				age = max(0.0, float(t_now - t))
-				if config.TRAIL_FADE_SECONDS > 1e-9:
-					w = max(0.0, min(1.0, 1.0 - age / float(config.TRAIL_FADE_SECONDS)))
-				else:
-					w = 1.0
-				alpha_core = int(round(config.TRAIL_ALPHA_MAX * w))
-				if alpha_core >= config.TRAIL_MIN_ALPHA:
-					alpha_edge = int(round(alpha_core * config.TRAIL_AA_EDGE_OPACITY_FACTOR))
-					if alpha_edge > 0:
-						color_edge = (base_rgb[0], base_rgb[1], base_rgb[2], alpha_edge)
-						pygame.draw.line(
-							trails_surface,
-							color_edge,
-							prev_pt,
-							pt,
-							config.TRAIL_WIDTH_PX + 2 * config.TRAIL_AA_EDGE_EXTEND_PX,
-						)
-					color_core = (base_rgb[0], base_rgb[1], base_rgb[2], alpha_core)
-					pygame.draw.line(
-						trails_surface,
-						color_core,
-						prev_pt,
-						pt,
-						config.TRAIL_WIDTH_PX,
-					)
-
-			prev_pt = pt
-			prev_t = t
+		t_hist, _ = p.history.arrays()
+		pts = p.history.screen_points(pixels_per_meter)
+		if fade_s > 1e-9:
+			# Fade is monotonic in age, so fully faded samples form a prefix; skip it up front
+			first = int(np.searchsorted(t_hist, t_hist[-1] - max_visible_age_s, side="left"))
+			start = max(0, first - 1)
+			if len(t_hist) - start < 2:
+				continue
+			t_hist = t_hist[start:]
+			pts = pts[start:]
+
+		# Segment j joins points j and j+1 and takes its age from the newer end
+		step = np.abs(np.diff(pts, axis=0))
+		jump = (step[:, 0] > max_dx) | (step[:, 1] > max_dy)
+		age = np.maximum(0.0, t_hist[-1] - t_hist[1:])
+		if fade_s > 1e-9:
+			w = np.clip(1.0 - age / fade_s, 0.0, 1.0)
+		else:
+			w = np.ones_like(age)
+		visible = ~jump & (np.rint(config.TRAIL_ALPHA_MAX * w) >= config.TRAIL_MIN_ALPHA)
+		keys = np.where(visible, np.minimum((w * buckets).astype(np.int64), buckets - 1), -1)
+
+		for a, b, k in _trail_runs(keys):
+			run = pts[a:b + 1]
+			color = (base_rgb[0], base_rgb[1], base_rgb[2], alpha_lut[k])
+			if core_width == 1:
+				pygame.draw.aalines(trails_surface, color, False, run.tolist())
+				continue
+			pygame.draw.lines(trails_surface, color, False, run.tolist(), core_width)
+			left, right = _edge_polylines(run, half_width)
+			pygame.draw.aalines(trails_surface, color, False, left)
+			pygame.draw.aalines(trails_surface, color, False, right)
 
 	screen.blit(trails_surface, (0, 0))
 
 
 def draw_polyline_world(
 	screen: pygame.Surface,
-	points_world: Iterable[tuple[float, float]],
+	points_world: Iterable[tuple[float, float]] | np.ndarray,
 	color_rgb: tuple[int, int, int],
 	width_px: int,
 	pixels_per_meter: float,
@@ -99,7 +131,7 @@ def draw_polyline_world(
 	----------
 	screen : pygame.Surface
 		Target surface.
-	points_world : Iterable[tuple[float, float]]
+	points_world : Iterable[tuple[float, float]] or numpy.ndarray shape (T, 2)
 		Sequence of (x, y) in meters.
 	color_rgb : tuple[int,int,int]
 		Polyline color.
@@ -108,10 +140,12 @@ def draw_polyline_world(
 	pixels_per_meter : float
 		Pixels-per-meter scale.
 	"""
-	pts_screen: list[tuple[int, int]] = []
-	for (x, y) in points_world:
-		pts_screen.append(world_vector_to_screen(np.array([float(x), float(y)]), pixels_per_meter))
-	if len(pts_screen) >= 2:
+	# One batched transform instead of a temporary array per point
+	if not isinstance(points_world, np.ndarray):
+		points_world = list(points_world)
+	pts_world = np.asarray(points_world, dtype=np.float64).reshape(-1, 2)
+	if pts_world.shape[0] >= 2:
+		pts_screen = np.rint(pts_world * pixels_per_meter).astype(np.int32).tolist()
 		pygame.draw.lines(screen, color_rgb, False, pts_screen, max(1, int(width_px)))
 
 
@@ -1,6 +1,8 @@
 """Simulation core for ElectroSim."""
 
 __all__ = [
+	"bh",
 	"engine",
 	"physics",
+	"physics_gpu",
 ]
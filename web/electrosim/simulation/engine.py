@@ -1,31 +1,355 @@
 from __future__ import annotations
 
-from collections import deque
-from dataclasses import dataclass, field
-from typing import Deque, List, Optional, Tuple
+import math
+from typing import Callable, Iterator, List, Optional, Tuple
 
 import numpy as np
 
 from electrosim import config
+from electrosim.simulation import physics_gpu as _gpu
 from electrosim.simulation.physics import (
+	advance_substep,
 	compute_accelerations,
-	minimum_image_displacement,
+	minimum_image_displacement_batch,
 	resolve_collisions,
-	rk4_integrate, 
-	total_kinetic_energy,
-	total_potential_energy,
+	total_energies,
 	wrap_position_in_place,
+	wrap_positions_in_place,
 )
 
 
-@dataclass
+# Shared read-only fallback for missing validation vectors
+_ZERO2 = np.zeros(2, dtype=float)
+_ZERO2.flags.writeable = False
+
+
+def _default_trail_capacity() -> int:
+	"""Samples needed to hold `TRAJECTORY_HISTORY_SECONDS` at one sample per frame, plus slack."""
+	return int(math.ceil(config.TRAJECTORY_HISTORY_SECONDS * config.FPS_TARGET)) + 2
+
+
+def _clamp(x: float, lo: float, hi: float) -> float:
+	"""Clamp a Python float to [lo, hi] without a NumPy ufunc round-trip."""
+	return lo if x < lo else hi if x > hi else x
+
+
+class TrailStore:
+	"""Ring buffers of time-stamped positions for all particles at once.
+
+	Row `i` holds the trail of particle `i`: `float64` times, `float32` world
+	positions and a cached `int32` screen-space copy, each of shape
+	`(rows, length[, 2])`, with per-row `head` (next write slot), `count` and
+	`last_t`. Empty slots carry `t = +inf`, so pruning is a single comparison
+	over the whole table. When a row is full, the oldest sample is overwritten.
+
+	Parameters
+	----------
+	rows : int
+		Number of trail rows (particle capacity).
+	length : int
+		Samples per row.
+	"""
+	def __init__(self, rows: int, length: int) -> None:
+		self.length = max(2, int(length))
+		rows = max(1, int(rows))
+		self.t = np.full((rows, self.length), np.inf, dtype=np.float64)
+		self.xy = np.zeros((rows, self.length, 2), dtype=np.float32)
+		self.px = np.zeros((rows, self.length, 2), dtype=np.int32)
+		self.head = np.zeros(rows, dtype=np.int64)
+		self.count = np.zeros(rows, dtype=np.int64)
+		self.last_t = np.full(rows, -np.inf, dtype=np.float64)
+		# Scale the `px` table was computed for (None until first requested)
+		self.px_ppm: Optional[float] = None
+
+	def grow(self, rows: int) -> None:
+		"""Enlarge to `rows` rows, keeping existing trails."""
+		old_rows = self.t.shape[0]
+		if rows <= old_rows:
+			return
+		for name, fill in (("t", np.inf), ("xy", 0), ("px", 0), ("head", 0), ("count", 0), ("last_t", -np.inf)):
+			old = getattr(self, name)
+			buf = np.full((rows,) + old.shape[1:], fill, dtype=old.dtype)
+			buf[:old_rows] = old
+			setattr(self, name, buf)
+
+	def append(self, rows: np.ndarray, t: float, xy: np.ndarray) -> None:
+		"""Append one sample at time `t` to each of `rows`, with positions `xy` (len(rows), 2)."""
+		slots = self.head[rows]
+		self.t[rows, slots] = t
+		self.xy[rows, slots] = xy
+		if self.px_ppm is not None:
+			self.px[rows, slots] = np.rint(self.xy[rows, slots] * self.px_ppm)
+		self.head[rows] = (slots + 1) % self.length
+		self.count[rows] = np.minimum(self.count[rows] + 1, self.length)
+		self.last_t[rows] = t
+
+	def prune(self, n: int, t_now: float, max_age_s: float) -> None:
+		"""Drop samples older than `max_age_s` from the first `n` rows."""
+		t = self.t[:n]
+		stale = t < (t_now - max_age_s)
+		if stale.any():
+			self.count[:n] -= stale.sum(axis=1)
+			t[stale] = np.inf
+
+	def clear_row(self, row: int) -> None:
+		self.t[row] = np.inf
+		self.head[row] = 0
+		self.count[row] = 0
+		self.last_t[row] = -np.inf
+
+	def copy_row(self, src: int, dst: int) -> None:
+		"""Replace trail `dst` with a copy of trail `src`."""
+		for buf in (self.t, self.xy, self.px, self.head, self.count, self.last_t):
+			buf[dst] = buf[src]
+
+	def copy_rows(self, src: np.ndarray, dst: np.ndarray) -> None:
+		"""Replace trails `dst` with copies of trails `src` (index arrays of equal length)."""
+		for buf in (self.t, self.xy, self.px, self.head, self.count, self.last_t):
+			buf[dst] = buf[src]
+
+	def clear_rows(self, start: int, stop: int) -> None:
+		"""Empty rows `start` to `stop - 1`."""
+		self.t[start:stop] = np.inf
+		self.head[start:stop] = 0
+		self.count[start:stop] = 0
+		self.last_t[start:stop] = -np.inf
+
+	def ensure_screen_points(self, pixels_per_meter: float) -> None:
+		"""Recompute the cached screen-space table if the scale changed."""
+		ppm = float(pixels_per_meter)
+		if ppm != self.px_ppm:
+			np.rint(self.xy * ppm, out=self.px, casting="unsafe")
+			self.px_ppm = ppm
+
+	def ordered(self, buf: np.ndarray, row: int) -> np.ndarray:
+		"""Return row `row` of `buf` ordered oldest to newest (a view when contiguous)."""
+		count = int(self.count[row])
+		start = (int(self.head[row]) - count) % self.length
+		stop = start + count
+		if stop <= self.length:
+			return buf[row, start:stop]
+		return np.concatenate((buf[row, start:], buf[row, :stop - self.length]))
+
+
+class TrailBuffer:
+	"""View of one particle's trail inside a `TrailStore`.
+
+	Like `Particle`, a view refers to a row index and must not be kept across
+	particle additions or removals.
+	"""
+	__slots__ = ("_store", "_row")
+
+	def __init__(self, store: TrailStore, row: int) -> None:
+		self._store = store
+		self._row = row
+
+	def __len__(self) -> int:
+		return int(self._store.count[self._row])
+
+	def __iter__(self) -> Iterator[Tuple[float, Tuple[float, float]]]:
+		t, xy = self.arrays()
+		for ti, (x, y) in zip(t.tolist(), xy.tolist()):
+			yield ti, (x, y)
+
+	def append(self, t: float, x: float, y: float) -> None:
+		"""Store a sample at time `t`, overwriting the oldest one when full."""
+		self._store.append(np.array([self._row]), t, np.array([[x, y]]))
+
+	def last_time(self) -> float:
+		"""Return the time of the newest sample. The buffer must not be empty."""
+		return float(self._store.last_t[self._row])
+
+	def clear(self) -> None:
+		"""Remove all samples."""
+		self._store.clear_row(self._row)
+
+	def arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+		"""Return `(t (T,), xy (T,2))` ordered oldest to newest.
+
+		These are views into the store when the samples are contiguous and copies
+		when they wrap around the end; callers must not modify them.
+		"""
+		store = self._store
+		return store.ordered(store.t, self._row), store.ordered(store.xy, self._row)
+
+	def screen_points(self, pixels_per_meter: float) -> np.ndarray:
+		"""Return integer screen points `(T,2)` ordered oldest to newest.
+
+		Points are converted once when appended; the whole store is only
+		reconverted when `pixels_per_meter` differs from the cached scale.
+		"""
+		self._store.ensure_screen_points(pixels_per_meter)
+		return self._store.ordered(self._store.px, self._row)
+
+
+def physics_dtype() -> np.dtype:
+	"""Float type for particle state selected by `config.PRECISION` (`"f32"` or `"f64"`)."""
+	return np.dtype(np.float32 if config.PRECISION == "f32" else np.float64)
+
+
+class ParticleSoA:
+	"""Structure-of-arrays storage for all particles.
+
+	Hot physics state lives in contiguous NumPy arrays so kernels can consume it
+	directly; colors live in a sidecar Python list and trails in a `TrailStore`
+	with one row per particle. Only the first `n` rows of each array are active,
+	and the `pos`/`vel`/... properties return views of exactly those rows.
+
+	Parameters
+	----------
+	capacity : int
+		Initial number of rows to allocate. Storage grows on demand.
+	dtype : numpy.dtype, optional
+		Float type of the physics arrays. Defaults to the one selected by
+		`config.PRECISION`.
+	"""
+	def __init__(self, capacity: int, dtype: Optional[np.dtype] = None) -> None:
+		capacity = max(1, int(capacity))
+		dtype = np.dtype(dtype if dtype is not None else physics_dtype())
+		self.n: int = 0
+		self._pos = np.zeros((capacity, 2), dtype=dtype)
+		self._vel = np.zeros((capacity, 2), dtype=dtype)
+		self._mass = np.zeros(capacity, dtype=dtype)
+		self._charge = np.zeros(capacity, dtype=dtype)
+		self._radius = np.zeros(capacity, dtype=dtype)
+		self._fixed = np.zeros(capacity, dtype=np.bool_)
+		self.colors: List[Tuple[int, int, int]] = []
+		self.trails = TrailStore(capacity, _default_trail_capacity())
+		# Bumped on every add/remove so cached per-index views can be rebuilt
+		self.version: int = 0
+
+	@property
+	def capacity(self) -> int:
+		return self._pos.shape[0]
+
+	@property
+	def pos(self) -> np.ndarray:
+		"""Active positions (m), shape (n, 2)."""
+		return self._pos[:self.n]
+
+	@property
+	def vel(self) -> np.ndarray:
+		"""Active velocities (m/s), shape (n, 2)."""
+		return self._vel[:self.n]
+
+	@property
+	def mass(self) -> np.ndarray:
+		"""Active masses (kg), shape (n,)."""
+		return self._mass[:self.n]
+
+	@property
+	def charge(self) -> np.ndarray:
+		"""Active charges (C), shape (n,)."""
+		return self._charge[:self.n]
+
+	@property
+	def radius(self) -> np.ndarray:
+		"""Active radii (m), shape (n,)."""
+		return self._radius[:self.n]
+
+	@property
+	def fixed(self) -> np.ndarray:
+		"""Active fixed flags, shape (n,)."""
+		return self._fixed[:self.n]
+
+	def _grow(self) -> None:
+		new_cap = 2 * self.capacity
+		for name in ("_pos", "_vel", "_mass", "_charge", "_radius", "_fixed"):
+			old = getattr(self, name)
+			buf = np.zeros((new_cap,) + old.shape[1:], dtype=old.dtype)
+			buf[:self.n] = old[:self.n]
+			setattr(self, name, buf)
+		self.trails.grow(new_cap)
+
+	def add(
+		self,
+		pos_m: np.ndarray,
+		vel_mps: np.ndarray,
+		mass_kg: float,
+		charge_c: float,
+		radius_m: float,
+		fixed: bool,
+		color_rgb: Tuple[int, int, int],
+	) -> int:
+		"""Append a particle and return its index."""
+		if self.n >= self.capacity:
+			self._grow()
+		i = self.n
+		self._pos[i] = pos_m
+		self._vel[i] = vel_mps
+		self._mass[i] = mass_kg
+		self._charge[i] = charge_c
+		self._radius[i] = radius_m
+		self._fixed[i] = fixed
+		self.colors.append(color_rgb)
+		self.trails.clear_row(i)
+		self.n += 1
+		self.version += 1
+		return i
+
+	def remove(self, index: int) -> None:
+		"""Remove the particle at `index` in O(1) by moving the last particle into its row.
+
+		The moved particle changes index (and so `id`); other rows are untouched.
+		"""
+		last = self.n - 1
+		if not (0 <= index <= last):
+			return
+		if index != last:
+			for buf in (self._pos, self._vel, self._mass, self._charge, self._radius, self._fixed):
+				buf[index] = buf[last]
+			self.colors[index] = self.colors[last]
+			self.trails.copy_row(last, index)
+		self.colors.pop()
+		self.trails.clear_row(last)
+		self.n = last
+		self.version += 1
+
+	def keep(self, mask: np.ndarray) -> None:
+		"""Remove every particle whose entry in `mask` (bool, shape (n,)) is False.
+
+		Batched form of `remove`: survivors from the tail fill the freed rows below
+		the new count in one vectorized copy per buffer, so only as many rows move
+		as are removed. Moved particles change index; other rows are untouched.
+		"""
+		n = self.n
+		k = int(np.count_nonzero(mask))
+		if k == n:
+			return
+		holes = np.flatnonzero(~mask[:k])
+		movers = k + np.flatnonzero(mask[k:])
+		if holes.size:
+			for buf in (self._pos, self._vel, self._mass, self._charge, self._radius, self._fixed):
+				buf[holes] = buf[movers]
+			for h, m in zip(holes.tolist(), movers.tolist()):
+				self.colors[h] = self.colors[m]
+			self.trails.copy_rows(movers, holes)
+		del self.colors[k:]
+		self.trails.clear_rows(k, n)
+		self.n = k
+		self.version += 1
+
+	def clear(self) -> None:
+		"""Remove all particles."""
+		for i in range(self.n):
+			self.trails.clear_row(i)
+		self.n = 0
+		self.colors.clear()
+		self.version += 1
+
+
 class Particle:
-	"""Simulated charged particle in a 2D periodic domain.
+	"""View of one particle stored in a `ParticleSoA`.
+
+	Reads and writes go straight to the shared arrays; `pos_m` and `vel_mps`
+	are row views, so in-place updates (``p.pos_m += d``) modify the store.
+	A view refers to a slot index, so it must not be kept across particle
+	additions or removals (use `Simulation.particles` again instead).
 
 	Attributes
 	----------
 	id : int
-		Unique identifier within the current particle list.
+		Index of the particle in the current particle list.
 	pos_m : numpy.ndarray shape (2,)
 		Position in meters.
 	vel_mps : numpy.ndarray shape (2,)
@@ -40,18 +364,78 @@ class Particle:
 		If True, particle does not move (treated as infinite mass during collisions).
 	color_rgb : tuple[int, int, int]
 		Display color based on charge sign or neutrality.
-	history : collections.deque[(float, (float, float))]
+	history : TrailBuffer
 		Time-stamped positions for trajectory rendering.
 	"""
-	id: int
-	pos_m: np.ndarray
-	vel_mps: np.ndarray
-	mass_kg: float
-	charge_c: float
-	radius_m: float
-	fixed: bool = False
-	color_rgb: Tuple[int, int, int] = (255, 255, 255)
-	history: Deque[Tuple[float, Tuple[float, float]]] = field(default_factory=lambda: deque(maxlen=50000))
+	__slots__ = ("_soa", "_index")
+
+	def __init__(self, soa: ParticleSoA, index: int) -> None:
+		self._soa = soa
+		self._index = index
+
+	@property
+	def id(self) -> int:
+		return self._index
+
+	@property
+	def pos_m(self) -> np.ndarray:
+		return self._soa._pos[self._index]
+
+	@pos_m.setter
+	def pos_m(self, value: np.ndarray) -> None:
+		self._soa._pos[self._index] = value
+
+	@property
+	def vel_mps(self) -> np.ndarray:
+		return self._soa._vel[self._index]
+
+	@vel_mps.setter
+	def vel_mps(self, value: np.ndarray) -> None:
+		self._soa._vel[self._index] = value
+
+	@property
+	def mass_kg(self) -> float:
+		return float(self._soa._mass[self._index])
+
+	@mass_kg.setter
+	def mass_kg(self, value: float) -> None:
+		self._soa._mass[self._index] = value
+
+	@property
+	def charge_c(self) -> float:
+		return float(self._soa._charge[self._index])
+
+	@charge_c.setter
+	def charge_c(self, value: float) -> None:
+		self._soa._charge[self._index] = value
+
+	@property
+	def radius_m(self) -> float:
+		return float(self._soa._radius[self._index])
+
+	@radius_m.setter
+	def radius_m(self, value: float) -> None:
+		self._soa._radius[self._index] = value
+
+	@property
+	def fixed(self) -> bool:
+		return bool(self._soa._fixed[self._index])
+
+	@fixed.setter
+	def fixed(self, value: bool) -> None:
+		self._soa._fixed[self._index] = value
+
+	@property
+	def color_rgb(self) -> Tuple[int, int, int]:
+		return self._soa.colors[self._index]
+
+	@color_rgb.setter
+	def color_rgb(self, value: Tuple[int, int, int]) -> None:
+		self._soa.colors[self._index] = value
+
+	@property
+	def history(self) -> TrailBuffer:
+		return TrailBuffer(self._soa.trails, self._index)
 
 
 class Simulation:
@@ -68,7 +452,12 @@ class Simulation:
 		energies, simulation time, and warms Numba acceleration path if available.
 		"""
 		self.world_size_m = np.array([config.WORLD_WIDTH_M, config.WORLD_HEIGHT_M], dtype=float)
-		self.particles: List[Particle] = []
+		self._Lx, self._Ly = self.world_size_m.tolist()
+		# Substep implementation; swapped for a specialized one during validation
+		self._step_fn: Callable[[float], None] = self._step_general
+		self.soa = ParticleSoA(config.MAX_PARTICLES)
+		self._particle_views: List[Particle] = []
+		self._particle_views_version: int = -1
 		self.selected_index: Optional[int] = None
 		self.show_field: bool = False
 		self.show_forces: bool = False
@@ -76,8 +465,13 @@ class Simulation:
 		self.show_trails: bool = True
 		self.show_meter_grid: bool = False
 		self.paused: bool = False
-		self.speed_index: int = 1  # 0.5x, 1x, 2x, 4x at 1x index=1
 		self.substeps_base: int = config.SUBSTEPS_BASE_PER_FRAME
+		# Per-frame constants, cached so step_frame doesn't re-read config every frame
+		self._dt_s: float = float(config.DT_S)
+		self._inv_fps: float = 1.0 / float(config.FPS_TARGET)
+		self.speed_index: int = 1
+		self._substeps: int = 1
+		self.set_speed(1)  # 0.5x, 1x, 2x, 4x at 1x index=1
 		self.energy_kin: float = 0.0
 		self.energy_pot: float = 0.0
 		self.energy_tot: float = 0.0
@@ -85,7 +479,8 @@ class Simulation:
 		self.last_forces: Optional[np.ndarray] = None
 		# Validation state (uniform field case)
 		self.validation_active: bool = False
-		self.validation_theory_traj: List[Tuple[float, Tuple[float, float]]] = []
+		# Analytical trajectory sampled at FPS cadence, positions (T, 2)
+		self.validation_theory_pos_m: np.ndarray = np.empty((0, 2), dtype=float)
 		self.validation_current_errors: dict = {}
 		self.validation_initial_pos_m: Optional[np.ndarray] = None
 		self.validation_initial_vel_mps: Optional[np.ndarray] = None
@@ -96,12 +491,28 @@ class Simulation:
 		self.validation_final_sim_pos_m: Optional[np.ndarray] = None
 		self.validation_final_sim_vel_mps: Optional[np.ndarray] = None
 		self.reset_to_default_scene()
-		# Pre-compile function with Numba at startup
+		# Pre-compile functions with Numba at startup (the substep runs on copies)
 		try:
-			_ = compute_accelerations(self.particles, self.world_size_m, config.SOFTENING_FRACTION)
+			soa = self.soa
+			_ = compute_accelerations(
+				soa.pos, soa.charge, soa.radius, soa.mass, soa.fixed,
+				self.world_size_m, config.SOFTENING_FRACTION,
+			)
+			advance_substep(
+				soa.pos.copy(), soa.vel.copy(), soa.mass, soa.charge, soa.radius, soa.fixed,
+				self.world_size_m, config.DT_S, config.SOFTENING_FRACTION,
+			)
 		except Exception:
 			pass
 
+	@property
+	def particles(self) -> List[Particle]:
+		"""Per-particle views over `soa`, rebuilt only when particles are added or removed."""
+		if self._particle_views_version != self.soa.version:
+			self._particle_views = [Particle(self.soa, i) for i in range(self.soa.n)]
+			self._particle_views_version = self.soa.version
+		return self._particle_views
+
 	def reset_to_default_scene(self) -> None:
 		"""Reset to a single particle at world center with default properties.
 
@@ -123,7 +534,7 @@ class Simulation:
 
 	def clear(self) -> None:
 		"""Remove all particles and reset timers, energies, selection, and forces."""
-		self.particles.clear()
+		self.soa.clear()
 		self.selected_index = None
 		self.t_sim = 0.0
 		self.energy_kin = 0.0
@@ -157,27 +568,25 @@ class Simulation:
 		fixed : bool
 			If True, particle starts fixed.
 		"""
-		if len(self.particles) >= config.MAX_PARTICLES:
+		if self.soa.n >= config.MAX_PARTICLES:
 			return
-		charge_c = float(np.clip(charge_c, config.MIN_CHARGE_C, config.MAX_CHARGE_C))
-		mass_kg = float(np.clip(mass_kg, config.MIN_MASS_KG, config.MAX_MASS_KG))
-		radius_m = float(np.clip(radius_m, config.MIN_RADIUS_M, config.MAX_RADIUS_M))
-		part_id = len(self.particles)
+		charge_c = _clamp(float(charge_c), config.MIN_CHARGE_C, config.MAX_CHARGE_C)
+		mass_kg = _clamp(float(mass_kg), config.MIN_MASS_KG, config.MAX_MASS_KG)
+		radius_m = _clamp(float(radius_m), config.MIN_RADIUS_M, config.MAX_RADIUS_M)
 		if abs(charge_c) <= config.NEUTRAL_CHARGE_EPS:
 			color = config.COLOR_NEUTRAL
 		else:
 			color = config.COLOR_POSITIVE if charge_c > 0 else config.COLOR_NEGATIVE
-		p = Particle(
-			id=part_id,
-			pos_m=np.array(pos_m, dtype=float),
-			vel_mps=np.array(vel_mps, dtype=float),
+		self.soa.add(
+			# Wrapped on entry; integration and collisions keep it wrapped afterwards
+			pos_m=np.mod(np.asarray(pos_m, dtype=float), self.world_size_m),
+			vel_mps=np.asarray(vel_mps, dtype=float),
 			mass_kg=mass_kg,
 			charge_c=charge_c,
 			radius_m=radius_m,
 			fixed=bool(fixed),
 			color_rgb=color,
 		)
-		self.particles.append(p)
 
 	def _update_color(self, p: Particle) -> None:
 		"""Update particle display color from its charge with neutral threshold."""
@@ -196,24 +605,24 @@ class Simulation:
 		"""
 		pixels_per_meter = config.PIXELS_PER_METER
 		world_pos = np.array([px / pixels_per_meter, py / pixels_per_meter], dtype=float)
-		best_idx: Optional[int] = None
-		best_dist_px = 1e9
-		for idx, p in enumerate(self.particles):
-			dis_p = minimum_image_displacement(world_pos, p.pos_m, self.world_size_m)
-			dist_m = float(np.hypot(dis_p[0], dis_p[1]))
-			dist_px = dist_m * pixels_per_meter
-			r_px = p.radius_m * pixels_per_meter
-			if dist_px <= max(6.0, r_px + 6.0) and dist_px < best_dist_px:
-				best_dist_px = dist_px
-				best_idx = idx
-		self.selected_index = best_idx
+		soa = self.soa
+		if soa.n == 0:
+			self.selected_index = None
+			return
+		# Distances to every particle in one pass; pick radius is the body plus a 6 px margin
+		d = minimum_image_displacement_batch(world_pos, soa.pos, self.world_size_m)
+		dist_px = np.hypot(d[:, 0], d[:, 1]) * pixels_per_meter
+		pick_px = np.maximum(6.0, soa.radius * pixels_per_meter + 6.0)
+		dist_px[dist_px > pick_px] = np.inf
+		best_idx = int(np.argmin(dist_px))
+		self.selected_index = best_idx if np.isfinite(dist_px[best_idx]) else None
 
 	def adjust_selected_charge(self, delta_c: float) -> None:
 		"""Adjust charge of selected particle by `delta_c` (C), clamped to config range."""
 		if self.selected_index is None:
 			return
 		p = self.particles[self.selected_index]
-		p.charge_c = float(np.clip(p.charge_c + delta_c, config.MIN_CHARGE_C, config.MAX_CHARGE_C))
+		p.charge_c = _clamp(float(p.charge_c + delta_c), config.MIN_CHARGE_C, config.MAX_CHARGE_C)
 		self._update_color(p)
 
 	def adjust_selected_mass(self, delta_kg: float) -> None:
@@ -221,14 +630,14 @@ class Simulation:
 		if self.selected_index is None:
 			return
 		p = self.particles[self.selected_index]
-		p.mass_kg = float(np.clip(p.mass_kg + delta_kg, config.MIN_MASS_KG, config.MAX_MASS_KG))
+		p.mass_kg = _clamp(float(p.mass_kg + delta_kg), config.MIN_MASS_KG, config.MAX_MASS_KG)
 
 	def adjust_selected_radius(self, delta_m: float) -> None:
 		"""Adjust radius of selected particle by `delta_m` (m), clamped to config range."""
 		if self.selected_index is None:
 			return
 		p = self.particles[self.selected_index]
-		p.radius_m = float(np.clip(p.radius_m + delta_m, config.MIN_RADIUS_M, config.MAX_RADIUS_M))
+		p.radius_m = _clamp(float(p.radius_m + delta_m), config.MIN_RADIUS_M, config.MAX_RADIUS_M)
 
 	def toggle_selected_fixed(self) -> None:
 		"""Toggle fixed/mobile state of the currently selected particle (if any)."""
@@ -238,91 +647,125 @@ class Simulation:
 		p.fixed = not p.fixed
 
 	def remove_selected_particle(self) -> None:
-		"""Remove the selected particle and reassign sequential `id`s to the remainder."""
+		"""Remove the selected particle; the last particle takes its index, so `id`s stay sequential."""
 		if self.selected_index is None:
 			return
-		del self.particles[self.selected_index]
+		self.soa.remove(self.selected_index)
 		self.selected_index = None
-		# Reassign IDs
-		for i, p in enumerate(self.particles):
-			p.id = i
 
 	def recompute_energies(self) -> None:
 		"""Recompute kinetic, potential, and total energies from current state."""
-		self.energy_kin = total_kinetic_energy(self.particles)
-		self.energy_pot = total_potential_energy(self.particles, self.world_size_m)
+		soa = self.soa
+		self.energy_kin, self.energy_pot = total_energies(soa.pos, soa.vel, soa.mass, soa.charge, soa.fixed, self.world_size_m)
 		self.energy_tot = self.energy_kin + self.energy_pot
 
-	def _wrap_all_positions(self) -> None:
-		"""Wrap all particle positions inside the world bounds (periodic domain)."""
-		for p in self.particles:
-			wrap_position_in_place(p.pos_m, self.world_size_m)
-
 	def _ensure_selected_valid(self) -> None:
 		"""Clear `selected_index` if it no longer points to a valid particle."""
-		if self.selected_index is not None and (self.selected_index < 0 or self.selected_index >= len(self.particles)):
+		if self.selected_index is not None and (self.selected_index < 0 or self.selected_index >= self.soa.n):
 			self.selected_index = None
 
 	def _compute_last_forces(self) -> None:
 		"""Compute last per-particle forces for visualization.
 
 		Uses `compute_accelerations` times mass for mobile particles; fixed particles
-		report zero force.
+		report zero force. From `GPU_FORCE_THRESHOLD` particles on, the optional
+		CUDA kernel is tried first and the CPU path is the fallback.
 		"""
-		if len(self.particles) == 0:
+		if self.soa.n == 0:
 			self.last_forces = None
 			return
-		acc = compute_accelerations(self.particles, self.world_size_m, config.SOFTENING_FRACTION)
-		self.last_forces = np.stack([
-			(acc[i] * (0.0 if self.particles[i].fixed else self.particles[i].mass_kg)) for i in range(len(self.particles))
-		], axis=0).reshape((len(self.particles), 2)) if len(self.particles) > 0 else None
-
-	def _advance_time_and_trails(self, dt_s: float) -> None:
-		"""Advance simulation clock and update trajectories at a fixed sampling rate.
-
-		Parameters
-		----------
-		dt_s : float
-			Time step increment (s) to add to `t_sim`.
-		"""
-		self.t_sim += dt_s
-		self.update_trails(sample_interval_s=1.0 / float(config.FPS_TARGET))
+		soa = self.soa
+		if soa.n >= config.GPU_FORCE_THRESHOLD and _gpu.gpu_available():
+			try:
+				uniform_E = tuple(config.UNIFORM_FIELD_VECTOR_NC) if config.UNIFORM_FIELD_ACTIVE else (0.0, 0.0)
+				forces = _gpu.compute_forces_gpu(soa.pos, soa.charge, soa.radius, soa.fixed | (soa.mass <= 0.0), self.world_size_m, config.SOFTENING_FRACTION, config.K_COULOMB, uniform_E)
+				self.last_forces = forces.astype(np.float64)
+				return
+			except Exception:
+				pass
+		acc = compute_accelerations(soa.pos, soa.charge, soa.radius, soa.mass, soa.fixed, self.world_size_m, config.SOFTENING_FRACTION)
+		# F = m a, masked to zero for fixed particles
+		self.last_forces = acc * np.where(soa.fixed, 0.0, soa.mass)[:, None]
 
 	def update_trails(self, sample_interval_s: float) -> None:
 		"""Append particle positions to trails if `sample_interval_s` has elapsed.
 
 		Old entries older than `TRAJECTORY_HISTORY_SECONDS` are pruned.
 		"""
-		for p in self.particles:
-			if not self.show_trails:
-				continue
-			if not p.history:
-				p.history.append((self.t_sim, (float(p.pos_m[0]), float(p.pos_m[1]))))
-				continue
-			last_t = p.history[-1][0]
-			if self.t_sim - last_t >= sample_interval_s:
-				p.history.append((self.t_sim, (float(p.pos_m[0]), float(p.pos_m[1]))))
-
-			# Purge old
-			while p.history and (self.t_sim - p.history[0][0] > config.TRAJECTORY_HISTORY_SECONDS):
-				p.history.popleft()
+		if not self.show_trails:
+			return
+		n = self.soa.n
+		trails = self.soa.trails
+		# Rows that are empty or whose last sample is old enough get one new sample
+		due = (trails.count[:n] == 0) | (self.t_sim - trails.last_t[:n] >= sample_interval_s)
+		rows = np.flatnonzero(due)
+		if rows.size:
+			trails.append(rows, self.t_sim, self.soa.pos[rows])
+
+		# Purge old
+		trails.prune(n, self.t_sim, config.TRAJECTORY_HISTORY_SECONDS)
 
 	def step_substep(self, dt_s: float) -> None:
 		"""Advance the simulation by one substep of duration `dt_s`.
 
-		Performs RK4 integration, wraps positions, resolves collisions, wraps again,
-		and validates selection index.
+		Dispatches through `_step_fn` (the general N-body step, or a closed-form
+		step during single-particle validation) and validates selection index.
 		"""
 		if self.paused:
 			return
-
-		# Integrate motion using RK4
-		rk4_integrate(self.particles, self.world_size_m, dt_s, config.SOFTENING_FRACTION)
-		self._wrap_all_positions()
-		resolve_collisions(self.particles, self.world_size_m)
-		self._wrap_all_positions()
+		self._step_fn(dt_s)
 		self._ensure_selected_valid()
 
+	def _step_general(self, dt_s: float) -> None:
+		"""RK4 integration and collision resolution, both leaving positions wrapped.
+
+		With Numba the whole substep is one compiled call; `resolve_collisions`
+		only runs when particles are about to merge.
+		"""
+		soa = self.soa
+		if advance_substep(soa.pos, soa.vel, soa.mass, soa.charge, soa.radius, soa.fixed, self.world_size_m, dt_s, config.SOFTENING_FRACTION):
+			resolve_collisions(soa, self.world_size_m)
+
+	def _step_single_particle_uniform_field(self, dt_s: float) -> None:
+		"""Advance a lone particle in the uniform field in closed form.
+
+		RK4 is exact for constant acceleration, so this matches `_step_general`
+		up to round-off without any pairwise work. Reverts to the general step as
+		soon as the scene is no longer one particle in an active uniform field.
+		"""
+		soa = self.soa
+		if soa.n != 1 or not config.UNIFORM_FIELD_ACTIVE:
+			self._step_fn = self._step_general
+			self._step_general(dt_s)
+			return
+		mass = float(soa.mass[0])
+		charge = float(soa.charge[0])
+		if soa.fixed[0] or mass <= 0.0:
+			return
+		# Read q/m each step so charge or mass edits during validation take effect
+		ax = charge / mass * float(config.UNIFORM_FIELD_VECTOR_NC[0])
+		ay = charge / mass * float(config.UNIFORM_FIELD_VECTOR_NC[1])
+		(x, y), (vx, vy) = soa.pos[0].tolist(), soa.vel[0].tolist()
+		half_dt2 = 0.5 * dt_s * dt_s
+		soa.pos[0] = ((x + vx * dt_s + ax * half_dt2) % self._Lx, (y + vy * dt_s + ay * half_dt2) % self._Ly)
+		soa.vel[0] = (vx + ax * dt_s, vy + ay * dt_s)
+
+	def set_speed(self, speed_index: int) -> None:
+		"""Select an entry of `SPEED_MULTIPLIERS` and update the substeps per frame.
+
+		Parameters
+		----------
+		speed_index : int
+			Index into `config.SPEED_MULTIPLIERS`.
+		"""
+		self.speed_index = speed_index
+		self._substeps = max(1, int(self.substeps_base * config.SPEED_MULTIPLIERS[speed_index]))
+
+	@property
+	def substeps_per_frame(self) -> int:
+		"""Number of substeps `step_frame` runs at the current speed."""
+		return self._substeps
+
 	def step_frame(self) -> None:
 		"""Advance the simulation by a frame worth of substeps based on speed.
 
@@ -332,75 +775,51 @@ class Simulation:
 		"""
 		if self.paused:
 			return
-		mult = config.SPEED_MULTIPLIERS[self.speed_index]
-		substeps = max(1, int(self.substeps_base * mult))
-		dt_s = config.DT_S
-		for _ in range(substeps):
+		dt_s = self._dt_s
+		for _ in range(self._substeps):
 			self.step_substep(dt_s)
 			self.t_sim += dt_s
 		# Once per frame: update trails, energies, and optional forces for visualization
 		if self.show_trails:
-			self.update_trails(sample_interval_s=1.0 / float(config.FPS_TARGET))
+			self.update_trails(sample_interval_s=self._inv_fps)
 		self.recompute_energies()
 		if self.show_forces:
 			self._compute_last_forces()
 		else:
 			self.last_forces = None
 
-		# Update validation per-frame errors
+		# Update validation per-frame errors (only defined for single-particle validation)
 		if self.validation_active:
-			try:
-				# Only defined for single-particle validation
-				if len(self.particles) >= 1 and self.validation_initial_pos_m is not None and self.validation_initial_vel_mps is not None and self.validation_accel_mps2 is not None:
-					t_eval = min(float(self.t_sim), float(config.VALIDATION_DURATION_S))
-					x0 = self.validation_initial_pos_m
-					v0 = self.validation_initial_vel_mps
-					a = self.validation_accel_mps2
-					pos_theory = x0 + v0 * t_eval + 0.5 * a * (t_eval * t_eval)
-					# Wrap theoretical position for comparison/drawing
-					pos_theory = pos_theory.copy()
-					wrap_position_in_place(pos_theory, self.world_size_m)
-					vel_theory = v0 + a * t_eval
-					p = self.particles[0]
-					# Minimum-image displacement for position error
-					dpos = minimum_image_displacement(pos_theory, p.pos_m, self.world_size_m)
-					pos_err = float(np.hypot(dpos[0], dpos[1]))
-					v_diff = vel_theory - p.vel_mps
-					vel_err = float(np.hypot(v_diff[0], v_diff[1]))
-					self.validation_current_errors = {
-						"t": float(t_eval),
-						"pos_err": float(pos_err),
-						"vel_err": float(vel_err),
-					}
-			except Exception:
-				pass
+			if self.soa.n >= 1 and self.validation_initial_pos_m is not None and self.validation_initial_vel_mps is not None and self.validation_accel_mps2 is not None:
+				t_eval = min(float(self.t_sim), float(config.VALIDATION_DURATION_S))
+				pos_err, vel_err = self._validation_errors(t_eval)
+				self.validation_current_errors = {"t": t_eval, "pos_err": pos_err, "vel_err": vel_err}
 
 			# Pause and capture final comparison exactly at end time
 			if (not self.validation_reached_end) and (self.t_sim >= float(config.VALIDATION_DURATION_S)):
+				t_end = float(config.VALIDATION_DURATION_S)
+				# Compute theory at t_end; the arithmetic already yields a fresh buffer to wrap in place
+				x0 = self.validation_initial_pos_m if self.validation_initial_pos_m is not None else _ZERO2
+				v0 = self.validation_initial_vel_mps if self.validation_initial_vel_mps is not None else _ZERO2
+				a = self.validation_accel_mps2 if self.validation_accel_mps2 is not None else _ZERO2
+				pos_th = x0 + v0 * t_end + 0.5 * a * (t_end * t_end)
+				wrap_position_in_place(pos_th, self.world_size_m)
+				vel_th = v0 + a * t_end
+				self.validation_final_theory_pos_m = pos_th
+				self.validation_final_theory_vel_mps = vel_th
+				# Read sim
+				pos_err = vel_err = 0.0
+				if self.soa.n >= 1:
+					self.validation_final_sim_pos_m = self.soa.pos[0].copy()
+					self.validation_final_sim_vel_mps = self.soa.vel[0].copy()
+					dpos = minimum_image_displacement_batch(pos_th, self.validation_final_sim_pos_m, self.world_size_m)
+					pos_err = math.hypot(*dpos.tolist())
+					vel_err = math.hypot(*(vel_th - self.validation_final_sim_vel_mps).tolist())
+				self.validation_current_errors = {"t": t_end, "pos_err": pos_err, "vel_err": vel_err}
+				self.validation_reached_end = True
+				self.paused = True
+				# Print comparison; stdout may be closed (e.g. windowed builds), which must not stop the run
 				try:
-					t_end = float(config.VALIDATION_DURATION_S)
-					# Compute theory at t_end
-					x0 = self.validation_initial_pos_m if self.validation_initial_pos_m is not None else np.zeros(2, dtype=float)
-					v0 = self.validation_initial_vel_mps if self.validation_initial_vel_mps is not None else np.zeros(2, dtype=float)
-					a = self.validation_accel_mps2 if self.validation_accel_mps2 is not None else np.zeros(2, dtype=float)
-					pos_th = x0 + v0 * t_end + 0.5 * a * (t_end * t_end)
-					pos_th = pos_th.copy()
-					wrap_position_in_place(pos_th, self.world_size_m)
-					vel_th = v0 + a * t_end
-					self.validation_final_theory_pos_m = pos_th
-					self.validation_final_theory_vel_mps = vel_th
-					# Read sim
-					if len(self.particles) >= 1:
-						p0 = self.particles[0]
-						self.validation_final_sim_pos_m = p0.pos_m.copy()
-						self.validation_final_sim_vel_mps = p0.vel_mps.copy()
-					# Update errors at final time
-					dpos = minimum_image_displacement(self.validation_final_theory_pos_m, self.validation_final_sim_pos_m, self.world_size_m) if (self.validation_final_theory_pos_m is not None and self.validation_final_sim_pos_m is not None) else np.zeros(2)
-					pos_err = float(np.hypot(dpos[0], dpos[1]))
-					v_diff = (self.validation_final_theory_vel_mps - self.validation_final_sim_vel_mps) if (self.validation_final_theory_vel_mps is not None and self.validation_final_sim_vel_mps is not None) else np.zeros(2)
-					vel_err = float(np.hypot(v_diff[0], v_diff[1]))
-					self.validation_current_errors = {"t": t_end, "pos_err": pos_err, "vel_err": vel_err}
-					# Print comparison
 					print("\nUniform field validation - FINAL at t=%.3f s" % t_end)
 					print("theory: pos=(%.6f, %.6f) m, vel=(%.6f, %.6f) m/s" % (pos_th[0], pos_th[1], vel_th[0], vel_th[1]))
 					if self.validation_final_sim_pos_m is not None and self.validation_final_sim_vel_mps is not None:
@@ -408,10 +827,24 @@ class Simulation:
 						vs = self.validation_final_sim_vel_mps
 						print("  sim : pos=(%.6f, %.6f) m, vel=(%.6f, %.6f) m/s" % (ps[0], ps[1], vs[0], vs[1]))
 					print("errors: |pos|=%.6e m, |vel|=%.6e m/s" % (pos_err, vel_err))
-					self.validation_reached_end = True
-					self.paused = True
-				except Exception:
-					self.validation_reached_end = True
+				except (OSError, ValueError):
+					pass
+
+	def _validation_errors(self, t_s: float) -> Tuple[float, float]:
+		"""Return `(|pos error|, |vel error|)` of particle 0 against the analytical motion at `t_s`.
+
+		Evaluated with Python floats so the per-frame check allocates no arrays.
+		"""
+		x0x, x0y = self.validation_initial_pos_m.tolist()
+		v0x, v0y = self.validation_initial_vel_mps.tolist()
+		ax, ay = self.validation_accel_mps2.tolist()
+		Lx, Ly = self.world_size_m.tolist()
+		half_t2 = 0.5 * t_s * t_s
+		(px, py), (vx, vy) = self.soa.pos[0].tolist(), self.soa.vel[0].tolist()
+		# Minimum-image displacement between the wrapped theory position and the particle
+		dx = (px - (x0x + v0x * t_s + ax * half_t2) % Lx + 0.5 * Lx) % Lx - 0.5 * Lx
+		dy = (py - (x0y + v0y * t_s + ay * half_t2) % Ly + 0.5 * Ly) % Ly - 0.5 * Ly
+		return math.hypot(dx, dy), math.hypot(v0x + ax * t_s - vx, v0y + ay * t_s - vy)
 
 	def start_uniform_field_validation(self) -> None:
 		"""Set up and launch the uniform-field validation scenario.
@@ -424,7 +857,7 @@ class Simulation:
 		# Reset validation state for a fresh run
 		self.validation_active = False
 		self.validation_reached_end = False
-		self.validation_theory_traj = []
+		self.validation_theory_pos_m = np.empty((0, 2), dtype=float)
 		self.validation_current_errors = {}
 		self.validation_final_theory_pos_m = None
 		self.validation_final_theory_vel_mps = None
@@ -465,24 +898,22 @@ class Simulation:
 
 		# Precompute theoretical trajectory sampled at FPS cadence
 		dur = float(config.VALIDATION_DURATION_S)
-		dt_sample = 1.0 / float(config.FPS_TARGET)
-		t_theory: List[Tuple[float, Tuple[float, float]]] = []
-		t = 0.0
-		while t < dur + 1e-9:
-			pos = self.validation_initial_pos_m + self.validation_initial_vel_mps * t + 0.5 * self.validation_accel_mps2 * (t * t)
-			pos = pos.copy()
-			wrap_position_in_place(pos, self.world_size_m)
-			t_theory.append((float(t), (float(pos[0]), float(pos[1]))))
-			t += dt_sample
-		self.validation_theory_traj = t_theory
+		dt_sample = self._inv_fps
+		ts = np.arange(0.0, dur + 1e-9, dt_sample)
+		pos_th = self.validation_initial_pos_m + np.outer(ts, self.validation_initial_vel_mps) + 0.5 * np.outer(ts * ts, self.validation_accel_mps2)
+		wrap_positions_in_place(pos_th, self.world_size_m)
+		self.validation_theory_pos_m = pos_th
 
 		self.validation_active = True
 		self.validation_current_errors = {"t": 0.0, "pos_err": 0.0, "vel_err": 0.0}
+		if config.VALIDATION_CLOSED_FORM_STEP:
+			self._step_fn = self._step_single_particle_uniform_field
 
 	def stop_validation(self) -> None:
 		"""Disable uniform-field validation and restore defaults."""
 		self.validation_active = False
-		self.validation_theory_traj = []
+		self._step_fn = self._step_general
+		self.validation_theory_pos_m = np.empty((0, 2), dtype=float)
 		self.validation_dt_sweep_results = []
 		self.validation_current_errors = {}
 		self.validation_initial_pos_m = None
@@ -1,19 +1,12 @@
 from __future__ import annotations
 
-from typing import List, Tuple, TYPE_CHECKING
+from typing import TYPE_CHECKING
 
+import math
 import os
+import threading
+import types
 import numpy as np
-try:
-	from numba import njit, prange, set_num_threads
-	_NUMBA_AVAILABLE = True
-	try:
-		set_num_threads(max(1, os.cpu_count() or 1))
-	except Exception:
-		pass
-except Exception:
-	_NUMBA_AVAILABLE = False
- 
 from electrosim.config import (
 	K_COULOMB,
 	COLOR_POSITIVE,
@@ -22,10 +15,21 @@ from electrosim.config import (
 	NEUTRAL_CHARGE_EPS,
 )
 from electrosim import config as _cfg
+try:
+	from numba import config as _numba_config, njit, prange, set_num_threads, typeof
+	_NUMBA_AVAILABLE = True
+	try:
+		set_num_threads(max(1, int(_cfg.NUMBA_NUM_THREADS) or os.cpu_count() or 1))
+	except Exception:
+		pass
+except Exception:
+	_NUMBA_AVAILABLE = False
+from electrosim.simulation.bh import BH_AVAILABLE as _BH_AVAILABLE, compute_accelerations_bh, warm_up_bh
+from electrosim.simulation import physics_gpu as _gpu
 
 if TYPE_CHECKING:
 	# Only for type checking, avoids runtime circular imports
-	from electrosim.simulation.engine import Particle
+	from electrosim.simulation.engine import ParticleSoA
 
 
 def minimum_image_displacement(p_i: np.ndarray, p_j: np.ndarray, world_size_m: np.ndarray) -> np.ndarray:
@@ -68,6 +72,32 @@ def wrap_position_in_place(pos_m: np.ndarray, world_size_m: np.ndarray) -> None:
 		pos_m[axis] = pos_m[axis] % L
 
 
+def wrap_positions_in_place(pos: np.ndarray, world_size_m: np.ndarray) -> None:
+	"""Wrap an (N, 2) array of positions into the periodic domain in-place."""
+	np.mod(pos, world_size_m, out=pos)
+
+
+def minimum_image_displacement_batch(p_i: np.ndarray, p_j: np.ndarray, world_size_m: np.ndarray) -> np.ndarray:
+	"""Vectorized `minimum_image_displacement` from `p_i` to `p_j`.
+
+	Parameters
+	----------
+	p_i, p_j : numpy.ndarray shape (..., 2)
+		Positions in meters; broadcast against each other.
+	world_size_m : numpy.ndarray shape (2,)
+		World size in meters (width, height).
+
+	Returns
+	-------
+	numpy.ndarray shape (..., 2)
+		Displacement vectors from i to j under minimum-image on the torus.
+	"""
+	delta = p_j - p_i
+	L = np.asarray(world_size_m, dtype=float)
+	delta = np.where(delta > 0.5 * L, delta - L, delta)
+	return np.where(delta < -0.5 * L, delta + L, delta)
+
+
 def electric_force_pair(
 	p_i: np.ndarray,
 	q_i: float,
@@ -115,76 +145,154 @@ def electric_force_pair(
 
 # Numba-accelerated
 if _NUMBA_AVAILABLE:
-
-	@njit(cache=True, fastmath=False)
-	def _compute_accelerations_numba_serial(
+	# Upper bound on worker threads, a compile-time constant so the kernels stay cacheable
+	_MAX_THREADS = int(_numba_config.NUMBA_NUM_THREADS)
+	# Kernel options: every division is guarded, so NumPy float semantics replace the
+	# ZeroDivisionError checks; indices are loop-bounded, so no bounds checks either.
+	# fastmath (reassociation, FMA contraction) stays opt-in through NUMBA_FASTMATH
+	_FASTMATH = bool(_cfg.NUMBA_FASTMATH)
+
+	def _variant(func, suffix: str):
+		# Numba's on-disk cache is keyed by the function's name and bytecode, not its jit
+		# options, so serial and threaded builds of one function get their own names, or
+		# one would load the other's compiled code
+		clone = types.FunctionType(func.__code__, func.__globals__, func.__name__ + suffix, func.__defaults__, func.__closure__)
+		clone.__qualname__ = func.__qualname__ + suffix
+		return clone
+
+	@njit(cache=True, inline="always")
+	def _minimum_image_xy(dx: float, dy: float, Lx: float, Ly: float):
+		"""Fold a raw displacement `(dx, dy)` onto the minimum image; inlined into the kernels.
+
+		Branchless: random pair separations make the usual compare-and-shift branches
+		unpredictable, while a rounded multiple of the box length compiles to straight-line code.
+		"""
+		dx -= Lx * np.rint(dx / Lx)
+		dy -= Ly * np.rint(dy / Ly)
+		return dx, dy
+
+	@njit(cache=True, inline="always")
+	def _compact_sources(
 		pos: np.ndarray,
 		charge: np.ndarray,
 		radius: np.ndarray,
 		mass: np.ndarray,
 		fixed_mask: np.ndarray,
-		world_size: np.ndarray,
 		soft_frac: float,
+	):
+		# Gather the charged particles into contiguous arrays: the `n_act` that accelerate
+		# (mobile, massive, charged) first, then the charged ones that only act as sources.
+		# Neutral particles drop out, and source-only pairs are never visited
+		N = pos.shape[0]
+		idx = np.empty(N, dtype=np.int64)
+		n_act = 0
+		for i in range(N):
+			if not fixed_mask[i] and mass[i] > 0.0 and charge[i] != 0.0:
+				idx[n_act] = i
+				n_act += 1
+		m = n_act
+		for i in range(N):
+			if charge[i] != 0.0 and (fixed_mask[i] or mass[i] <= 0.0):
+				idx[m] = i
+				m += 1
+		c_pos = np.empty((m, 2))
+		c_q = np.empty(m)
+		c_soft = np.empty(m)
+		for k in range(m):
+			i = idx[k]
+			c_pos[k, 0] = pos[i, 0]
+			c_pos[k, 1] = pos[i, 1]
+			c_q[k] = charge[i]
+			c_soft[k] = soft_frac * radius[i]
+		return idx[:m], n_act, c_pos, c_q, c_soft
+
+	@njit(cache=True, inline="always")
+	def _pair_force_row(
+		i: int,
+		c_pos: np.ndarray,
+		c_q: np.ndarray,
+		c_soft: np.ndarray,
+		Lx: float,
+		Ly: float,
 		k_coulomb: float,
+		f: np.ndarray,
+	) -> None:
+		# Pairs (i, j > i) of the compacted sources: each force is computed once and applied
+		# to both ends. `c_soft` is soft_frac * radius, so the pair softening is a single add
+		xi = c_pos[i, 0]
+		yi = c_pos[i, 1]
+		eps_i = c_soft[i]
+		kqi = k_coulomb * c_q[i]
+		fx = 0.0
+		fy = 0.0
+		for j in range(i + 1, c_pos.shape[0]):
+			dx, dy = _minimum_image_xy(xi - c_pos[j, 0], yi - c_pos[j, 1], Lx, Ly)
+			r2 = dx * dx + dy * dy
+			eps = eps_i + c_soft[j]
+			# 1 / (r^2 + ε^2)^(3/2) from one sqrt and multiplies instead of pow(x, 1.5)
+			s2 = r2 + eps * eps
+			if s2 == 0.0:
+				continue
+			inv_s = 1.0 / np.sqrt(s2)
+			coef = kqi * c_q[j] * (inv_s * inv_s * inv_s)
+			fx += coef * dx
+			fy += coef * dy
+			# Newton's third law: equal and opposite force on j
+			f[j, 0] -= coef * dx
+			f[j, 1] -= coef * dy
+		f[i, 0] += fx
+		f[i, 1] += fy
+
+	@njit(cache=True, inline="always")
+	def _forces_to_accelerations(
+		f: np.ndarray,
+		idx: np.ndarray,
+		n_act: int,
+		N: int,
+		charge: np.ndarray,
+		mass: np.ndarray,
 		uniform_active_i: int,
 		uniform_Ex: float,
 		uniform_Ey: float,
 	) -> np.ndarray:
-		# Particles quantity
-		N = pos.shape[0]
-		# Accelerations array
+		# Scatter the compacted forces back; everything that does not accelerate stays zero
 		acc = np.zeros((N, 2))
-		# World size
-		Lx = world_size[0]
-		Ly = world_size[1]
-		# Compute accelerations for each particle
-		for i in range(N):
-			# Skip fixed, massless or neutral particles
-			if fixed_mask[i] or mass[i] <= 0.0 or charge[i] == 0.0:
-				continue
-			xi = pos[i, 0]
-			yi = pos[i, 1]
-			qi = charge[i]
-			ri = radius[i]
-			fx = 0.0
-			fy = 0.0
-			for j in range(N):
-				if i == j:
-					continue
-				qj = charge[j]
-				if qj == 0.0:
-					continue
-				dx = xi - pos[j, 0]
-				if dx > 0.5 * Lx:
-					dx -= Lx
-				elif dx < -0.5 * Lx:
-					dx += Lx
-				dy = yi - pos[j, 1]
-				if dy > 0.5 * Ly:
-					dy -= Ly
-				elif dy < -0.5 * Ly:
-					dy += Ly
-				r2 = dx * dx + dy * dy
-				contact = ri + radius[j]
-				eps = soft_frac * contact
-				# Denominator (r^2 + ε^2)^(3/2): r^3 = (r^2)^(3/2)
-				den = (r2 + eps * eps) ** 1.5
-				if den == 0.0:
-					continue
-				coef = k_coulomb * qi * qj / den
-				fx += coef * dx
-				fy += coef * dy
+		for k in range(n_act):
+			i = idx[k]
+			fx = f[k, 0]
+			fy = f[k, 1]
 			# Uniform field force contribution F = q E
 			if uniform_active_i != 0:
-				fx += qi * uniform_Ex
-				fy += qi * uniform_Ey
+				fx += charge[i] * uniform_Ex
+				fy += charge[i] * uniform_Ey
 			inv_m = 1.0 / mass[i]
 			acc[i, 0] = fx * inv_m
 			acc[i, 1] = fy * inv_m
 		return acc
 
-	@njit(cache=True, fastmath=False)
-	def _compute_accelerations_numba_parallel(
+	@njit(cache=True, fastmath=_FASTMATH, error_model="numpy", boundscheck=False)
+	def _compute_accelerations_numba_serial(
+		pos: np.ndarray,
+		charge: np.ndarray,
+		radius: np.ndarray,
+		mass: np.ndarray,
+		fixed_mask: np.ndarray,
+		world_size: np.ndarray,
+		soft_frac: float,
+		k_coulomb: float,
+		uniform_active_i: int,
+		uniform_Ex: float,
+		uniform_Ey: float,
+	) -> np.ndarray:
+		# Each unordered pair is visited once (j > i); only mobile, massive, charged
+		# particles accelerate, but fixed ones still act as sources
+		idx, n_act, c_pos, c_q, c_soft = _compact_sources(pos, charge, radius, mass, fixed_mask, soft_frac)
+		f = np.zeros((c_pos.shape[0], 2))
+		for i in range(n_act):
+			_pair_force_row(i, c_pos, c_q, c_soft, world_size[0], world_size[1], k_coulomb, f)
+		return _forces_to_accelerations(f, idx, n_act, pos.shape[0], charge, mass, uniform_active_i, uniform_Ex, uniform_Ey)
+
+	def _accelerations_parallel_kernel(
 		pos: np.ndarray,
 		charge: np.ndarray,
 		radius: np.ndarray,
@@ -197,55 +305,183 @@ if _NUMBA_AVAILABLE:
 		uniform_Ex: float,
 		uniform_Ey: float,
 	) -> np.ndarray:
+		idx, n_act, c_pos, c_q, c_soft = _compact_sources(pos, charge, radius, mass, fixed_mask, soft_frac)
+		M = c_pos.shape[0]
+		# Third-law updates touch row j from any chunk, so each chunk gets its own force buffer
+		half = (n_act + 1) // 2
+		n_chunks = min(_MAX_THREADS, half)
+		f_chunk = np.zeros((n_chunks, M, 2))
+		for c in prange(n_chunks):
+			f = f_chunk[c]
+			# Row k has M-1-k pairs; rows k and n_act-1-k together always make the same count
+			for k in range(c, half, n_chunks):
+				_pair_force_row(k, c_pos, c_q, c_soft, world_size[0], world_size[1], k_coulomb, f)
+				if n_act - 1 - k != k:
+					_pair_force_row(n_act - 1 - k, c_pos, c_q, c_soft, world_size[0], world_size[1], k_coulomb, f)
+		f_total = np.zeros((M, 2))
+		for c in range(n_chunks):
+			f_total += f_chunk[c]
+		return _forces_to_accelerations(f_total, idx, n_act, pos.shape[0], charge, mass, uniform_active_i, uniform_Ex, uniform_Ey)
+
+	# Threads over balanced chunks of rows with per-chunk force buffers reduced at the
+	# end, so third-law updates never race. fastmath follows NUMBA_FASTMATH
+	_compute_accelerations_numba_parallel = njit(
+		cache=True,
+		parallel=True,
+		fastmath=_FASTMATH,
+		error_model="numpy",
+		boundscheck=False,
+	)(_accelerations_parallel_kernel)
+
+	def _contact_counts_kernel(pos: np.ndarray, charge: np.ndarray, radius: np.ndarray, Lx: float, Ly: float):
+		# Read-only overlap scan: (opposite-charge overlaps, all overlaps), same tests as the collision pass
+		N = pos.shape[0]
+		merges = 0
+		contacts = 0
+		for i in prange(N):
+			for j in range(i + 1, N):
+				dx, dy = _minimum_image_xy(pos[j, 0] - pos[i, 0], pos[j, 1] - pos[i, 1], Lx, Ly)
+				dist = np.sqrt(dx * dx + dy * dy)
+				if dist < radius[i] + radius[j] and dist != 0.0:
+					contacts += 1
+					if charge[i] * charge[j] < 0.0:
+						merges += 1
+		return merges, contacts
+
+	_contact_counts_serial = njit(cache=True, error_model="numpy", boundscheck=False)(_variant(_contact_counts_kernel, "_serial"))
+	_contact_counts_parallel = njit(cache=True, parallel=True, error_model="numpy", boundscheck=False)(_variant(_contact_counts_kernel, "_parallel"))
+
+	def _cell_accelerations_kernel(
+		pos: np.ndarray,
+		charge: np.ndarray,
+		radius: np.ndarray,
+		mass: np.ndarray,
+		fixed_mask: np.ndarray,
+		world_size: np.ndarray,
+		soft_frac: float,
+		k_coulomb: float,
+		uniform_active_i: int,
+		uniform_Ex: float,
+		uniform_Ey: float,
+		r_cut: float,
+	) -> np.ndarray:
+		# Truncated pair sum over a linked-cell grid: cells are at least r_cut wide, so
+		# every partner within r_cut sits in the 3x3 block of periodic neighbor cells
 		N = pos.shape[0]
 		acc = np.zeros((N, 2))
 		Lx = world_size[0]
 		Ly = world_size[1]
+		ncx = max(1, int(Lx / r_cut))
+		ncy = max(1, int(Ly / r_cut))
+		csx = Lx / ncx
+		csy = Ly / ncy
+		rc2 = r_cut * r_cut
+		head = np.full(ncx * ncy, -1, dtype=np.int64)
+		nxt = np.empty(N, dtype=np.int64)
+		cell_x = np.empty(N, dtype=np.int64)
+		cell_y = np.empty(N, dtype=np.int64)
+		for i in range(N):
+			ix = int(np.floor(pos[i, 0] / csx)) % ncx
+			iy = int(np.floor(pos[i, 1] / csy)) % ncy
+			cell_x[i] = ix
+			cell_y[i] = iy
+			c = iy * ncx + ix
+			nxt[i] = head[c]
+			head[c] = i
+		# With fewer than three cells on an axis the 3x3 block would revisit cells, so scan that axis whole
+		span_x = 3 if ncx >= 3 else ncx
+		span_y = 3 if ncy >= 3 else ncy
 		for i in prange(N):
 			if fixed_mask[i] or mass[i] <= 0.0 or charge[i] == 0.0:
 				continue
 			xi = pos[i, 0]
 			yi = pos[i, 1]
-			qi = charge[i]
-			ri = radius[i]
+			kqi = k_coulomb * charge[i]
+			eps_i = soft_frac * radius[i]
 			fx = 0.0
 			fy = 0.0
-			for j in range(N):
-				if i == j:
-					continue
-				qj = charge[j]
-				if qj == 0.0:
-					continue
-				dx = xi - pos[j, 0]
-				if dx > 0.5 * Lx:
-					dx -= Lx
-				elif dx < -0.5 * Lx:
-					dx += Lx
-				dy = yi - pos[j, 1]
-				if dy > 0.5 * Ly:
-					dy -= Ly
-				elif dy < -0.5 * Ly:
-					dy += Ly
-				r2 = dx * dx + dy * dy
-				contact = ri + radius[j]
-				eps = soft_frac * contact
-				den = (r2 + eps * eps) ** 1.5
-				if den == 0.0:
-					continue
-				coef = k_coulomb * qi * qj / den
-				fx += coef * dx
-				fy += coef * dy
-			# Uniform field force contribution F = q E
+			for oy in range(span_y):
+				gy = (cell_y[i] - 1 + oy) % ncy if ncy >= 3 else oy
+				for ox in range(span_x):
+					gx = (cell_x[i] - 1 + ox) % ncx if ncx >= 3 else ox
+					j = head[gy * ncx + gx]
+					while j >= 0:
+						qj = charge[j]
+						if j != i and qj != 0.0:
+							dx, dy = _minimum_image_xy(xi - pos[j, 0], yi - pos[j, 1], Lx, Ly)
+							r2 = dx * dx + dy * dy
+							if r2 < rc2:
+								eps = eps_i + soft_frac * radius[j]
+								s2 = r2 + eps * eps
+								if s2 > 0.0:
+									inv_s = 1.0 / np.sqrt(s2)
+									coef = kqi * qj * (inv_s * inv_s * inv_s)
+									fx += coef * dx
+									fy += coef * dy
+						j = nxt[j]
 			if uniform_active_i != 0:
-				fx += qi * uniform_Ex
-				fy += qi * uniform_Ey
+				fx += charge[i] * uniform_Ex
+				fy += charge[i] * uniform_Ey
 			inv_m = 1.0 / mass[i]
 			acc[i, 0] = fx * inv_m
 			acc[i, 1] = fy * inv_m
 		return acc
 
-	@njit(cache=True, fastmath=False)
-	def _compute_field_grid_numba(
+	@njit(cache=True, error_model="numpy", boundscheck=False)
+	def _overlap_pairs_numba(pos: np.ndarray, radius: np.ndarray, Lx: float, Ly: float) -> np.ndarray:
+		# Uniform-grid broad phase: cells are at least the largest contact distance wide,
+		# so overlapping partners always sit in the 3x3 block of periodic neighbor cells
+		N = pos.shape[0]
+		cell = 2.0 * radius.max()
+		ncx = max(1, int(Lx / cell))
+		ncy = max(1, int(Ly / cell))
+		csx = Lx / ncx
+		csy = Ly / ncy
+		head = np.full(ncx * ncy, -1, dtype=np.int64)
+		nxt = np.empty(N, dtype=np.int64)
+		cell_x = np.empty(N, dtype=np.int64)
+		cell_y = np.empty(N, dtype=np.int64)
+		for i in range(N):
+			ix = int(np.floor(pos[i, 0] / csx)) % ncx
+			iy = int(np.floor(pos[i, 1] / csy)) % ncy
+			cell_x[i] = ix
+			cell_y[i] = iy
+			c = iy * ncx + ix
+			nxt[i] = head[c]
+			head[c] = i
+		span_x = 3 if ncx >= 3 else ncx
+		span_y = 3 if ncy >= 3 else ncy
+		pairs = np.empty((max(16, N), 2), dtype=np.int64)
+		m = 0
+		for i in range(N):
+			for oy in range(span_y):
+				gy = (cell_y[i] - 1 + oy) % ncy if ncy >= 3 else oy
+				for ox in range(span_x):
+					gx = (cell_x[i] - 1 + ox) % ncx if ncx >= 3 else ox
+					j = head[gy * ncx + gx]
+					while j >= 0:
+						if j > i:
+							dx, dy = _minimum_image_xy(pos[j, 0] - pos[i, 0], pos[j, 1] - pos[i, 1], Lx, Ly)
+							dist = np.sqrt(dx * dx + dy * dy)
+							if dist < radius[i] + radius[j] and dist != 0.0:
+								if m == pairs.shape[0]:
+									grown = np.empty((2 * m, 2), dtype=np.int64)
+									grown[:m] = pairs
+									pairs = grown
+								pairs[m, 0] = i
+								pairs[m, 1] = j
+								m += 1
+						j = nxt[j]
+		return pairs[:m]
+
+	_cell_accelerations_serial = njit(cache=True, fastmath=_FASTMATH, error_model="numpy", boundscheck=False)(_variant(_cell_accelerations_kernel, "_serial"))
+	_cell_accelerations_parallel = njit(cache=True, parallel=True, fastmath=_FASTMATH, error_model="numpy", boundscheck=False)(_variant(_cell_accelerations_kernel, "_parallel"))
+
+	# Field-grid tile sizes: grid points per parallel block and sources per L1-resident tile
+	_FIELD_TILE_POINTS = 64
+	_FIELD_TILE_SOURCES = 256
+
+	def _field_grid_kernel(
 		centers_m: np.ndarray,
 		pos: np.ndarray,
 		charge: np.ndarray,
@@ -256,85 +492,313 @@ if _NUMBA_AVAILABLE:
 	) -> np.ndarray:
 		M = centers_m.shape[0]
 		N = pos.shape[0]
-		out = np.zeros((M, 2))
+		# Output precision follows the sample points so float32 grids stay float32
+		out = np.zeros((M, 2), dtype=centers_m.dtype)
 		Lx = world_size[0]
 		Ly = world_size[1]
-		for m in prange(M):
-			px = centers_m[m, 0]
-			py = centers_m[m, 1]
-			Ex = 0.0
-			Ey = 0.0
-			for idx in range(N):
-				q = charge[idx]
-				if q == 0.0:
-					continue
-				dx = px - pos[idx, 0]
-				if dx > 0.5 * Lx:
-					dx -= Lx
-				elif dx < -0.5 * Lx:
-					dx += Lx
-				dy = py - pos[idx, 1]
-				if dy > 0.5 * Ly:
-					dy -= Ly
-				elif dy < -0.5 * Ly:
-					dy += Ly
-				r2 = dx * dx + dy * dy
-				eps = soft_frac * radius[idx]
-				den = (r2 + eps * eps) ** 1.5
-				if den == 0.0:
-					continue
-				coef = k_coulomb * q / den
-				Ex += coef * dx
-				Ey += coef * dy
-			out[m, 0] = Ex
-			out[m, 1] = Ey
+		# Blocked over both axes: each tile of sources stays in L1 while a whole tile of
+		# grid points sweeps it, instead of every point streaming all N sources
+		n_blocks = (M + _FIELD_TILE_POINTS - 1) // _FIELD_TILE_POINTS
+		for b in prange(n_blocks):
+			m0 = b * _FIELD_TILE_POINTS
+			m1 = min(m0 + _FIELD_TILE_POINTS, M)
+			ex = np.zeros(_FIELD_TILE_POINTS)
+			ey = np.zeros(_FIELD_TILE_POINTS)
+			for j0 in range(0, N, _FIELD_TILE_SOURCES):
+				j1 = min(j0 + _FIELD_TILE_SOURCES, N)
+				for m in range(m0, m1):
+					px = centers_m[m, 0]
+					py = centers_m[m, 1]
+					Ex = 0.0
+					Ey = 0.0
+					# Branch-light inner loop so LLVM can vectorize it; zero charges contribute nothing
+					for idx in range(j0, j1):
+						dx, dy = _minimum_image_xy(px - pos[idx, 0], py - pos[idx, 1], Lx, Ly)
+						eps = soft_frac * radius[idx]
+						s2 = dx * dx + dy * dy + eps * eps
+						if s2 > 0.0:
+							inv_s = 1.0 / np.sqrt(s2)
+							coef = k_coulomb * charge[idx] * inv_s * inv_s * inv_s
+							Ex += coef * dx
+							Ey += coef * dy
+					ex[m - m0] += Ex
+					ey[m - m0] += Ey
+			for m in range(m0, m1):
+				out[m, 0] = ex[m - m0]
+				out[m, 1] = ey[m - m0]
 		return out
 
-	@njit(cache=True, fastmath=False)
-	def _electric_field_at_point_numba(point: np.ndarray, pos: np.ndarray, charge: np.ndarray, radius: np.ndarray, world_size: np.ndarray, soft_frac: float, k_coulomb: float) -> np.ndarray:
+	# The field grid only feeds the visualization, so it always allows fastmath;
+	# threading follows NUMBA_PARALLEL_ACCEL and is fixed at import time
+	_compute_field_grid_numba = njit(
+		cache=True,
+		fastmath=True,
+		parallel=bool(_cfg.NUMBA_PARALLEL_ACCEL),
+		error_model="numpy",
+		boundscheck=False,
+	)(_field_grid_kernel)
+
+	@njit(cache=True, fastmath=_FASTMATH, error_model="numpy", boundscheck=False)
+	def _electric_field_at_point_numba(px: float, py: float, pos: np.ndarray, charge: np.ndarray, radius: np.ndarray, Lx: float, Ly: float, soft_frac: float, k_coulomb: float):
+		# Scalars in, tuple out: no array is allocated inside the kernel
 		Ex = 0.0
 		Ey = 0.0
-		Lx = world_size[0]
-		Ly = world_size[1]
-		px = point[0]
-		py = point[1]
 		N = pos.shape[0]
 		for idx in range(N):
 			q = charge[idx]
 			if q == 0.0:
 				continue
-			dx = px - pos[idx, 0]
-			if dx > 0.5 * Lx:
-				dx -= Lx
-			elif dx < -0.5 * Lx:
-				dx += Lx
-			dy = py - pos[idx, 1]
-			if dy > 0.5 * Ly:
-				dy -= Ly
-			elif dy < -0.5 * Ly:
-				dy += Ly
+			dx, dy = _minimum_image_xy(px - pos[idx, 0], py - pos[idx, 1], Lx, Ly)
 			r2 = dx * dx + dy * dy
 			eps = soft_frac * radius[idx]
-			# Same (r^2 + ε^2)^(3/2)
-			den = (r2 + eps * eps) ** 1.5
-			if den == 0.0:
+			# Same 1 / (r^2 + ε^2)^(3/2) without pow
+			s2 = r2 + eps * eps
+			if s2 == 0.0:
 				continue
-			coef = k_coulomb * q / den
+			inv_s = 1.0 / np.sqrt(s2)
+			coef = k_coulomb * q * (inv_s * inv_s * inv_s)
 			Ex += coef * dx
 			Ey += coef * dy
-		return np.array([Ex, Ey])
+		return Ex, Ey
+
+	@njit(cache=True, fastmath=_FASTMATH, error_model="numpy", boundscheck=False)
+	def _substep_numba(
+		pos: np.ndarray,
+		vel: np.ndarray,
+		mass: np.ndarray,
+		charge: np.ndarray,
+		radius: np.ndarray,
+		fixed_mask: np.ndarray,
+		world_size: np.ndarray,
+		dt: float,
+		soft_frac: float,
+		k_coulomb: float,
+		uniform_active_i: int,
+		uniform_Ex: float,
+		uniform_Ey: float,
+		parallel: bool,
+	) -> bool:
+		# One compiled substep: RK4, wrap, then elastic collisions and a final wrap.
+		# Returns True (after RK4 and wrap only) if an opposite-charge pair overlaps,
+		# since merges change the particle count and are left to `resolve_collisions`.
+		# `parallel` selects the threaded force and overlap kernels.
+		N = pos.shape[0]
+		Lx = world_size[0]
+		Ly = world_size[1]
+		# `pos`/`vel` are only overwritten after the last stage, so they double as the stage-0 state
+		vel_sum = np.zeros_like(vel)
+		acc_sum = np.zeros_like(vel)
+		stage_pos = pos.copy()
+		stage_vel = vel.copy()
+		# Classical RK4 stages: offsets (0, 1/2, 1/2, 1) and weights (1, 2, 2, 1) / 6
+		for stage in range(4):
+			if parallel:
+				a = _compute_accelerations_numba_parallel(stage_pos, charge, radius, mass, fixed_mask, world_size, soft_frac, k_coulomb, uniform_active_i, uniform_Ex, uniform_Ey)
+			else:
+				a = _compute_accelerations_numba_serial(stage_pos, charge, radius, mass, fixed_mask, world_size, soft_frac, k_coulomb, uniform_active_i, uniform_Ex, uniform_Ey)
+			weight = 1.0 if stage == 0 or stage == 3 else 2.0
+			step = dt if stage >= 2 else 0.5 * dt
+			# Accumulate this stage and build the next one in a single pass over the same element
+			for i in range(N):
+				for d in range(2):
+					v_k = stage_vel[i, d]
+					a_k = a[i, d]
+					vel_sum[i, d] += weight * v_k
+					acc_sum[i, d] += weight * a_k
+					if stage < 3:
+						stage_pos[i, d] = pos[i, d] + step * v_k
+						stage_vel[i, d] = vel[i, d] + step * a_k
+		for i in range(N):
+			if fixed_mask[i]:
+				continue
+			pos[i, 0] = (pos[i, 0] + (dt / 6.0) * vel_sum[i, 0]) % Lx
+			pos[i, 1] = (pos[i, 1] + (dt / 6.0) * vel_sum[i, 1]) % Ly
+			vel[i, 0] = vel[i, 0] + (dt / 6.0) * acc_sum[i, 0]
+			vel[i, 1] = vel[i, 1] + (dt / 6.0) * acc_sum[i, 1]
+
+		# Overlaps: bail out to the Python path if any pair would merge
+		if parallel:
+			merges, contacts = _contact_counts_parallel(pos, charge, radius, Lx, Ly)
+		else:
+			merges, contacts = _contact_counts_serial(pos, charge, radius, Lx, Ly)
+		if merges > 0:
+			return True
+
+		# Elastic collisions, same rules as `resolve_collisions`: candidates are taken once
+		# before the pass, in (i, j) order, and rechecked against the live positions, so an
+		# overlap created by an earlier correction waits for the next substep. Positions only
+		# move when a contact is resolved, so with no overlaps now the pass is a no-op
+		if contacts > 0:
+			pairs = _overlap_pairs_numba(pos, radius, Lx, Ly)
+			pairs = pairs[np.argsort(pairs[:, 0] * N + pairs[:, 1])]
+		else:
+			pairs = np.empty((0, 2), dtype=np.int64)
+		for k in range(pairs.shape[0]):
+			i = pairs[k, 0]
+			j = pairs[k, 1]
+			dx, dy = _minimum_image_xy(pos[j, 0] - pos[i, 0], pos[j, 1] - pos[i, 1], Lx, Ly)
+			dist = np.sqrt(dx * dx + dy * dy)
+			r_contact = radius[i] + radius[j]
+			if dist >= r_contact or dist == 0.0:
+				continue
+			nx = dx / dist
+			ny = dy / dist
+			fixed_i = fixed_mask[i]
+			fixed_j = fixed_mask[j]
+			if fixed_i and fixed_j:
+				continue
+			penetration = r_contact - dist
+			inv_m1 = 0.0 if fixed_i else 1.0 / mass[i]
+			inv_m2 = 0.0 if fixed_j else 1.0 / mass[j]
+			if fixed_i:
+				pos[j, 0] += nx * penetration
+				pos[j, 1] += ny * penetration
+			elif fixed_j:
+				pos[i, 0] -= nx * penetration
+				pos[i, 1] -= ny * penetration
+			else:
+				total = mass[i] + mass[j]
+				if total > 0.0:
+					pos[i, 0] -= nx * (penetration * (mass[j] / total))
+					pos[i, 1] -= ny * (penetration * (mass[j] / total))
+					pos[j, 0] += nx * (penetration * (mass[i] / total))
+					pos[j, 1] += ny * (penetration * (mass[i] / total))
+			v_rel_n = (vel[j, 0] - vel[i, 0]) * nx + (vel[j, 1] - vel[i, 1]) * ny
+			if v_rel_n > 0:
+				continue
+			# Restitution e = 1
+			j_impulse = -2.0 * v_rel_n / (inv_m1 + inv_m2)
+			vel[i, 0] -= j_impulse * nx * inv_m1
+			vel[i, 1] -= j_impulse * ny * inv_m1
+			vel[j, 0] += j_impulse * nx * inv_m2
+			vel[j, 1] += j_impulse * ny * inv_m2
 
+		for i in range(N):
+			pos[i, 0] = pos[i, 0] % Lx
+			pos[i, 1] = pos[i, 1] % Ly
+		return False
 
-def compute_accelerations(particles: List["Particle"], world_size_m: np.ndarray, softening_fraction: float) -> np.ndarray:
+	@njit(cache=True, fastmath=_FASTMATH, error_model="numpy", boundscheck=False)
+	def _total_energies_numba(
+		pos: np.ndarray,
+		vel: np.ndarray,
+		mass: np.ndarray,
+		charge: np.ndarray,
+		fixed_mask: np.ndarray,
+		world_size: np.ndarray,
+		k_coulomb: float,
+	):
+		# Kinetic term in the outer loop, pair potential (j > i) in the inner loop
+		N = pos.shape[0]
+		Lx = world_size[0]
+		Ly = world_size[1]
+		ke = 0.0
+		pe = 0.0
+		for i in range(N):
+			if not fixed_mask[i]:
+				ke += 0.5 * mass[i] * (vel[i, 0] * vel[i, 0] + vel[i, 1] * vel[i, 1])
+			qi = charge[i]
+			for j in range(i + 1, N):
+				dx, dy = _minimum_image_xy(pos[j, 0] - pos[i, 0], pos[j, 1] - pos[i, 1], Lx, Ly)
+				# Same small-distance clamp as `total_potential_energy`
+				r = max(np.sqrt(dx * dx + dy * dy), 1e-6)
+				pe += k_coulomb * qi * charge[j] / r
+		return ke, pe
+
+
+def _compile_for(kernel, *args) -> None:
+	# Compile (or load) the overload a call with `args` would dispatch to, without running it
+	kernel.compile(tuple(typeof(a) for a in args))
+
+
+def warm_up_kernels() -> None:
+	"""Compile (or load from the on-disk cache) every Numba kernel with runtime dtypes.
+
+	Calls each serial kernel once on a two-particle scene so the JIT cost is
+	paid up front instead of on the first step, field toggle or probe. The
+	threaded kernels are only compiled, never run: with Numba's workqueue
+	threading layer two threads must not launch parallel regions at once, and
+	this runs beside the main loop. Particle state uses the `config.PRECISION`
+	dtype and the field grid is float32, matching the sampler. Does nothing
+	without Numba.
+	"""
+	if not _NUMBA_AVAILABLE:
+		return
+	dtype = np.float32 if _cfg.PRECISION == "f32" else np.float64
+	pos = np.array([[0.25, 0.25], [0.75, 0.75]], dtype=dtype)
+	vel = np.zeros((2, 2), dtype=dtype)
+	mass = np.ones(2, dtype=dtype)
+	charge = np.array([1e-6, -1e-6], dtype=dtype)
+	radius = np.full(2, 0.01, dtype=dtype)
+	fixed = np.zeros(2, dtype=bool)
+	world_size = np.array([1.0, 1.0], dtype=np.float64)
+	k = float(K_COULOMB)
+	_compute_accelerations_numba_serial(pos, charge, radius, mass, fixed, world_size, 0.1, k, 0, 0.0, 0.0)
+	_compile_for(_compute_accelerations_numba_parallel, pos, charge, radius, mass, fixed, world_size, 0.1, k, 0, 0.0, 0.0)
+	_cell_accelerations_serial(pos, charge, radius, mass, fixed, world_size, 0.1, k, 0, 0.0, 0.0, 0.5)
+	_compile_for(_cell_accelerations_parallel, pos, charge, radius, mass, fixed, world_size, 0.1, k, 0, 0.0, 0.0, 0.5)
+	# The serial branch runs; the threaded overlap scan it may take is compiled alongside
+	_substep_numba(pos.copy(), vel.copy(), mass, charge, radius, fixed, world_size, 1e-3, 0.1, k, 0, 0.0, 0.0, False)
+	_total_energies_numba(pos, vel, mass, charge, fixed, world_size, k)
+	_overlap_pairs_numba(pos, radius, 1.0, 1.0)
+	_electric_field_at_point_numba(0.5, 0.5, pos, charge, radius, 1.0, 1.0, 0.1, k)
+	f32 = np.float32
+	_compile_for(
+		_compute_field_grid_numba,
+		np.full((1, 2), 0.5, dtype=f32), pos.astype(f32), charge.astype(f32), radius.astype(f32),
+		np.ones(2, dtype=f32), 0.1, k,
+	)
+	if _BH_AVAILABLE:
+		warm_up_bh(pos, charge, radius, world_size, 0.1, 0.5)
+
+
+def _warm_up_quietly() -> None:
+	# A failed warm-up only means the first real call compiles instead
+	try:
+		warm_up_kernels()
+	except Exception:
+		pass
+
+
+def _use_parallel(n: int) -> bool:
+	"""Return True if the threaded Numba kernels should handle `n` particles."""
+	return bool(_cfg.NUMBA_PARALLEL_ACCEL) and n >= int(_cfg.NUMBA_PARALLEL_MIN_PARTICLES)
+
+
+def _use_gpu(n: int) -> bool:
+	"""Return True if `n` particles should go to the CUDA acceleration kernel."""
+	return bool(_cfg.USE_GPU) and n >= int(_cfg.GPU_ACCEL_MIN_PARTICLES) and _gpu.gpu_available()
+
+
+def compute_accelerations(
+	pos: np.ndarray,
+	charge: np.ndarray,
+	radius: np.ndarray,
+	mass: np.ndarray,
+	fixed: np.ndarray,
+	world_size_m: np.ndarray,
+	softening_fraction: float,
+) -> np.ndarray:
 	"""Compute accelerations for all particles from Coulomb forces.
 
 	Fixed, massless or neutral particles get zero acceleration. Uses Numba when
-	available; falls back to pure Python otherwise.
+	available; falls back to vectorized NumPy otherwise. With
+	`config.BARNES_HUT_THETA > 0` and at least `BARNES_HUT_MIN_PARTICLES`
+	particles, the Barnes–Hut approximation in `bh.py` is used instead.
+	Otherwise, with `config.FORCE_CUTOFF_M > 0`, pairs farther apart than the
+	cutoff are ignored and the sum runs over a linked-cell grid. With
+	`config.USE_GPU` and at least `GPU_ACCEL_MIN_PARTICLES` particles the direct
+	sum runs on CUDA (`physics_gpu.compute_accelerations_gpu`) when CuPy is
+	installed, falling back to the CPU on any GPU error.
 
 	Parameters
 	----------
-	particles : list[Particle]
-		Particle list with positions (m), velocities (m/s), masses (kg), charges (C), radii (m).
+	pos : numpy.ndarray shape (N, 2)
+		Positions (m).
+	charge, radius, mass : numpy.ndarray shape (N,)
+		Charges (C), contact radii (m) and masses (kg).
+	fixed : numpy.ndarray shape (N,), bool
+		Fixed-particle mask.
 	world_size_m : numpy.ndarray shape (2,)
 		World size (m) as (Lx, Ly).
 	softening_fraction : float
@@ -345,89 +809,90 @@ def compute_accelerations(particles: List["Particle"], world_size_m: np.ndarray,
 	numpy.ndarray shape (N, 2)
 		Accelerations (m/s^2) for each particle.
 	"""
-	N = len(particles)
+	N = pos.shape[0]
 	if N == 0:
 		return np.zeros((0, 2), dtype=float)
+	# Uniform field controls
+	uniform_active_i = 1 if bool(_cfg.UNIFORM_FIELD_ACTIVE) else 0
+	uniform_Ex = float(_cfg.UNIFORM_FIELD_VECTOR_NC[0]) if uniform_active_i else 0.0
+	uniform_Ey = float(_cfg.UNIFORM_FIELD_VECTOR_NC[1]) if uniform_active_i else 0.0
+	theta = float(_cfg.BARNES_HUT_THETA)
+	if theta > 0.0 and _BH_AVAILABLE and N >= int(_cfg.BARNES_HUT_MIN_PARTICLES):
+		return compute_accelerations_bh(pos, charge, radius, mass, fixed, world_size_m, softening_fraction, theta)
+	r_cut = float(_cfg.FORCE_CUTOFF_M)
+	if r_cut <= 0.0 and _use_gpu(N):
+		try:
+			return _gpu.compute_accelerations_gpu(
+				pos, charge, radius, mass, fixed, world_size_m,
+				float(softening_fraction), float(K_COULOMB), (uniform_Ex, uniform_Ey),
+			)
+		except Exception:
+			pass
 	if _NUMBA_AVAILABLE:
-		pos = np.empty((N, 2), dtype=np.float64)
-		charge = np.empty((N,), dtype=np.float64)
-		radius = np.empty((N,), dtype=np.float64)
-		mass = np.empty((N,), dtype=np.float64)
-		fixed_mask = np.empty((N,), dtype=np.bool_)
-		for i, p in enumerate(particles):
-			pos[i, 0] = float(p.pos_m[0])
-			pos[i, 1] = float(p.pos_m[1])
-			charge[i] = float(p.charge_c)
-			radius[i] = float(p.radius_m)
-			mass[i] = float(p.mass_kg)
-			fixed_mask[i] = bool(p.fixed)
 		world_size = np.array([float(world_size_m[0]), float(world_size_m[1])], dtype=np.float64)
-		# Uniform field controls
-		uniform_active_i = 1 if bool(_cfg.UNIFORM_FIELD_ACTIVE) else 0
-		uniform_Ex = float(_cfg.UNIFORM_FIELD_VECTOR_NC[0]) if uniform_active_i else 0.0
-		uniform_Ey = float(_cfg.UNIFORM_FIELD_VECTOR_NC[1]) if uniform_active_i else 0.0
-		if _cfg.NUMBA_PARALLEL_ACCEL:
+		if r_cut > 0.0:
+			cell_kernel = _cell_accelerations_parallel if _use_parallel(N) else _cell_accelerations_serial
+			return cell_kernel(
+				pos, charge, radius, mass, fixed, world_size,
+				float(softening_fraction), float(K_COULOMB),
+				int(uniform_active_i), float(uniform_Ex), float(uniform_Ey), r_cut,
+			)
+		if _use_parallel(N):
 			acc = _compute_accelerations_numba_parallel(
-				pos, charge, radius, mass, fixed_mask, world_size,
+				pos, charge, radius, mass, fixed, world_size,
 				float(softening_fraction), float(K_COULOMB),
 				int(uniform_active_i), float(uniform_Ex), float(uniform_Ey)
 			)
 		else:
 			acc = _compute_accelerations_numba_serial(
-				pos, charge, radius, mass, fixed_mask, world_size,
+				pos, charge, radius, mass, fixed, world_size,
 				float(softening_fraction), float(K_COULOMB),
 				int(uniform_active_i), float(uniform_Ex), float(uniform_Ey)
 			)
 		return acc
-	
-	# Fallback, just python interpreter
+
+	# Fallback, all pairs at once with NumPy broadcasting
+	r_vec = minimum_image_displacement_batch(pos[None, :, :], pos[:, None, :], world_size_m)  # r_vec[i, j] = p_i - p_j
+	r2 = np.einsum("ijk,ijk->ij", r_vec, r_vec)
+	epsilon = softening_fraction * (radius[:, None] + radius[None, :])
+	den = (r2 + epsilon * epsilon) ** 1.5
+	np.fill_diagonal(den, 0.0)
+	if r_cut > 0.0:
+		den[r2 >= r_cut * r_cut] = 0.0
+	coef = np.divide(K_COULOMB * charge[:, None] * charge[None, :], den, out=np.zeros_like(den), where=den != 0.0)
+	f = np.einsum("ij,ijk->ik", coef, r_vec)
+	if uniform_active_i:
+		f[:, 0] += charge * uniform_Ex
+		f[:, 1] += charge * uniform_Ey
+	active = (~fixed) & (mass > 0.0) & (charge != 0.0)
 	acc = np.zeros((N, 2), dtype=float)
-	for i in range(N):
-		pi = particles[i]
-		if pi.fixed or pi.mass_kg <= 0.0 or pi.charge_c == 0.0:
-			continue
-		f_i = np.zeros(2, dtype=float)
-		for j in range(N):
-			if i == j:
-				continue
-			pj = particles[j]
-			if pj.charge_c == 0.0:
-				continue
-			f_i += electric_force_pair(
-				pi.pos_m, pi.charge_c, pi.radius_m,
-				pj.pos_m, pj.charge_c, pj.radius_m,
-				world_size_m, softening_fraction,
-			)
-		# Uniform field force contribution: F = q E
-		if bool(_cfg.UNIFORM_FIELD_ACTIVE):
-			f_i[0] += float(pi.charge_c) * float(_cfg.UNIFORM_FIELD_VECTOR_NC[0])
-			f_i[1] += float(pi.charge_c) * float(_cfg.UNIFORM_FIELD_VECTOR_NC[1])
-		acc[i] = f_i / pi.mass_kg
+	acc[active] = f[active] / mass[active, None]
 	return acc
 
 
-def total_kinetic_energy(particles: List["Particle"]) -> float:
+def total_kinetic_energy(vel: np.ndarray, mass: np.ndarray, fixed: np.ndarray) -> float:
 	"""Compute total kinetic energy for mobile particles.
 
 	Parameters
 	----------
-	particles : list[Particle]
-		Particles.
+	vel : numpy.ndarray shape (N, 2)
+		Velocities (m/s).
+	mass : numpy.ndarray shape (N,)
+		Masses (kg).
+	fixed : numpy.ndarray shape (N,), bool
+		Fixed-particle mask.
 
 	Returns
 	-------
 	float
 		Total kinetic energy (J) excluding fixed particles.
 	"""
-	E = 0.0
-	for p in particles:
-		if p.fixed:
-			continue
-		E += 0.5 * p.mass_kg * float(np.dot(p.vel_mps, p.vel_mps))
-	return E
+	# One fused reduction over m_i * |v_i|^2, with fixed particles weighted 0
+	m_mobile = np.where(fixed, 0.0, mass)
+	return 0.5 * float(np.einsum("i,ij,ij->", m_mobile, vel, vel))
 
 
-def total_potential_energy(particles: List["Particle"], world_size_m: np.ndarray) -> float:
+def total_potential_energy(pos: np.ndarray, charge: np.ndarray, world_size_m: np.ndarray) -> float:
 	"""Compute pairwise Coulomb potential with minimum-image and singularity guard.
 
 	Note: No softening is applied to the potential; instead, a small-distance
@@ -435,8 +900,10 @@ def total_potential_energy(particles: List["Particle"], world_size_m: np.ndarray
 
 	Parameters
 	----------
-	particles : list[Particle]
-		Particles.
+	pos : numpy.ndarray shape (N, 2)
+		Positions (m).
+	charge : numpy.ndarray shape (N,)
+		Charges (C).
 	world_size_m : numpy.ndarray shape (2,)
 		World size (m).
 
@@ -445,24 +912,60 @@ def total_potential_energy(particles: List["Particle"], world_size_m: np.ndarray
 	float
 		Total potential energy (J).
 	"""
-	E = 0.0
-	N = len(particles)
-	for i in range(N):
-		pi = particles[i]
-		for j in range(i + 1, N):
-			pj = particles[j]
-			r_vec = minimum_image_displacement(pi.pos_m, pj.pos_m, world_size_m)
-			r = float(np.hypot(r_vec[0], r_vec[1]))
-
-			# Avoid singularity at extremely small r
-			r_eff = max(r, 1e-6)
-			if r_eff == 0.0:
-				continue
-			E += K_COULOMB * pi.charge_c * pj.charge_c / r_eff
-	return E
+	N = pos.shape[0]
+	if N < 2:
+		return 0.0
+	i_idx, j_idx = np.triu_indices(N, k=1)
+	r_vec = minimum_image_displacement_batch(pos[i_idx], pos[j_idx], world_size_m)
+	# Avoid singularity at extremely small r
+	r_eff = np.maximum(np.hypot(r_vec[:, 0], r_vec[:, 1]), 1e-6)
+	return float(np.sum(K_COULOMB * charge[i_idx] * charge[j_idx] / r_eff))
+
+
+def total_energies(
+	pos: np.ndarray,
+	vel: np.ndarray,
+	mass: np.ndarray,
+	charge: np.ndarray,
+	fixed: np.ndarray,
+	world_size_m: np.ndarray,
+) -> tuple[float, float]:
+	"""Compute kinetic and potential energy together in one pass over the particles.
 
+	Same definitions as `total_kinetic_energy` and `total_potential_energy`; with
+	Numba both sums are accumulated in a single loop nest.
 
-def electric_field_at_point(point_m: np.ndarray, particles: List["Particle"], world_size_m: np.ndarray, softening_fraction: float) -> np.ndarray:
+	Parameters
+	----------
+	pos, vel : numpy.ndarray shape (N, 2)
+		Positions (m) and velocities (m/s).
+	mass, charge : numpy.ndarray shape (N,)
+		Masses (kg) and charges (C).
+	fixed : numpy.ndarray shape (N,), bool
+		Fixed-particle mask.
+	world_size_m : numpy.ndarray shape (2,)
+		World size (m).
+
+	Returns
+	-------
+	tuple[float, float]
+		Kinetic and potential energy (J).
+	"""
+	if _NUMBA_AVAILABLE:
+		world_size = np.array([float(world_size_m[0]), float(world_size_m[1])], dtype=np.float64)
+		ke, pe = _total_energies_numba(pos, vel, mass, charge, fixed, world_size, float(K_COULOMB))
+		return float(ke), float(pe)
+	return total_kinetic_energy(vel, mass, fixed), total_potential_energy(pos, charge, world_size_m)
+
+
+def electric_field_at_point(
+	point_m: np.ndarray,
+	pos: np.ndarray,
+	charge: np.ndarray,
+	radius: np.ndarray,
+	world_size_m: np.ndarray,
+	softening_fraction: float,
+) -> np.ndarray:
 	"""Compute electric field vector at a world point from all particles.
 
 	Softened per-source radius using ``epsilon_j = softening_fraction * r_j``.
@@ -471,8 +974,10 @@ def electric_field_at_point(point_m: np.ndarray, particles: List["Particle"], wo
 	----------
 	point_m : numpy.ndarray shape (2,)
 		Observation point (m).
-	particles : list[Particle]
-		Particles.
+	pos : numpy.ndarray shape (N, 2)
+		Source positions (m).
+	charge, radius : numpy.ndarray shape (N,)
+		Source charges (C) and radii (m).
 	world_size_m : numpy.ndarray shape (2,)
 		World size (m).
 	softening_fraction : float
@@ -483,51 +988,51 @@ def electric_field_at_point(point_m: np.ndarray, particles: List["Particle"], wo
 	numpy.ndarray shape (2,)
 		Electric field (N/C) at the observation point.
 	"""
+	if pos.shape[0] == 0:
+		return np.zeros(2, dtype=float)
 	if _NUMBA_AVAILABLE:
-		N = len(particles)
-		if N == 0:
-			return np.zeros(2, dtype=float)
-		pos = np.empty((N, 2), dtype=np.float64)
-		charge = np.empty((N,), dtype=np.float64)
-		radius = np.empty((N,), dtype=np.float64)
-		for i, p in enumerate(particles):
-			pos[i, 0] = float(p.pos_m[0])
-			pos[i, 1] = float(p.pos_m[1])
-			charge[i] = float(p.charge_c)
-			radius[i] = float(p.radius_m)
-		world_size = np.array([float(world_size_m[0]), float(world_size_m[1])], dtype=np.float64)
-		point = np.array([float(point_m[0]), float(point_m[1])], dtype=np.float64)
-		return _electric_field_at_point_numba(point, pos, charge, radius, world_size, float(softening_fraction), float(K_COULOMB))
-	
-	# Fallback to python interpreter
-	E = np.zeros(2, dtype=float)
-	for p in particles:
-		if p.charge_c == 0.0:
-			continue
-		# Vector from source charge to observation point
-		r_vec = minimum_image_displacement(p.pos_m, point_m, world_size_m)
-		r2 = float(np.dot(r_vec, r_vec))
-		epsilon = softening_fraction * p.radius_m
-		
-		# (r^2 + ε^2)^(3/2) = r^3 with softening
-		den = (r2 + epsilon * epsilon) ** 1.5
-		if den == 0.0:
-			continue
-		E += K_COULOMB * p.charge_c * r_vec / den
-	return E
+		ex, ey = _electric_field_at_point_numba(
+			float(point_m[0]), float(point_m[1]), pos, charge, radius,
+			float(world_size_m[0]), float(world_size_m[1]), float(softening_fraction), float(K_COULOMB),
+		)
+		return np.array([ex, ey])
+	point = np.array([float(point_m[0]), float(point_m[1])], dtype=np.float64)
+
+	# Fallback, vector from each source charge to the observation point
+	r_vec = minimum_image_displacement_batch(pos, point[None, :], world_size_m)
+	r2 = np.einsum("ij,ij->i", r_vec, r_vec)
+	epsilon = softening_fraction * radius
+	# (r^2 + ε^2)^(3/2) = r^3 with softening
+	den = (r2 + epsilon * epsilon) ** 1.5
+	coef = np.divide(K_COULOMB * charge, den, out=np.zeros_like(den), where=den != 0.0)
+	return coef @ r_vec
 
 
-def rk4_integrate(particles: List["Particle"], world_size_m: np.ndarray, dt_s: float, softening_fraction: float) -> None:
-	"""Advance non-fixed particles using classical RK4.
+def rk4_integrate(
+	pos: np.ndarray,
+	vel: np.ndarray,
+	mass: np.ndarray,
+	charge: np.ndarray,
+	radius: np.ndarray,
+	fixed: np.ndarray,
+	world_size_m: np.ndarray,
+	dt_s: float,
+	softening_fraction: float,
+) -> None:
+	"""Advance non-fixed particles in place using classical RK4.
 
-	Accelerations derive from current positions at each stage; state is
-	temporarily updated during stage evaluations and restored before final write.
-	Only non-fixed particles are updated.
+	Accelerations derive from the stage positions at each stage. Only rows of
+	`pos`/`vel` for non-fixed particles are written, and new positions are
+	wrapped into the periodic domain as they are stored.
 
 	Parameters
 	----------
-	particles : list[Particle]
-		Particles to integrate.
+	pos, vel : numpy.ndarray shape (N, 2)
+		Positions (m) and velocities (m/s). Modified in place.
+	mass, charge, radius : numpy.ndarray shape (N,)
+		Masses (kg), charges (C) and radii (m).
+	fixed : numpy.ndarray shape (N,), bool
+		Fixed-particle mask.
 	world_size_m : numpy.ndarray shape (2,)
 		World size (m).
 	dt_s : float
@@ -535,44 +1040,34 @@ def rk4_integrate(particles: List["Particle"], world_size_m: np.ndarray, dt_s: f
 	softening_fraction : float
 		Softening fraction passed to acceleration computation.
 	"""
-	if len(particles) == 0:
+	if pos.shape[0] == 0:
 		return
 
-	# Pack positions and velocities
-	pos0 = np.stack([p.pos_m.copy() for p in particles], axis=0)  # (N,2)
-	vel0 = np.stack([p.vel_mps.copy() for p in particles], axis=0)  # (N,2)
-	fixed_mask = np.array([p.fixed for p in particles], dtype=bool)
-
-	def set_positions_and_velocities_meters(positions: np.ndarray, velocities: np.ndarray) -> None:
-		for idx, p in enumerate(particles):
-			p.pos_m = positions[idx]
-			p.vel_mps = velocities[idx]
-
-	def accelerations_for_positions(positions: np.ndarray, velocities: np.ndarray) -> np.ndarray:
-		# Set temporary state, compute accelerations, return
-		set_positions_and_velocities_meters(positions, velocities)
-		return compute_accelerations(particles, world_size_m, softening_fraction)
+	def accelerations_for_positions(positions: np.ndarray) -> np.ndarray:
+		return compute_accelerations(positions, charge, radius, mass, fixed, world_size_m, softening_fraction)
 
+	pos0 = pos.copy()
+	vel0 = vel.copy()
 	# k1
-	a1 = accelerations_for_positions(pos0, vel0)
+	a1 = accelerations_for_positions(pos0)
 	k1_v = a1
 	k1_x = vel0
 	# k2
 	pos_k2 = pos0 + 0.5 * dt_s * k1_x
 	vel_k2 = vel0 + 0.5 * dt_s * k1_v
-	a2 = accelerations_for_positions(pos_k2, vel_k2)
+	a2 = accelerations_for_positions(pos_k2)
 	k2_v = a2
 	k2_x = vel_k2
 	# k3
 	pos_k3 = pos0 + 0.5 * dt_s * k2_x
 	vel_k3 = vel0 + 0.5 * dt_s * k2_v
-	a3 = accelerations_for_positions(pos_k3, vel_k3)
+	a3 = accelerations_for_positions(pos_k3)
 	k3_v = a3
 	k3_x = vel_k3
 	# k4
 	pos_k4 = pos0 + dt_s * k3_x
 	vel_k4 = vel0 + dt_s * k3_v
-	a4 = accelerations_for_positions(pos_k4, vel_k4)
+	a4 = accelerations_for_positions(pos_k4)
 	k4_v = a4
 	k4_x = vel_k4
 
@@ -580,165 +1075,264 @@ def rk4_integrate(particles: List["Particle"], world_size_m: np.ndarray, dt_s: f
 	pos_new = pos0 + (dt_s / 6.0) * (k1_x + 2.0 * k2_x + 2.0 * k3_x + k4_x)
 	vel_new = vel0 + (dt_s / 6.0) * (k1_v + 2.0 * k2_v + 2.0 * k3_v + k4_v)
 
-	# Restore original state before writing back
-	set_positions_and_velocities_meters(pos0, vel0)
-
 	# Write back only for non-fixed particles
-	for idx, p in enumerate(particles):
-		if fixed_mask[idx]:
-			continue
-		p.pos_m = pos_new[idx]
-		p.vel_mps = vel_new[idx]
+	mobile = ~fixed
+	pos[mobile] = np.mod(pos_new[mobile], world_size_m)
+	vel[mobile] = vel_new[mobile]
+
+
+def advance_substep(
+	pos: np.ndarray,
+	vel: np.ndarray,
+	mass: np.ndarray,
+	charge: np.ndarray,
+	radius: np.ndarray,
+	fixed: np.ndarray,
+	world_size_m: np.ndarray,
+	dt_s: float,
+	softening_fraction: float,
+) -> bool:
+	"""Integrate one substep and resolve elastic collisions in a single Numba call.
 
+	Equivalent to `rk4_integrate` followed by the elastic phase of
+	`resolve_collisions`, with positions left wrapped. Merges remove particles,
+	so they stay in Python: when an opposite-charge pair overlaps after
+	integration (or when Numba is unavailable, or Barnes–Hut, the force cutoff or
+	the GPU path is active) only the integration is done here and the caller must run `resolve_collisions`.
 
-def resolve_collisions(particles: List["Particle"], world_size_m: np.ndarray) -> None:
+	Parameters
+	----------
+	pos, vel : numpy.ndarray shape (N, 2)
+		Positions (m) and velocities (m/s). Modified in place.
+	mass, charge, radius : numpy.ndarray shape (N,)
+		Masses (kg), charges (C) and radii (m).
+	fixed : numpy.ndarray shape (N,), bool
+		Fixed-particle mask.
+	world_size_m : numpy.ndarray shape (2,)
+		World size (m).
+	dt_s : float
+		Time step (s).
+	softening_fraction : float
+		Softening fraction used in force computation.
+
+	Returns
+	-------
+	bool
+		True if `resolve_collisions` still has to run for this substep.
+	"""
+	N = pos.shape[0]
+	use_bh = float(_cfg.BARNES_HUT_THETA) > 0.0 and _BH_AVAILABLE and N >= int(_cfg.BARNES_HUT_MIN_PARTICLES)
+	if not _NUMBA_AVAILABLE or use_bh or float(_cfg.FORCE_CUTOFF_M) > 0.0 or _use_gpu(N):
+		rk4_integrate(pos, vel, mass, charge, radius, fixed, world_size_m, dt_s, softening_fraction)
+		return True
+	uniform_active = bool(_cfg.UNIFORM_FIELD_ACTIVE)
+	return bool(_substep_numba(
+		pos, vel, mass, charge, radius, fixed,
+		np.array([float(world_size_m[0]), float(world_size_m[1])], dtype=np.float64),
+		float(dt_s), float(softening_fraction), float(K_COULOMB),
+		1 if uniform_active else 0,
+		float(_cfg.UNIFORM_FIELD_VECTOR_NC[0]) if uniform_active else 0.0,
+		float(_cfg.UNIFORM_FIELD_VECTOR_NC[1]) if uniform_active else 0.0,
+		_use_parallel(N),
+	))
+
+
+def _minimum_image_pair(pos: np.ndarray, i: int, j: int, Lx: float, Ly: float) -> tuple[float, float]:
+	"""Scalar minimum-image displacement from particle `i` to `j`, without temporary arrays."""
+	dx = float(pos[j, 0] - pos[i, 0])
+	dy = float(pos[j, 1] - pos[i, 1])
+	if dx > 0.5 * Lx:
+		dx -= Lx
+	elif dx < -0.5 * Lx:
+		dx += Lx
+	if dy > 0.5 * Ly:
+		dy -= Ly
+	elif dy < -0.5 * Ly:
+		dy += Ly
+	return dx, dy
+
+
+def overlapping_pairs(pos: np.ndarray, radius: np.ndarray, world_size_m: np.ndarray) -> np.ndarray:
+	"""Return the index pairs of overlapping particles, in the order of a `(i, j > i)` double loop.
+
+	A pair overlaps when its minimum-image distance is nonzero and below the sum
+	of the radii. With Numba the candidates come from a uniform grid with cells
+	of at least twice the largest radius, so only neighboring cells are checked;
+	otherwise all pairs are tested at once with NumPy.
+
+	Parameters
+	----------
+	pos : numpy.ndarray shape (N, 2)
+		Positions (m).
+	radius : numpy.ndarray shape (N,)
+		Contact radii (m).
+	world_size_m : numpy.ndarray shape (2,)
+		World size (m) as (Lx, Ly).
+
+	Returns
+	-------
+	numpy.ndarray shape (M, 2), int64
+		Overlapping pairs `(i, j)` with `i < j`, sorted by `i` then `j`.
+	"""
+	N = pos.shape[0]
+	if N <= 1:
+		return np.empty((0, 2), dtype=np.int64)
+	if _NUMBA_AVAILABLE:
+		pairs = _overlap_pairs_numba(pos, radius, float(world_size_m[0]), float(world_size_m[1]))
+		return pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+	i_idx, j_idx = np.triu_indices(N, 1)
+	d = minimum_image_displacement_batch(pos[i_idx], pos[j_idx], world_size_m)
+	dist = np.hypot(d[:, 0], d[:, 1])
+	hit = (dist < radius[i_idx] + radius[j_idx]) & (dist != 0.0)
+	return np.stack([i_idx[hit], j_idx[hit]], axis=1).astype(np.int64)
+
+
+def resolve_collisions(soa: "ParticleSoA", world_size_m: np.ndarray) -> None:
 	"""Resolve merges (opposite charges) and elastic collisions.
 
 	Two-phase handling:
 	1) Merge phase for overlapping opposite-charge pairs: conserve mass, charge,
-	   and momentum (if not fixed); area-equivalent radius; history merge; id reassign.
+	   and momentum (if not fixed); area-equivalent radius; history merge; merged
+	   particles are removed from the store in one batch (survivors from the end take the freed rows).
 	2) Elastic phase for remaining overlaps: positional correction along normal,
 	   then 1D normal impulse with restitution e=1. Fixed treated as infinite mass.
 
+	Each phase takes its candidates from `overlapping_pairs` and rechecks them in
+	pair order, so overlaps created by an earlier correction in the same phase
+	are left for the next substep.
+
 	Parameters
 	----------
-	particles : list[Particle]
-		Mutable particle list.
+	soa : ParticleSoA
+		Particle store, modified in place.
 	world_size_m : numpy.ndarray shape (2,)
 		World size (m) for displacement and wrapping.
 	"""
-	N = len(particles)
+	N = soa.n
 	if N <= 1:
 		return
-	removed: set[int] = set()
-	to_delete: list[int] = []
+	pos = soa.pos
+	vel = soa.vel
+	mass = soa.mass
+	charge = soa.charge
+	radius = soa.radius
+	fixed = soa.fixed
+	# Cleared when a particle is merged into another; the dead rows are dropped in one pass
+	alive = [True] * N
+	merged = False
+
+	Lx, Ly = float(world_size_m[0]), float(world_size_m[1])
 
 	# Handle sticky merges for opposite charges
-	for i in range(N):
-		if i in removed:
+	for i, j in overlapping_pairs(pos, radius, world_size_m).tolist():
+		if not (alive[i] and alive[j]):
+			continue
+		dx, dy = _minimum_image_pair(pos, i, j, Lx, Ly)
+		dist = math.hypot(dx, dy)
+		r_contact = radius[i] + radius[j]
+		if dist >= r_contact or dist == 0.0:
+			continue
+		# Opposite charges stick
+		if charge[i] * charge[j] < 0.0:
+			m1 = float(mass[i])
+			m2 = float(mass[j])
+			total_m = m1 + m2
+			q_new = charge[i] + charge[j]
+			r_new = math.sqrt(radius[i] * radius[i] + radius[j] * radius[j])
+			fixed_new = bool(fixed[i] or fixed[j])
+			if fixed_new:
+				# Stick to the fixed particle position, velocity zero
+				src = j if fixed[j] else i
+				pos[i, 0] = pos[src, 0]
+				pos[i, 1] = pos[src, 1]
+				vel[i, 0] = 0.0
+				vel[i, 1] = 0.0
+			else:
+				pos[i, 0] += dx * (m2 / total_m)
+				pos[i, 1] += dy * (m2 / total_m)
+				vel[i, 0] = (m1 * vel[i, 0] + m2 * vel[j, 0]) / total_m
+				vel[i, 1] = (m1 * vel[i, 1] + m2 * vel[j, 1]) / total_m
+
+			# Write into i, mark j for deletion
+			mass[i] = total_m
+			charge[i] = q_new
+			radius[i] = r_new
+			fixed[i] = fixed_new
+
+			if abs(q_new) <= NEUTRAL_CHARGE_EPS:
+				soa.colors[i] = COLOR_NEUTRAL
+			else:
+				soa.colors[i] = COLOR_POSITIVE if q_new > 0.0 else COLOR_NEGATIVE
+
+			# Merge histories
+			trails = soa.trails
+			if m2 > m1 or (m2 == m1 and trails.count[j] > trails.count[i]):
+				trails.copy_row(j, i)
+
+			last_t = float(trails.last_t[i]) if trails.count[i] else 0.0
+			trails.append(np.array([i]), last_t, pos[i:i + 1])
+			wrap_position_in_place(pos[i], world_size_m)
+			alive[j] = False
+			merged = True
+
+	# Delete merged particles in one batched swap-remove
+	if merged:
+		soa.keep(np.array(alive, dtype=bool))
+		pos = soa.pos
+		vel = soa.vel
+		mass = soa.mass
+		radius = soa.radius
+		fixed = soa.fixed
+
+	# Resolve elastic collisions for remaining pairs (restitution e = 1, fixed = infinite mass)
+	for i, j in overlapping_pairs(pos, radius, world_size_m).tolist():
+		dx, dy = _minimum_image_pair(pos, i, j, Lx, Ly)
+		dist = math.hypot(dx, dy)
+		r_contact = radius[i] + radius[j]
+		if dist >= r_contact or dist == 0.0:
 			continue
-		pi = particles[i]
-		for j in range(i + 1, N):
-			if j in removed:
-				continue
-			pj = particles[j]
-			r_vec = minimum_image_displacement(pi.pos_m, pj.pos_m, world_size_m)
-			dist = float(np.hypot(r_vec[0], r_vec[1]))
-			r_contact = pi.radius_m + pj.radius_m
-			if dist >= r_contact or dist == 0.0:
-				continue
-			# Opposite charges stick
-			if pi.charge_c * pj.charge_c < 0.0:
-				m1 = pi.mass_kg
-				m2 = pj.mass_kg
-				total_m = m1 + m2
-				q_new = pi.charge_c + pj.charge_c
-				r_new = float(np.sqrt(pi.radius_m * pi.radius_m + pj.radius_m * pj.radius_m))
-				fixed_new = pi.fixed or pj.fixed
-				if fixed_new:
-					# Stick to the fixed particle position, velocity zero
-					pos_new = pj.pos_m.copy() if pj.fixed else pi.pos_m.copy()
-					vel_new = np.zeros(2, dtype=float)
-				else:
-					pos_new = pi.pos_m + r_vec * (m2 / total_m)
-					vel_new = (m1 * pi.vel_mps + m2 * pj.vel_mps) / total_m
-				
-				# Write into i, mark j for deletion
-				pi.mass_kg = total_m
-				pi.charge_c = q_new
-				pi.radius_m = r_new
-				pi.fixed = fixed_new
-				pi.pos_m = pos_new
-				pi.vel_mps = vel_new
-
-				if abs(q_new) <= NEUTRAL_CHARGE_EPS:
-					pi.color_rgb = COLOR_NEUTRAL
-				else:
-					pi.color_rgb = COLOR_POSITIVE if q_new > 0.0 else COLOR_NEGATIVE
-				
-				# Merge histories
-				keep_history = pi.history
-				if m2 > m1 or (m2 == m1 and len(pj.history) > len(pi.history)):
-					keep_history = pj.history
-				pi.history = keep_history
-
-				last_t = pi.history[-1][0] if pi.history else 0.0
-				pi.history.append((last_t, (float(pi.pos_m[0]), float(pi.pos_m[1]))))
-				wrap_position_in_place(pi.pos_m, world_size_m)
-				removed.add(j)
-				to_delete.append(j)
-				continue
 
-	# Delete merged particles
-	if to_delete:
-		for idx in sorted(to_delete, reverse=True):
-			if 0 <= idx < len(particles):
-				del particles[idx]
-		# Reassign ids
-		for idx, p in enumerate(particles):
-			p.id = idx
-
-	# Resolve elastic collisions for remaining pairs
-	N2 = len(particles)
-	processed: set[Tuple[int, int]] = set()
-	for i in range(N2):
-		pi = particles[i]
-		for j in range(i + 1, N2):
-			if (i, j) in processed:
-				continue
-			pj = particles[j]
-			r_vec = minimum_image_displacement(pi.pos_m, pj.pos_m, world_size_m)
-			dist = float(np.hypot(r_vec[0], r_vec[1]))
-			r_contact = pi.radius_m + pj.radius_m
-			if dist >= r_contact or dist == 0.0:
-				continue
-			
-			# Normal unit vector from i to j
-			n = r_vec / dist
+		# Normal unit vector from i to j
+		nx = dx / dist
+		ny = dy / dist
+		fixed_i = bool(fixed[i])
+		fixed_j = bool(fixed[j])
+		if fixed_i and fixed_j:
+			continue
 
-			# Positional correction to separate overlap
-			penetration = r_contact - dist
-			if pi.fixed and pj.fixed:
-				pass
-			elif pi.fixed:
-				pj.pos_m += n * penetration
-			elif pj.fixed:
-				pi.pos_m -= n * penetration
-			else:
-				m1 = pi.mass_kg
-				m2 = pj.mass_kg
-				total = m1 + m2
-				if total > 0.0:
-					pi.pos_m -= n * (penetration * (m2 / total))
-					pj.pos_m += n * (penetration * (m1 / total))
+		# Positional correction to separate overlap
+		penetration = r_contact - dist
+		if fixed_i:
+			pos[j, 0] += nx * penetration
+			pos[j, 1] += ny * penetration
+		elif fixed_j:
+			pos[i, 0] -= nx * penetration
+			pos[i, 1] -= ny * penetration
+		else:
+			total = mass[i] + mass[j]
+			if total > 0.0:
+				pos[i, 0] -= nx * (penetration * (mass[j] / total))
+				pos[i, 1] -= ny * (penetration * (mass[j] / total))
+				pos[j, 0] += nx * (penetration * (mass[i] / total))
+				pos[j, 1] += ny * (penetration * (mass[i] / total))
+
+		v_rel_n = (vel[j, 0] - vel[i, 0]) * nx + (vel[j, 1] - vel[i, 1]) * ny
+		if v_rel_n > 0:
+			continue
 
-			v_rel = pj.vel_mps - pi.vel_mps
-			v_rel_n = float(np.dot(v_rel, n))
-			if v_rel_n > 0:
-				processed.add((i, j))
-				continue
+		inv_m1 = 0.0 if fixed_i else 1.0 / mass[i]
+		inv_m2 = 0.0 if fixed_j else 1.0 / mass[j]
+		j_impulse = -2.0 * v_rel_n / (inv_m1 + inv_m2)
+		vel[i, 0] -= j_impulse * nx * inv_m1
+		vel[i, 1] -= j_impulse * ny * inv_m1
+		vel[j, 0] += j_impulse * nx * inv_m2
+		vel[j, 1] += j_impulse * ny * inv_m2
+
+	# Positional corrections may push particles across an edge
+	wrap_positions_in_place(pos, world_size_m)
 
-			restitution = 1.0
-			if pi.fixed and pj.fixed:
-				processed.add((i, j))
-				continue
-			elif pi.fixed:
-				m1 = float("inf")
-				m2 = pj.mass_kg
-			elif pj.fixed:
-				m1 = pi.mass_kg
-				m2 = float("inf")
-			else:
-				m1 = pi.mass_kg
-				m2 = pj.mass_kg
-
-			inv_m1 = 0.0 if not np.isfinite(m1) else 1.0 / m1
-			inv_m2 = 0.0 if not np.isfinite(m2) else 1.0 / m2
-			j_impulse = -(1.0 + restitution) * v_rel_n / (inv_m1 + inv_m2)
-			impulse_vec = j_impulse * n
-			if np.isfinite(m1):
-				pi.vel_mps -= impulse_vec * inv_m1
-			if np.isfinite(m2):
-				pj.vel_mps += impulse_vec * inv_m2
-			processed.add((i, j))
 
+if _NUMBA_AVAILABLE and _cfg.NUMBA_BACKGROUND_WARMUP:
+	# Numba's compiler lock makes a concurrent first call wait for this thread rather than compile twice.
+	# Safe under every threading layer because the warm-up never launches a parallel region
+	threading.Thread(target=_warm_up_quietly, name="numba-warmup", daemon=True).start()
@@ -1,15 +1,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Tuple
+from typing import Callable, Dict, Optional, Tuple
 
 import pygame
 import numpy as np
 
 from electrosim import config
 from electrosim.simulation.engine import Simulation
-from electrosim.rendering.draw import screen_vector_to_world, draw_glow_at_screen_pos
-from electrosim.simulation.physics import electric_field_at_point, minimum_image_displacement
+from electrosim.rendering.draw import screen_vector_to_world, draw_glow_at_screen_pos, invalidate_trail_cache
+from electrosim.rendering.overlay import render_text_cached
+from electrosim.simulation.physics import electric_field_at_point, minimum_image_displacement_batch
 
 
 @dataclass
@@ -38,6 +39,10 @@ class InputState:
         Stored fixed state before drag (restored on release).
     drag_prev_velocity_mps : tuple[float,float] | None
         Stored velocity before drag (restored on release).
+    view_changed : bool
+        Set by `handle_events` whenever an event was processed; the web
+        front-end clears it after redrawing and skips redraws while paused
+        and unchanged.
     """
     placing: bool = False
     place_start_px: Tuple[int, int] = (0, 0)
@@ -50,6 +55,60 @@ class InputState:
     dragging_selected: bool = False
     drag_prev_fixed: bool = False
     drag_prev_velocity_mps: Tuple[float, float] | None = None
+    view_changed: bool = True
+
+
+def _quit(pg: pygame, sim: Simulation, input_state: InputState) -> None:
+    pg.quit()
+    raise SystemExit
+
+
+def _toggle(obj_name: str, attr: str) -> Callable[[pygame, Simulation, InputState], None]:
+    """Return a key handler flipping boolean `attr` on the simulation (`"sim"`) or the UI state (`"ui"`)."""
+    def handler(pg: pygame, sim: Simulation, input_state: InputState) -> None:
+        obj = sim if obj_name == "sim" else input_state
+        setattr(obj, attr, not getattr(obj, attr))
+    return handler
+
+
+def _toggle_field_mode(pg: pygame, sim: Simulation, input_state: InputState) -> None:
+    config.FIELD_VIS_MODE = "length" if config.FIELD_VIS_MODE == "brightness" else "brightness"
+
+
+def _toggle_glow(pg: pygame, sim: Simulation, input_state: InputState) -> None:
+    config.GLOW_ENABLED = not config.GLOW_ENABLED
+
+
+# KEYDOWN dispatch: one dict lookup per key press instead of a chain of comparisons
+_KEYDOWN_HANDLERS: Dict[int, Callable[[pygame, Simulation, InputState], None]] = {
+    pygame.K_p: _toggle("sim", "paused"),
+    pygame.K_r: lambda pg, sim, ui: sim.reset_to_default_scene(),
+    pygame.K_ESCAPE: _quit,
+    pygame.K_c: lambda pg, sim, ui: sim.clear(),
+    pygame.K_f: _toggle("sim", "show_forces"),
+    pygame.K_v: _toggle("sim", "show_velocities"),
+    pygame.K_e: _toggle("sim", "show_field"),
+    pygame.K_m: _toggle_field_mode,
+    pygame.K_t: _toggle("sim", "show_trails"),
+    pygame.K_g: _toggle("sim", "show_meter_grid"),
+    pygame.K_b: _toggle_glow,
+    pygame.K_1: lambda pg, sim, ui: sim.set_speed(0),
+    pygame.K_2: lambda pg, sim, ui: sim.set_speed(1),
+    pygame.K_3: lambda pg, sim, ui: sim.set_speed(2),
+    pygame.K_4: lambda pg, sim, ui: sim.set_speed(3),
+    pygame.K_DELETE: lambda pg, sim, ui: sim.remove_selected_particle(),
+    pygame.K_BACKSPACE: lambda pg, sim, ui: sim.remove_selected_particle(),
+    pygame.K_SPACE: lambda pg, sim, ui: sim.toggle_selected_fixed(),
+    pygame.K_q: lambda pg, sim, ui: sim.adjust_selected_charge(-config.CHARGE_STEP_C),
+    pygame.K_w: lambda pg, sim, ui: sim.adjust_selected_charge(+config.CHARGE_STEP_C),
+    pygame.K_a: lambda pg, sim, ui: sim.adjust_selected_mass(-config.MASS_STEP_KG),
+    pygame.K_s: lambda pg, sim, ui: sim.adjust_selected_mass(+config.MASS_STEP_KG),
+    pygame.K_z: lambda pg, sim, ui: sim.adjust_selected_radius(-config.RADIUS_STEP_M),
+    pygame.K_x: lambda pg, sim, ui: sim.adjust_selected_radius(+config.RADIUS_STEP_M),
+    pygame.K_i: _toggle("ui", "tooltip_enabled"),
+    pygame.K_o: _toggle("ui", "overlay_enabled"),
+    pygame.K_u: lambda pg, sim, ui: sim.start_uniform_field_validation(),
+}
 
 
 def handle_events(pg: pygame, sim: Simulation, input_state: InputState, pixels_per_meter: float) -> None:
@@ -130,59 +189,29 @@ def handle_events(pg: pygame, sim: Simulation, input_state: InputState, pixels_p
             fixed=input_state.placing_fixed,
         )
         input_state.placing = False
+    # Drag target from the latest MOUSEMOTION not yet applied; only the last one per batch matters
+    pending_drag: Tuple[int, int] | None = None
+
     for event in pygame.event.get():
+        # Any event may toggle a layer, move the cursor or edit a particle
+        input_state.view_changed = True
+
+        if pending_drag is not None and event.type != pygame.MOUSEMOTION:
+            # Apply before any other event so clicks and keys see the particle where the cursor is
+            _update_drag(*pending_drag)
+            pending_drag = None
+
         if event.type == pygame.QUIT:
             pg.quit()
             raise SystemExit
 
+        if event.type == pygame.VIDEORESIZE:
+            invalidate_trail_cache()
+
         if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_p:
-                sim.paused = not sim.paused
-            elif event.key == pygame.K_r:
-                sim.reset_to_default_scene()
-            elif event.key == pygame.K_ESCAPE:
-                pg.quit()
-                raise SystemExit
-            elif event.key == pygame.K_c:
-                sim.clear()
-            elif event.key == pygame.K_f:
-                sim.show_forces = not sim.show_forces
-            elif event.key == pygame.K_v:
-                sim.show_velocities = not sim.show_velocities
-            elif event.key == pygame.K_e:
-                sim.show_field = not sim.show_field
-            elif event.key == pygame.K_m:
-                config.FIELD_VIS_MODE = "length" if config.FIELD_VIS_MODE == "brightness" else "brightness"
-            elif event.key == pygame.K_t:
-                sim.show_trails = not sim.show_trails
-            elif event.key == pygame.K_g:
-                sim.show_meter_grid = not sim.show_meter_grid
-            elif event.key == pygame.K_b:
-                config.GLOW_ENABLED = not config.GLOW_ENABLED
-            elif event.key in (pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4):
-                sim.speed_index = {pygame.K_1: 0, pygame.K_2: 1, pygame.K_3: 2, pygame.K_4: 3}[event.key]
-            elif event.key in (pygame.K_DELETE, pygame.K_BACKSPACE):
-                sim.remove_selected_particle()
-            elif event.key == pygame.K_SPACE:
-                sim.toggle_selected_fixed()
-            elif event.key == pygame.K_q:
-                sim.adjust_selected_charge(-config.CHARGE_STEP_C)
-            elif event.key == pygame.K_w:
-                sim.adjust_selected_charge(+config.CHARGE_STEP_C)
-            elif event.key == pygame.K_a:
-                sim.adjust_selected_mass(-config.MASS_STEP_KG)
-            elif event.key == pygame.K_s:
-                sim.adjust_selected_mass(+config.MASS_STEP_KG)
-            elif event.key == pygame.K_z:
-                sim.adjust_selected_radius(-config.RADIUS_STEP_M)
-            elif event.key == pygame.K_x:
-                sim.adjust_selected_radius(+config.RADIUS_STEP_M)
-            elif event.key == pygame.K_i:
-                input_state.tooltip_enabled = not input_state.tooltip_enabled
-            elif event.key == pygame.K_o:
-                input_state.overlay_enabled = not input_state.overlay_enabled
-            elif event.key == pygame.K_u:
-                sim.start_uniform_field_validation()
+            handler = _KEYDOWN_HANDLERS.get(event.key)
+            if handler is not None:
+                handler(pg, sim, input_state)
 
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             mx, my = event.pos
@@ -197,8 +226,7 @@ def handle_events(pg: pygame, sim: Simulation, input_state: InputState, pixels_p
             if input_state.placing:
                 input_state.place_current_px = event.pos
             if input_state.dragging_selected:
-                mx, my = event.pos
-                _update_drag(mx, my)
+                pending_drag = event.pos
 
         if event.type == pygame.MOUSEBUTTONUP and event.button == 1:
             if input_state.dragging_selected:
@@ -206,6 +234,9 @@ def handle_events(pg: pygame, sim: Simulation, input_state: InputState, pixels_p
             elif input_state.placing:
                 _commit_placement()
 
+    if pending_drag is not None and input_state.dragging_selected:
+        _update_drag(*pending_drag)
+
 
 def render_placement_preview(screen: pygame.Surface, input_state: InputState, pixels_per_meter: float) -> None:
     """Render a live preview for particle placement with initial velocity.
@@ -233,13 +264,17 @@ def render_placement_preview(screen: pygame.Surface, input_state: InputState, pi
     pygame.draw.circle(screen, color, current, 2)
 
 
+# Tooltip background surface, shared by every box that fits in it
+_TOOLTIP_CACHE: dict = {}
+
+
 def render_hover_tooltip(
     screen: pygame.Surface,
     font: pygame.font.Font,
     sim: Simulation,
     input_state: InputState,
     pixels_per_meter: float,
-) -> None:
+) -> Optional[pygame.Rect]:
     """Render an informational tooltip with local E-field and nearest particle.
 
     Parameters
@@ -254,30 +289,36 @@ def render_hover_tooltip(
         Current UI state (mouse position and toggles).
     pixels_per_meter : float
         Pixels-per-meter scale.
+
+    Returns
+    -------
+    pygame.Rect or None
+        Bounding box of the box and crosshair, or None if nothing was drawn.
     """
     
     # Visibility conditions
     if not input_state.tooltip_enabled:
-        return
+        return None
     if input_state.placing:
-        return
+        return None
+    if not pygame.mouse.get_focused():
+        return None
 
     mx, my = input_state.mouse_pos_px
 
     # Compute world position and electric field at cursor
     pos_m = screen_vector_to_world((mx, my), pixels_per_meter)
-    E = electric_field_at_point(pos_m, sim.particles, sim.world_size_m, config.SOFTENING_FRACTION)
+    E = electric_field_at_point(pos_m, sim.soa.pos, sim.soa.charge, sim.soa.radius, sim.world_size_m, config.SOFTENING_FRACTION)
     Emag = float(np.hypot(E[0], E[1]))
 
-    # Find nearest particle
+    # Find nearest particle: minimum-image distances to every particle in one pass over the SoA positions
     nearest_idx = None
     nearest_dist_m = float("inf")
-    for idx, p in enumerate(sim.particles):
-        min_displacement = minimum_image_displacement(pos_m, p.pos_m, sim.world_size_m)
-        dist = float(np.hypot(min_displacement[0], min_displacement[1]))
-        if dist < nearest_dist_m:
-            nearest_dist_m = dist
-            nearest_idx = idx
+    if sim.soa.n > 0:
+        disp = minimum_image_displacement_batch(np.array([pos_m]), sim.soa.pos, sim.world_size_m)
+        dist = np.hypot(disp[:, 0], disp[:, 1])
+        nearest_idx = int(np.argmin(dist))
+        nearest_dist_m = float(dist[nearest_idx])
 
     lines: list[str] = []
     lines.append(f"pos_x: ({int(mx)}, {int(my)})")
@@ -307,11 +348,18 @@ def render_hover_tooltip(
     padding_y = 6
     line_spacing = 2
 
-    renders = [font.render(text, True, config.OVERLAY_TEXT_COLOR) for text in lines]
+    renders = [render_text_cached(font, text, config.OVERLAY_TEXT_COLOR) for text in lines]
     widths = [r.get_width() for r in renders]
     heights = [r.get_height() for r in renders]
     box_w = max(widths) + padding_x * 2
     box_h = sum(heights) + padding_y * 2 + line_spacing * (len(renders) - 1)
+    # One uniformly tinted surface, grown to powers of two; each frame blits just the box from it
+    bg = _TOOLTIP_CACHE.get("bg")
+    if bg is None or bg.get_width() < box_w or bg.get_height() < box_h:
+        size = (1 << max(0, box_w - 1).bit_length(), 1 << max(0, box_h - 1).bit_length())
+        bg = pygame.Surface(size, pygame.SRCALPHA)
+        bg.fill((0, 0, 0, 50))
+        _TOOLTIP_CACHE["bg"] = bg
 
     # Preferred anchor bottom-right of cursor
     x = mx + 25
@@ -327,9 +375,7 @@ def render_hover_tooltip(
     x = max(0, min(x, win_w - box_w))
     y = max(0, min(y, win_h - box_h))
 
-    bg = pygame.Surface((box_w, box_h), pygame.SRCALPHA)
-    bg.fill((0, 0, 0, 50))
-    screen.blit(bg, (x, y))
+    screen.blit(bg, (x, y), area=(0, 0, box_w, box_h))
 
     # 1px border using shadow color
     pygame.draw.rect(screen, config.OVERLAY_SHADOW_COLOR, (x, y, box_w, box_h), 1)
@@ -343,5 +389,6 @@ def render_hover_tooltip(
     # Crosshair at cursor
     ch_len = 10
     col = config.OVERLAY_TEXT_COLOR
-    pygame.draw.line(screen, col, (mx - ch_len, my), (mx + ch_len, my), 1)
-    pygame.draw.line(screen, col, (mx, my - ch_len), (mx, my + ch_len), 1)
+    h_rect = pygame.draw.line(screen, col, (mx - ch_len, my), (mx + ch_len, my), 1)
+    v_rect = pygame.draw.line(screen, col, (mx, my - ch_len), (mx, my + ch_len), 1)
+    return pygame.Rect(x, y, box_w, box_h).union(h_rect).union(v_rect)
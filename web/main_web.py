@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import math
+import os
 import time
 import asyncio
 
+# Point SDL's keyboard input at our canvas before the display is initialized
+os.environ.setdefault("SDL_HINT_EMSCRIPTEN_KEYBOARD_ELEMENT", "#canvas")
+
 # Simple clock used only when pygame is truly unavailable
 class _SimpleClock:
-    def tick(self, fps: int) -> None:
+    def tick(self, fps: int = 0) -> None:
         pass
     def get_fps(self) -> float:
         return 60.0
@@ -53,6 +58,14 @@ except ImportError:
     
     pygame = FakePygame()
 
+# Browser frame scheduling; only importable inside Pyodide
+try:
+    from js import window
+    from pyodide.ffi import create_proxy
+    RAF_AVAILABLE = hasattr(window, "requestAnimationFrame")
+except ImportError:
+    RAF_AVAILABLE = False
+
 # Import configuration first
 config = None
 try:
@@ -97,6 +110,8 @@ except ImportError as e:
             self.show_forces = False
             self.selected_index = -1
             self.speed_index = 1
+            self.validation_active = False
+            self.paused = False
             self.energy_kin = 0.0
             self.energy_pot = 0.0
             self.energy_tot = 0.0
@@ -117,12 +132,13 @@ if PYGAME_AVAILABLE:
         from electrosim.rendering.draw import (
             draw_field_grid,
             draw_meter_grid,
-            draw_force_vectors,
             draw_overlay,
             draw_particle_glows,
-            draw_particles,
+            draw_particle_layers,
             draw_trails,
-            draw_velocity_vectors,
+            precompute_glow_atlas,
+            project_positions,
+            warm_overlay_text,
         )
         from electrosim.ui.controls import InputState, handle_events, render_placement_preview, render_hover_tooltip
         from electrosim.rendering.trails import draw_polyline_world
@@ -142,18 +158,23 @@ if not RENDERING_AVAILABLE:
     def handle_events(*args): pass
     def draw_field_grid(*args): pass
     def draw_meter_grid(*args): pass
-    def draw_force_vectors(*args): pass
     def draw_overlay(*args): pass
     def draw_particle_glows(*args): pass
-    def draw_particles(*args): pass
+    def draw_particle_layers(*args): pass
     def draw_trails(*args): pass
-    def draw_velocity_vectors(*args): pass
+    def precompute_glow_atlas(*args): pass
+    def project_positions(*args): pass
+    def warm_overlay_text(*args): pass
     def render_placement_preview(*args): pass
     def render_hover_tooltip(*args): pass
     def draw_polyline_world(*args): pass
     print("Dummy rendering functions created")
 
 
+# Overlay labels for the entries of config.SPEED_MULTIPLIERS
+_SPEED_LABELS = ("0.5×", "1×", "2×", "4×")
+
+
 class WebSimulation:
     """Web-adapted version of the ElectroSim simulation."""
     
@@ -167,23 +188,28 @@ class WebSimulation:
         self.ppm = config.PIXELS_PER_METER
         self.last_frame_time = 0
         self.time = 0.0
+        # Set when frames are driven by requestAnimationFrame, which already paces to vsync
+        self._raf_mode = False
+        # Scene under the overlay while paused, so idle frames can refresh just the overlay
+        self._paused_scene = None
+        self._overlay_rect = None
+        self._tooltip_rect = None
+        # Last finite FPS reading shown in the overlay
+        self._fps_shown = 0.0
+        # Physics frames owed to wall-clock time, in units of 1 / FPS_TARGET
+        self._phys_acc = 0.0
+        self._last_t = None
+        # Frame errors since the last printed traceback, and when that was
+        self._err_count = 0
+        self._last_err_log = float("-inf")
         
     def initialize(self):
         """Initialize pygame and simulation components."""
         try:
             if PYGAME_AVAILABLE:
                 # Initialize only subsystems we need in the web (avoid audio)
-                if hasattr(pygame, 'display'):
-                    # Ensure SDL is targeting our canvas
-                    try:
-                        import os
-                        if not os.environ.get("SDL_HINT_EMSCRIPTEN_KEYBOARD_ELEMENT"):
-                            os.environ["SDL_HINT_EMSCRIPTEN_KEYBOARD_ELEMENT"] = "#canvas"
-                    except Exception:
-                        pass
-                    pygame.display.init()
-                if hasattr(pygame, 'font'):
-                    pygame.font.init()
+                pygame.display.init()
+                pygame.font.init()
                 # Initialize display - in web this will be handled by the browser
                 self.screen = pygame.display.set_mode((config.WINDOW_WIDTH_PX, config.WINDOW_HEIGHT_PX))
                 pygame.display.set_caption("ElectroSim - Web Version")
@@ -203,6 +229,10 @@ class WebSimulation:
             # Initialize simulation
             self.sim = Simulation()
             self.input_state = InputState()
+            self._init_overlay_state()
+            self._init_field_settings()
+            if RENDERING_AVAILABLE:
+                self._warm_render_caches()
             
             print("ElectroSim initialized successfully!")
             return True
@@ -213,148 +243,274 @@ class WebSimulation:
             traceback.print_exc()
             return False
     
+    def _init_overlay_state(self):
+        """Build the overlay payload dicts once; `handle_frame` updates them in place."""
+        self._substeps_table = tuple(
+            max(1, int(config.SUBSTEPS_BASE_PER_FRAME * m)) for m in config.SPEED_MULTIPLIERS
+        )
+        self._sim_state = {
+            "fps": 0.0,
+            "n": 0,
+            "speed_label": _SPEED_LABELS[0],
+            "dt_s": config.DT_S,
+            "substeps": self._substeps_table[0],
+            "E_kin": 0.0,
+            "E_pot": 0.0,
+            "E_tot": 0.0,
+        }
+        field = getattr(config, "UNIFORM_FIELD_VECTOR_NC", (0.0, 0.0))
+        self._val_payload = {
+            "active": True,
+            "E": (float(field[0]), float(field[1])),
+            "a": (0.0, 0.0),
+            "t": 0.0,
+            "pos_err": 0.0,
+            "vel_err": 0.0,
+            "dt_s": float(config.DT_S),
+            "duration_s": float(getattr(config, "VALIDATION_DURATION_S", 0.0)),
+            "reached_end": False,
+        }
+        self._profile_payload = {
+            "physics_ms": 0.0,
+            "field_ms": 0.0,
+            "draw_ms": 0.0,
+            "total_ms": 0.0,
+        }
+
+    def _warm_render_caches(self):
+        """Rasterize the static overlay text and default glow sprites before the first frame."""
+        warm_overlay_text(self.font)
+        # Default particles and the placement preview, so placing never stalls on a cache miss
+        default_radius_px = max(2, int(round(config.DEFAULT_RADIUS_M * self.ppm)))
+        precompute_glow_atlas(
+            (config.COLOR_POSITIVE, config.COLOR_NEGATIVE),
+            (default_radius_px, default_radius_px - 5),
+            (min(1.0, abs(config.DEFAULT_CHARGE_C) / config.MAX_CHARGE_C),),
+        )
+
+    def _init_field_settings(self):
+        """Cache the field-grid spacing and visual override read from `config` each frame.
+
+        The key handlers toggle `electrosim.config`, not the `config_web`
+        snapshot used here, so these stay fixed for the session.
+        """
+        step_px = config.FIELD_GRID_STEP_PX
+        if config.FIELD_VIS_MODE != "brightness":
+            step_px = int(config.FIELD_GRID_STEP_PX * 2.6)
+        self._field_grid_step_px = step_px
+        self._uniform_override = bool(getattr(config, "UNIFORM_FIELD_VISUAL_OVERRIDE", False))
+        self._softening = config.SOFTENING_FRACTION
+
     def handle_frame(self):
         """Process one frame of the simulation."""
         if not self.running:
             return
             
-        try:
-            frame_t0 = time.perf_counter()
+        # Bind hot attributes once; each lookup is costly under Pyodide's interpreter
+        pc = time.perf_counter
+        cfg = config
+        sim = self.sim
+        screen = self.screen
+        input_state = self.input_state
+        ppm = self.ppm
+        frame_t0 = pc()
+        
+        # Handle events and controls - skip if pygame not available
+        if PYGAME_AVAILABLE:
+            handle_events(pygame, sim, input_state, ppm)
+        
+        # Physics step: one step_frame per elapsed 1 / FPS_TARGET of wall time, whatever
+        # the display refresh rate, so the simulation rate no longer follows the render rate
+        paused = sim.paused
+        t_ph0 = pc()
+        if self._last_t is None:
+            self._last_t = t_ph0 - 1.0 / cfg.FPS_TARGET
+        if paused:
+            self._phys_acc = 0.0
+            steps = 0
+        else:
+            self._phys_acc += (t_ph0 - self._last_t) * cfg.FPS_TARGET
+            # Rounding absorbs rAF jitter around one frame per vsync at 60 Hz
+            steps = int(self._phys_acc + 0.5)
+            max_steps = getattr(cfg, "MAX_CATCHUP_FRAMES", 4)
+            if steps > max_steps:
+                # Too far behind (tab in background, long GC pause): drop the backlog
+                steps = max_steps
+                self._phys_acc = 0.0
+            else:
+                self._phys_acc -= steps
+        self._last_t = t_ph0
+        for _ in range(steps):
+            sim.step_frame()
+        # A paused simulation with no new input produces the same image as last frame
+        physics_ran = steps > 0
+        t_ph1 = pc()
+        # Resolve the particle views once for every layer below (after physics, which may drop particles)
+        particles = sim.particles
+        n_particles = len(particles)
+        world_size = sim.world_size_m
+        physics_ms = (t_ph1 - t_ph0) * 1000.0
+        
+        # Rendering - only if pygame and rendering stack are available
+        field_ms = 0.0
+        t_draw0 = pc()
+        
+        can_render = PYGAME_AVAILABLE and RENDERING_AVAILABLE and screen
+        validation_active = sim.validation_active
+        # The first paused frame is drawn in full once more to capture the scene under the overlay
+        needs_snapshot = paused and self._paused_scene is None
+        redraw = can_render and (physics_ran or needs_snapshot or getattr(input_state, "view_changed", True))
+        
+        if redraw:
+            screen.fill(cfg.COLOR_BG)
             
-            # Handle events and controls - skip if pygame not available
-            if PYGAME_AVAILABLE:
-                handle_events(pygame, self.sim, self.input_state, self.ppm)
+            # Draw meter grid if enabled
+            if sim.show_meter_grid:
+                draw_meter_grid(screen, world_size, ppm)
             
-            # Physics step
-            t_ph0 = time.perf_counter()
-            self.sim.step_frame()
-            t_ph1 = time.perf_counter()
-            physics_ms = (t_ph1 - t_ph0) * 1000.0
+            # Draw electric field if enabled
+            if sim.show_field or validation_active or self._uniform_override:
+                t_f0 = pc()
+                draw_field_grid(screen, particles, world_size, ppm, self._field_grid_step_px, self._softening, sim.soa)
+                t_f1 = pc()
+                field_ms += (t_f1 - t_f0) * 1000.0
             
-            # Rendering - only if pygame and rendering stack are available
-            field_ms = 0.0
-            t_draw0 = time.perf_counter()
+            # Project the SoA positions once; glows, bodies and vectors all read them
+            soa = sim.soa
+            screen_xy = project_positions(soa.pos, ppm)
             
-            if PYGAME_AVAILABLE and RENDERING_AVAILABLE and self.screen:
-                self.screen.fill(config.COLOR_BG)
-                
-                # Draw meter grid if enabled
-                if self.sim.show_meter_grid:
-                    draw_meter_grid(self.screen, self.sim.world_size_m, self.ppm)
-                
-                # Draw electric field if enabled
-                if self.sim.show_field or getattr(self.sim, "validation_active", False) or getattr(config, "UNIFORM_FIELD_VISUAL_OVERRIDE", False):
-                    FIELD_GRID_STEP_PX = config.FIELD_GRID_STEP_PX
-                    if config.FIELD_VIS_MODE != "brightness":
-                        FIELD_GRID_STEP_PX = int(config.FIELD_GRID_STEP_PX * 2.6) 
-                    t_f0 = time.perf_counter()
-                    draw_field_grid(self.screen, self.sim.particles, self.sim.world_size_m, self.ppm, FIELD_GRID_STEP_PX, config.SOFTENING_FRACTION)
-                    t_f1 = time.perf_counter()
-                    field_ms += (t_f1 - t_f0) * 1000.0
-                
-                # Draw particle glows
-                draw_particle_glows(self.screen, self.sim.particles, self.ppm)
-                
-                # Draw trails if enabled
-                if self.sim.show_trails:
-                    draw_trails(self.screen, self.sim.particles, self.ppm)
-                
-                # Draw theoretical trajectory if validation is active
-                if getattr(self.sim, "validation_active", False) and self.sim.validation_theory_traj:
-                    points = [xy for (_, xy) in self.sim.validation_theory_traj]
-                    draw_polyline_world(self.screen, points, config.COLOR_THEORY_TRAJECTORY, 2, self.ppm)
-                
-                # Draw particles
-                draw_particles(self.screen, self.sim.particles, self.ppm, self.sim.selected_index)
-                
-                # Draw velocity vectors if enabled
-                if self.sim.show_velocities:
-                    draw_velocity_vectors(self.screen, self.sim.particles, self.ppm)
-                
-                # Draw force vectors if enabled
-                if self.sim.show_forces:
-                    draw_force_vectors(self.screen, self.sim.particles, self.sim.last_forces, self.ppm)
-                
-                # Draw placement preview
-                render_placement_preview(self.screen, self.input_state, self.ppm)
-                
-            t_draw1 = time.perf_counter()
-            draw_ms_total = (t_draw1 - t_draw0) * 1000.0
-            draw_ms = max(0.0, draw_ms_total - field_ms)
+            # Draw particle glows
+            draw_particle_glows(screen, (), ppm, screen_xy, soa)
             
-            # Draw overlay with stats
-            fps = self.clock.get_fps() or float(config.FPS_TARGET)
-            speed_label = {0: "0.5×", 1: "1×", 2: "2×", 3: "4×"}[self.sim.speed_index]
-            sim_state = {
-                "fps": fps,
-                "n": len(self.sim.particles),
-                "speed_label": speed_label,
-                "dt_s": config.DT_S,
-                "substeps": max(1, int(config.SUBSTEPS_BASE_PER_FRAME * config.SPEED_MULTIPLIERS[self.sim.speed_index])),
-                "E_kin": self.sim.energy_kin,
-                "E_pot": self.sim.energy_pot,
-                "E_tot": self.sim.energy_tot,
-            }
+            # Draw trails if enabled
+            if sim.show_trails:
+                draw_trails(screen, particles, ppm)
             
-            # Validation overlay if active
-            if getattr(self.sim, "validation_active", False):
-                E = (float(config.UNIFORM_FIELD_VECTOR_NC[0]), float(config.UNIFORM_FIELD_VECTOR_NC[1]))
-                if getattr(self.sim, "validation_accel_mps2", None) is not None:
-                    a = (float(self.sim.validation_accel_mps2[0]), float(self.sim.validation_accel_mps2[1]))
-                else:
-                    a = (0.0, 0.0)
-                cur = getattr(self.sim, "validation_current_errors", {}) or {}
-                val_payload = {
-                    "active": True,
-                    "E": E,
-                    "a": a,
-                    "t": float(cur.get("t", 0.0)),
-                    "pos_err": float(cur.get("pos_err", 0.0)),
-                    "vel_err": float(cur.get("vel_err", 0.0)),
-                    "dt_s": float(config.DT_S),
-                    "duration_s": float(getattr(config, "VALIDATION_DURATION_S", 0.0)),
-                }
-                val_payload["reached_end"] = bool(getattr(self.sim, "validation_reached_end", False))
-                pos_th = getattr(self.sim, "validation_final_theory_pos_m", None)
-                vel_th = getattr(self.sim, "validation_final_theory_vel_mps", None)
-                pos_sim = getattr(self.sim, "validation_final_sim_pos_m", None)
-                vel_sim = getattr(self.sim, "validation_final_sim_vel_mps", None)
-                if pos_th is not None and vel_th is not None:
-                    val_payload["pos_th"] = (float(pos_th[0]), float(pos_th[1]))
-                    val_payload["vel_th"] = (float(vel_th[0]), float(vel_th[1]))
-                if pos_sim is not None and vel_sim is not None:
-                    val_payload["pos_sim"] = (float(pos_sim[0]), float(pos_sim[1]))
-                    val_payload["vel_sim"] = (float(vel_sim[0]), float(vel_sim[1]))
-                sim_state["validation"] = val_payload
+            # Draw theoretical trajectory if validation is active
+            if validation_active and len(sim.validation_theory_pos_m) >= 2:
+                points = sim.validation_theory_pos_m
+                draw_polyline_world(screen, points, cfg.COLOR_THEORY_TRAJECTORY, 2, ppm)
             
-            # Performance overlay if enabled
-            if getattr(config, "PROFILE_OVERLAY_ENABLED", False):
-                tot_ms = (time.perf_counter() - frame_t0) * 1000.0
-                sim_state["profile"] = {
-                    "physics_ms": float(physics_ms),
-                    "field_ms": float(field_ms),
-                    "draw_ms": float(draw_ms),
-                    "total_ms": float(tot_ms),
-                }
+            # Draw particles, then velocity and force vectors if enabled
+            draw_particle_layers(screen, soa, sim.last_forces, ppm, sim.selected_index, sim.show_velocities, sim.show_forces, screen_xy)
             
-            if PYGAME_AVAILABLE and RENDERING_AVAILABLE and self.screen:
-                draw_overlay(self.screen, self.font, sim_state, self.input_state.overlay_enabled)
-                render_hover_tooltip(self.screen, self.font, self.sim, self.input_state, self.ppm)
+            # Draw placement preview
+            render_placement_preview(screen, input_state, ppm)
+            
+        t_draw1 = pc()
+        draw_ms_total = (t_draw1 - t_draw0) * 1000.0
+        draw_ms = max(0.0, draw_ms_total - field_ms)
+        
+        # Draw overlay with stats
+        fps = self.clock.get_fps() or float(cfg.FPS_TARGET)
+        speed_index = sim.speed_index
+        sim_state = self._sim_state
+        # Whole frames per second keep the FPS line within a few dozen cached text renders.
+        # get_fps() is inf when two ticks land in the same millisecond; keep the last reading then
+        if math.isfinite(fps):
+            self._fps_shown = float(round(fps))
+        sim_state["fps"] = self._fps_shown
+        sim_state["n"] = n_particles
+        sim_state["speed_label"] = _SPEED_LABELS[speed_index]
+        sim_state["substeps"] = self._substeps_table[speed_index]
+        sim_state["E_kin"] = sim.energy_kin
+        sim_state["E_pot"] = sim.energy_pot
+        sim_state["E_tot"] = sim.energy_tot
+        
+        # Validation overlay if active
+        if validation_active:
+            val_payload = self._val_payload
+            # Only the real Simulation enters validation, and it defines every validation_* attribute
+            if sim.validation_accel_mps2 is not None:
+                a = (float(sim.validation_accel_mps2[0]), float(sim.validation_accel_mps2[1]))
+            else:
+                a = (0.0, 0.0)
+            cur = sim.validation_current_errors or {}
+            val_payload["a"] = a
+            val_payload["t"] = float(cur.get("t", 0.0))
+            val_payload["pos_err"] = float(cur.get("pos_err", 0.0))
+            val_payload["vel_err"] = float(cur.get("vel_err", 0.0))
+            val_payload["reached_end"] = bool(sim.validation_reached_end)
+            pos_th = sim.validation_final_theory_pos_m
+            vel_th = sim.validation_final_theory_vel_mps
+            pos_sim = sim.validation_final_sim_pos_m
+            vel_sim = sim.validation_final_sim_vel_mps
+            if pos_th is not None and vel_th is not None:
+                val_payload["pos_th"] = (float(pos_th[0]), float(pos_th[1]))
+                val_payload["vel_th"] = (float(vel_th[0]), float(vel_th[1]))
+            else:
+                val_payload.pop("pos_th", None)
+                val_payload.pop("vel_th", None)
+            if pos_sim is not None and vel_sim is not None:
+                val_payload["pos_sim"] = (float(pos_sim[0]), float(pos_sim[1]))
+                val_payload["vel_sim"] = (float(vel_sim[0]), float(vel_sim[1]))
+            else:
+                val_payload.pop("pos_sim", None)
+                val_payload.pop("vel_sim", None)
+            sim_state["validation"] = val_payload
+        elif "validation" in sim_state:
+            del sim_state["validation"]
+        
+        # Performance overlay if enabled
+        if getattr(cfg, "PROFILE_OVERLAY_ENABLED", False):
+            tot_ms = (pc() - frame_t0) * 1000.0
+            prof = self._profile_payload
+            prof["physics_ms"] = float(physics_ms)
+            prof["field_ms"] = float(field_ms)
+            prof["draw_ms"] = float(draw_ms)
+            prof["total_ms"] = float(tot_ms)
+            sim_state["profile"] = prof
+        
+        if can_render:
+            if redraw:
+                # Keep the paused scene without text; it stays valid until the next full redraw
+                self._paused_scene = screen.copy() if paused else None
+                self._overlay_rect = draw_overlay(screen, self.font, sim_state, input_state.overlay_enabled)
+                self._tooltip_rect = render_hover_tooltip(screen, self.font, sim, input_state, ppm)
                 
                 # Update display
                 pygame.display.flip()
-            else:
-                # In fallback mode, just print simulation state occasionally
-                if int(self.time * 10) % 60 == 0:  # Every 6 seconds
-                    print(f"Simulation running: {len(self.sim.particles)} particles, t={self.time:.1f}s")
-            
-            self.clock.tick(config.FPS_TARGET)
-            self.time = time.perf_counter() - frame_t0
-            
-        except Exception as e:
-            print(f"Error in frame handling: {e}")
-            import traceback
-            traceback.print_exc()
+                input_state.view_changed = False
+            elif input_state.overlay_enabled and self._paused_scene is not None and self._overlay_rect is not None:
+                # Paused and idle: only the FPS/profile text changes, so redraw and push just that area
+                # The tooltip is translucent: restore its area too, or it would darken every frame
+                dirty = self._overlay_rect
+                if self._tooltip_rect is not None:
+                    dirty = dirty.union(self._tooltip_rect)
+                screen.blit(self._paused_scene, dirty, dirty)
+                self._overlay_rect = draw_overlay(screen, self.font, sim_state, True)
+                self._tooltip_rect = render_hover_tooltip(screen, self.font, sim, input_state, ppm)
+                dirty = dirty.union(self._overlay_rect)
+                if self._tooltip_rect is not None:
+                    dirty = dirty.union(self._tooltip_rect)
+                pygame.display.update(dirty)
+        else:
+            # In fallback mode, just print simulation state occasionally
+            if int(self.time * 10) % 60 == 0:  # Every 6 seconds
+                print(f"Simulation running: {n_particles} particles, t={self.time:.1f}s")
+        
+        if self._raf_mode:
+            # Still measure frame times for the FPS readout, but never sleep
+            self.clock.tick()
+        else:
+            self.clock.tick(cfg.FPS_TARGET)
+        self.time = pc() - frame_t0
+    
+    def report_frame_error(self):
+        """Print the exception being handled, at most once every few seconds.
+
+        A frame that fails once usually fails on every frame, and printing a
+        traceback 60 times a second floods the browser console.
+        """
+        self._err_count += 1
+        now = time.perf_counter()
+        if now - self._last_err_log < 5.0:
+            return
+        import traceback
+        print(f"Error in frame handling ({self._err_count} since last report):")
+        traceback.print_exc()
+        self._err_count = 0
+        self._last_err_log = now
     
     def start(self):
         """Start the simulation."""
@@ -406,7 +562,10 @@ def run_simulation_loop():
         # Simple loop without using set_timer (not implemented on WASM)
         running = True
         while running and web_sim and web_sim.running:
-            web_sim.handle_frame()
+            try:
+                web_sim.handle_frame()
+            except Exception:
+                web_sim.report_frame_error()
             # Let the browser breathe a bit
             # time.sleep(1.0 / max(1, int(config.FPS_TARGET)))
     else:
@@ -418,21 +577,17 @@ def run_simulation_loop():
         while web_sim and web_sim.running:
             try:
                 web_sim.handle_frame()
-                frame_count += 1
-                
-                # Print status every few seconds
-                if frame_count % 180 == 0:  
-                    elapsed = time.perf_counter() - start_time
-                    print(f"Simulation running: {frame_count} frames, {elapsed:.1f}s elapsed")
-                
             except KeyboardInterrupt:
                 print("Simulation interrupted")
                 break
-            except Exception as e:
-                print(f"Error in simulation loop: {e}")
-                import traceback
-                traceback.print_exc()
-                break
+            except Exception:
+                web_sim.report_frame_error()
+            frame_count += 1
+            
+            # Print status every few seconds
+            if frame_count % 180 == 0:  
+                elapsed = time.perf_counter() - start_time
+                print(f"Simulation running: {frame_count} frames, {elapsed:.1f}s elapsed")
         
         print("Simulation loop ended")
 
@@ -456,12 +611,44 @@ async def run_simulation_loop_async() -> None:
     if not web_sim:
         print("No simulation instance available")
         return
+    if RAF_AVAILABLE:
+        await _run_simulation_loop_raf()
+        return
     print("Starting simulation loop (async)...")
     while web_sim and web_sim.running:
-        web_sim.handle_frame()
+        try:
+            web_sim.handle_frame()
+        except Exception:
+            web_sim.report_frame_error()
         # Yield to browser event loop
         await asyncio.sleep(0)
 
+
+async def _run_simulation_loop_raf() -> None:
+    """Drive one frame per `requestAnimationFrame` callback until the simulation stops."""
+    print("Starting simulation loop (requestAnimationFrame)...")
+    sim = web_sim
+    sim._raf_mode = True
+    done = asyncio.get_event_loop().create_future()
+
+    def _tick(timestamp):
+        if sim.running:
+            try:
+                sim.handle_frame()
+            except Exception:
+                sim.report_frame_error()
+        if sim.running:
+            window.requestAnimationFrame(proxy)
+        else:
+            proxy.destroy()
+            sim._raf_mode = False
+            if not done.done():
+                done.set_result(None)
+
+    proxy = create_proxy(_tick)
+    window.requestAnimationFrame(proxy)
+    await done
+
 def stop_web_simulation():
     """Stop the web simulation."""
     global web_sim
@@ -4,12 +4,16 @@ Simple HTTP server for serving the ElectroSim web application.
 This serves the static files needed for the web version.
 """
 
+import gzip
 import http.server
-import socketserver
+import io
 import os
 import sys
 from pathlib import Path
 
+# Text assets worth compressing; images and icons are already compressed
+GZIP_EXTENSIONS = ('.py', '.js', '.html', '.css', '.json', '.txt', '.xml', '.webmanifest', '.wasm')
+
 def main():
     """Start the web server."""
     # Change to web directory
@@ -18,12 +22,56 @@ def main():
     
     PORT = 8000
     
+    # Compressed body and the mtime it was built from, per path; an edit replaces the entry
+    gzip_cache = {}
+    
     class CustomHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
+        # Keep connections open so the many small module fetches reuse one socket
+        protocol_version = 'HTTP/1.1'
+        extensions_map = {
+            **http.server.SimpleHTTPRequestHandler.extensions_map,
+            '.wasm': 'application/wasm',
+        }
+        
+        def send_head(self):
+            """Serve gzip-encoded text assets to clients that accept it."""
+            path = self.translate_path(self.path)
+            accepts_gzip = 'gzip' in self.headers.get('Accept-Encoding', '')
+            if not accepts_gzip or not path.endswith(GZIP_EXTENSIONS) or not os.path.isfile(path):
+                return super().send_head()
+            mtime = os.stat(path).st_mtime
+            if self.headers.get('If-Modified-Since') == self.date_time_string(int(mtime)):
+                self.send_response(304)
+                self.end_headers()
+                return None
+            cached = gzip_cache.get(path)
+            if cached is not None and cached[0] == mtime:
+                body = cached[1]
+            else:
+                with open(path, 'rb') as f:
+                    body = gzip.compress(f.read())
+                gzip_cache[path] = (mtime, body)
+            self.send_response(200)
+            if not path.endswith('.py'):
+                self.send_header('Content-Type', self.guess_type(path))
+            self.send_header('Content-Encoding', 'gzip')
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('Last-Modified', self.date_time_string(int(mtime)))
+            self.end_headers()
+            return io.BytesIO(body)
+        
         def end_headers(self):
             # Add CORS headers for cross-origin requests
             self.send_header('Access-Control-Allow-Origin', '*')
             self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
             self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+            # Cross-origin isolation, as in vercel.json, so SharedArrayBuffer behaves as in production
+            self.send_header('Cross-Origin-Opener-Policy', 'same-origin')
+            self.send_header('Cross-Origin-Embedder-Policy', 'require-corp')
+            self.send_header('Cross-Origin-Resource-Policy', 'cross-origin')
+            # Files change while developing: let the browser cache them but revalidate (cheap 304s)
+            self.send_header('Cache-Control', 'no-cache')
+            self.send_header('Vary', 'Accept-Encoding')
             
             # Add proper MIME types for Python files
             if self.path.endswith('.py'):
@@ -31,7 +79,8 @@ def main():
             
             super().end_headers()
     
-    with socketserver.TCPServer(("", PORT), CustomHTTPRequestHandler) as httpd:
+    # One thread per connection, so parallel asset fetches are not serialized
+    with http.server.ThreadingHTTPServer(("", PORT), CustomHTTPRequestHandler) as httpd:
         print(f"ElectroSim Web Server")
         print(f"Serving at http://localhost:{PORT}")
         print(f"Directory: {web_dir}")